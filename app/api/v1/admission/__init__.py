@@ -0,0 +1,43 @@
+from .. import config, metrics
+from .limiter import (
+    QUEUE_FULL,
+    QUEUE_TIMEOUT,
+    AdmissionRejected,
+    ConcurrencyLimiter,
+)
+from .middleware import READ_METHODS, AdmissionMiddleware
+
+read_limiter = ConcurrencyLimiter(
+    "read",
+    limit=config.settings.admission_read_limit,
+    queue_size=config.settings.admission_read_queue_size,
+    queue_timeout_ms=config.settings.admission_queue_timeout_ms,
+)
+write_limiter = ConcurrencyLimiter(
+    "write",
+    limit=config.settings.admission_write_limit,
+    queue_size=config.settings.admission_write_queue_size,
+    queue_timeout_ms=config.settings.admission_queue_timeout_ms,
+)
+LIMITERS = {"read": read_limiter, "write": write_limiter}
+
+
+def _collect_limiter_metrics() -> None:
+    for name, limiter in LIMITERS.items():
+        metrics.http_requests_queued.set(limiter.queued, name)
+
+
+if config.settings.metrics_enabled:
+    metrics.registry.add_collector(_collect_limiter_metrics)
+
+__all__ = [
+    "QUEUE_FULL",
+    "QUEUE_TIMEOUT",
+    "READ_METHODS",
+    "AdmissionRejected",
+    "ConcurrencyLimiter",
+    "AdmissionMiddleware",
+    "read_limiter",
+    "write_limiter",
+    "LIMITERS",
+]
@@ -0,0 +1,111 @@
+import asyncio
+from time import perf_counter
+from collections import deque
+from typing import Deque
+
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a request is shed instead of admitted.
+
+    Attributes:
+        reason (str): QUEUE_FULL or QUEUE_TIMEOUT.
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ConcurrencyLimiter:
+    """
+    Admits at most `limit` requests at a time and queues up to `queue_size`
+    more, in arrival order.
+
+    A request that finds the queue full is rejected at once, and one that
+    waited longer than `queue_timeout_ms` gives up, so under overload
+    callers get a fast answer instead of piling up until their own
+    timeouts. A released slot is handed to the oldest waiter directly, so
+    newcomers cannot overtake the queue.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout_ms: float):
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_size = max(0, queue_size)
+        self.queue_timeout_seconds = queue_timeout_ms / 1000
+        self.active = 0
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_queue_timeout = 0
+        self.queue_wait_seconds = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """
+        Waits for a slot.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait timed out.
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.queue_size:
+            self.shed_queue_full += 1
+            raise AdmissionRejected(QUEUE_FULL)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout_seconds)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait ended; pass it on.
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                self.shed_queue_timeout += 1
+                raise AdmissionRejected(QUEUE_TIMEOUT) from None
+            raise
+        finally:
+            self.queue_wait_seconds += perf_counter() - start
+        self.admitted += 1
+
+    def release(self) -> None:
+        """
+        Frees a slot, handing it to the oldest waiter if there is one.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> dict:
+        """
+        Reports the counters of the limiter.
+
+        Returns:
+            dict: The limits, current occupancy and shed counts.
+        """
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "active": self.active,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "shed_queue_full": self.shed_queue_full,
+            "shed_queue_timeout": self.shed_queue_timeout,
+            "queue_wait_seconds": self.queue_wait_seconds,
+        }
@@ -0,0 +1,56 @@
+from typing import Iterable
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from .. import metrics
+from .limiter import AdmissionRejected, ConcurrencyLimiter
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class AdmissionMiddleware:
+    """
+    Limits how many read and how many write requests run at once.
+
+    GET, HEAD and OPTIONS requests go through the read limiter, every other
+    method through the write limiter, so a burst of writes waiting for the
+    SQLite lock cannot starve cheap reads, and the reverse. Requests the
+    limiters shed get a 503 with Retry-After right away. Paths starting
+    with one of `exempt_paths` are always admitted: the metrics and stats
+    endpoints, so the service can be observed while overloaded, and
+    long-lived streams, which would hold a slot for as long as they last.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        read: ConcurrencyLimiter,
+        write: ConcurrencyLimiter,
+        retry_after_seconds: int = 1,
+        exempt_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.read = read
+        self.write = write
+        self.retry_after_seconds = retry_after_seconds
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        limiter = self.read if scope["method"] in READ_METHODS else self.write
+        try:
+            await limiter.acquire()
+        except AdmissionRejected as e:
+            metrics.http_requests_shed_total.inc(limiter.name, e.reason)
+            response = JSONResponse(
+                content={"detail": "The service is overloaded, retry later."},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -12,3 +12,27 @@ api_v1_router.include_router(
 api_v1_router.include_router(
     router=routers.personal_router, prefix="/personal", tags=["Personal"]
 )
+api_v1_router.include_router(
+    router=routers.personal_skill_router,
+    prefix="/personal/{personal_id}/skills",
+    tags=["Personal"],
+)
+api_v1_router.include_router(
+    router=routers.personal_language_router,
+    prefix="/personal/{personal_id}/languages",
+    tags=["Personal"],
+)
+api_v1_router.include_router(
+    router=routers.personal_resume_router,
+    prefix="/personal/{personal_id}/resume",
+    tags=["Personal"],
+)
+api_v1_router.include_router(
+    router=routers.resume_router, prefix="/resume", tags=["Resume"]
+)
+api_v1_router.include_router(
+    router=routers.stats_router, prefix="/stats", tags=["Stats"]
+)
+api_v1_router.include_router(
+    router=routers.change_router, prefix="/changes", tags=["Changes"]
+)
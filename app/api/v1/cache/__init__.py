@@ -0,0 +1,29 @@
+from .. import config
+from .response_cache import CachedBody, CachedPage, ResponseCache
+
+RESUME_CACHE_ENTRIES = 4
+
+skill_cache = ResponseCache(
+    max_entries=config.settings.cache_max_entries,
+    ttl_seconds=config.settings.cache_ttl_seconds,
+)
+language_cache = ResponseCache(
+    max_entries=config.settings.cache_max_entries,
+    ttl_seconds=config.settings.cache_ttl_seconds,
+)
+
+# Resumes are keyed by the versions of their tables, so a write never has to
+# invalidate them: the next request misses and older versions age out.
+resume_cache = ResponseCache(
+    max_entries=RESUME_CACHE_ENTRIES,
+    ttl_seconds=config.settings.cache_ttl_seconds,
+)
+
+__all__ = [
+    "CachedBody",
+    "CachedPage",
+    "ResponseCache",
+    "skill_cache",
+    "language_cache",
+    "resume_cache",
+]
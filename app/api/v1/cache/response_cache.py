@@ -0,0 +1,154 @@
+import time
+from .. import compression
+from typing import Dict, Hashable, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CachedBody:
+    """
+    A serialized response body, with its compressed variants.
+
+    A variant is compressed the first time a client asks for it and kept
+    with the body, so each encoding costs one compression per cached body.
+    """
+
+    body: bytes
+    expires_at: float = field(default=0.0)
+    variants: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """
+        Returns the body in the given content encoding.
+
+        Args:
+            encoding (Optional[str]): "br" or "gzip", or None for the body as is.
+
+        Returns:
+            bytes: The body, compressed if `encoding` is given.
+        """
+        if encoding is None:
+            return self.body
+        variant = self.variants.get(encoding)
+        if variant is None:
+            variant = self.variants[encoding] = compression.compress(
+                self.body, encoding, cached=True
+            )
+        return variant
+
+
+@dataclass(kw_only=True)
+class CachedPage(CachedBody):
+    """
+    A serialized list page together with the profile it belongs to, the ID
+    range it covers and the number of rows in its scope when it was read.
+    """
+
+    first_id: int
+    last_id: int
+    scope: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+    @property
+    def is_last(self) -> bool:
+        """
+        Whether the page reached the end of the table when it was built.
+        """
+        return self.next_cursor is None
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of serialized list pages, or other bodies, with a
+    time to live.
+
+    Pages remember their profile and the range of IDs they contain, so
+    writes only drop the pages they can actually change. Every invalidation bumps `generation`;
+    a page built from a read that started before the bump is discarded in
+    `set` instead of resurrecting stale data.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._pages: "OrderedDict[Hashable, CachedBody]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CachedBody]:
+        """
+        Returns the cached page for `key`, if present and not expired.
+        """
+        page = self._pages.get(key)
+        if page is None or page.expires_at <= time.monotonic():
+            if page is not None:
+                del self._pages[key]
+            self.misses += 1
+            return None
+        self._pages.move_to_end(key)
+        self.hits += 1
+        return page
+
+    def set(self, key: Hashable, page: CachedBody, generation: int) -> None:
+        """
+        Stores `page` unless a write invalidated the cache since `generation`.
+        """
+        if generation != self.generation or self.max_entries <= 0:
+            return
+        page.expires_at = time.monotonic() + self.ttl_seconds
+        self._pages[key] = page
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate_created(self, scope: Optional[int] = None) -> None:
+        """
+        Drops the pages of `scope` that reached its end, where new rows land.
+        """
+        self._invalidate(lambda page: page.scope == scope and page.is_last)
+
+    def invalidate_updated(self, id: int) -> None:
+        """
+        Drops the pages containing the row with the given ID.
+        """
+        self._invalidate(lambda page: page.first_id <= id <= page.last_id)
+
+    def invalidate_deleted(self, id: int, scope: Optional[int] = None) -> None:
+        """
+        Drops the pages of `scope` containing the deleted row or shifted by its
+        removal.
+        """
+        self._invalidate(lambda page: page.scope == scope and page.last_id >= id)
+
+    def clear(self) -> None:
+        """
+        Drops every page.
+        """
+        self._invalidate(lambda page: True)
+
+    def stats(self) -> dict:
+        """
+        Returns the counters of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._pages),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _invalidate(self, predicate) -> None:
+        self.generation += 1
+        stale = [key for key, page in self._pages.items() if predicate(page)]
+        for key in stale:
+            del self._pages[key]
+        self.invalidations += len(stale)
@@ -0,0 +1,29 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from .. import config, database
+from .sse import RETRY_MS, format_event, format_comment, format_retry
+from .broadcaster import CHANGE_EVENT, ChangeEvent, ChangeBroadcaster
+
+broadcaster = ChangeBroadcaster(
+    database.ReadSession,
+    poll_interval_ms=config.settings.changes_poll_interval_ms,
+    queue_size=config.settings.changes_queue_size,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_broadcaster(session: Session) -> None:
+    if session.get_bind() is database.engine.sync_engine:
+        broadcaster.notify()
+
+
+__all__ = [
+    "RETRY_MS",
+    "format_event",
+    "format_comment",
+    "format_retry",
+    "CHANGE_EVENT",
+    "ChangeEvent",
+    "ChangeBroadcaster",
+    "broadcaster",
+]
@@ -0,0 +1,185 @@
+import json
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Set
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from .. import crud, schemas
+from . import sse
+
+CHANGE_EVENT = "change"
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    A change log entry, encoded once as an SSE message for every subscriber.
+    """
+
+    id: int
+    message: bytes
+
+
+def _to_event(row: Row) -> ChangeEvent:
+    change = schemas.ChangeOut(
+        id=row.id,
+        table=row.table_name,
+        operation=row.operation,
+        row_id=row.row_id,
+        personal_id=row.personal_id,
+        data=json.loads(row.data) if row.data is not None else None,
+        changed_at=row.changed_at,
+    )
+    return ChangeEvent(
+        id=row.id,
+        message=sse.format_event(row.id, CHANGE_EVENT, change.model_dump_json()),
+    )
+
+
+class ChangeBroadcaster:
+    """
+    Fans the change log out to any number of subscribers.
+
+    A single task reads the entries appended since its last read and hands
+    them, as one batch, to every subscriber's queue, so the log is queried once per wake-up
+    whatever the number of open streams. It wakes up when a session of this
+    process commits, see `notify`, and every `poll_interval_ms` to pick up
+    writes made by other processes; it only runs while someone subscribes.
+
+    A subscriber that falls `queue_size` batches behind is disconnected
+    rather than slowing the others down; it resumes from the log with its
+    Last-Event-ID.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        poll_interval_ms: float = 1000,
+        queue_size: int = 256,
+        batch_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_ms / 1000
+        self.queue_size = max(1, queue_size)
+        self.batch_size = batch_size
+        self.last_id: Optional[int] = None
+        self.published = 0
+        self.disconnected = 0
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def notify(self) -> None:
+        """
+        Wakes the reader up, e.g. after a write was committed.
+        """
+        if self._subscribers:
+            self._wakeup.set()
+
+    async def subscribe(
+        self, last_event_id: Optional[int] = None, heartbeat_seconds: float = 15
+    ) -> AsyncIterator[Optional[ChangeEvent]]:
+        """
+        Yields the changes logged after `last_event_id`, then the new ones
+        as they are committed.
+
+        Changes the log no longer holds are skipped, so callers should check
+        that ids follow each other. Ends if the subscriber falls too far
+        behind.
+
+        Args:
+            last_event_id (Optional[int]): The last change already seen; None to only get new ones.
+            heartbeat_seconds (float): Idle time after which None is yielded.
+
+        Yields:
+            Optional[ChangeEvent]: The next change, or None when idle.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        try:
+            sent = last_event_id
+            if sent is not None:
+                async for event in self._read_after(sent):
+                    yield event
+                    sent = event.id
+            while True:
+                try:
+                    batch = await asyncio.wait_for(queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if batch is None:
+                    return
+                for event in batch:
+                    if sent is not None and event.id <= sent:
+                        continue
+                    if sent is not None and event.id > sent + 1:
+                        # Entries read by the task before this stream caught up.
+                        async for missed in self._read_after(sent, before=event.id):
+                            yield missed
+                            sent = missed.id
+                    yield event
+                    sent = event.id
+        finally:
+            self._subscribers.discard(queue)
+
+    async def _read_after(
+        self, after_id: int, before: Optional[int] = None
+    ) -> AsyncIterator[ChangeEvent]:
+        while True:
+            async with self.session_factory() as db:
+                rows = await crud.ChangeLogCrud.get_after(
+                    db=db, after_id=after_id, limit=self.batch_size
+                )
+            for row in rows:
+                if before is not None and row.id >= before:
+                    return
+                yield _to_event(row)
+                after_id = row.id
+            if len(rows) < self.batch_size:
+                return
+
+    async def _run(self) -> None:
+        self.last_id = None
+        while self._subscribers:
+            try:
+                if self.last_id is None:
+                    async with self.session_factory() as db:
+                        self.last_id = await crud.ChangeLogCrud.get_last_id(db=db)
+                batch = []
+                async for event in self._read_after(self.last_id):
+                    batch.append(event)
+                    if len(batch) == self.batch_size:
+                        self._publish(batch)
+                        batch = []
+                if batch:
+                    self._publish(batch)
+            except Exception:
+                logger.exception("Failed to read the change log.")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _publish(self, batch: List[ChangeEvent]) -> None:
+        self.last_id = batch[-1].id
+        self.published += len(batch)
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(batch)
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                self.disconnected += 1
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
@@ -0,0 +1,30 @@
+RETRY_MS = 1000
+
+
+def format_event(id: int, event: str, data: str) -> bytes:
+    """
+    Encodes a Server-Sent Events message.
+
+    Args:
+        id (int): The event id, echoed by clients in Last-Event-ID.
+        event (str): The event type.
+        data (str): The payload, on a single line.
+
+    Returns:
+        bytes: The message, terminated by a blank line.
+    """
+    return f"id: {id}\nevent: {event}\ndata: {data}\n\n".encode()
+
+
+def format_comment(comment: str) -> bytes:
+    """
+    Encodes a comment, ignored by clients but keeping the connection alive.
+    """
+    return f": {comment}\n\n".encode()
+
+
+def format_retry(retry_ms: int = RETRY_MS) -> bytes:
+    """
+    Encodes the reconnection delay clients should use.
+    """
+    return f"retry: {retry_ms}\n\n".encode()
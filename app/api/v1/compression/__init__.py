@@ -0,0 +1,25 @@
+from .codecs import (
+    GZIP,
+    BROTLI,
+    ENCODINGS,
+    COMPRESSIBLE_TYPES,
+    negotiate,
+    compress,
+    encoded_etag,
+    encoding_headers,
+)
+from .conditional import not_modified
+from .middleware import CompressionMiddleware
+
+__all__ = [
+    "GZIP",
+    "BROTLI",
+    "ENCODINGS",
+    "COMPRESSIBLE_TYPES",
+    "negotiate",
+    "compress",
+    "encoded_etag",
+    "encoding_headers",
+    "not_modified",
+    "CompressionMiddleware",
+]
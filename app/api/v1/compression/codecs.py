@@ -0,0 +1,126 @@
+import gzip
+from .. import config
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available.
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+# Encodings the server can produce, preferred first when the client accepts
+# several with the same quality.
+ENCODINGS = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+COMPRESSIBLE_TYPES = ("application/json", "text/html", "text/markdown")
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Cached bodies are compressed once per data version and served many times,
+# so they are worth the slower, denser settings.
+CACHED_GZIP_LEVEL = 9
+CACHED_BROTLI_QUALITY = 9
+
+
+def _accepted(accept_encoding: str) -> Dict[str, float]:
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities
+
+
+def negotiate(accept_encoding: Optional[str], size: Optional[int]) -> Optional[str]:
+    """
+    Picks the content encoding of a response from the request's Accept-Encoding.
+
+    Args:
+        accept_encoding (Optional[str]): The raw Accept-Encoding header.
+        size (Optional[int]): Size of the uncompressed body, in bytes; None
+            when it is not known yet, which is taken as large enough.
+
+    Returns:
+        Optional[str]: "br" or "gzip", or None to send the body as is, e.g.
+            when it is smaller than COMPRESSION_MIN_SIZE.
+    """
+    if not accept_encoding or (
+        size is not None and size < config.settings.compression_min_size
+    ):
+        return None
+    qualities = _accepted(accept_encoding)
+    default = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    """
+    Compresses a response body.
+
+    Args:
+        body (bytes): The uncompressed body.
+        encoding (str): "br" or "gzip", as returned by negotiate.
+        cached (bool): Whether the result is cached, which warrants denser settings.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == BROTLI:
+        quality = CACHED_BROTLI_QUALITY if cached else BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    level = CACHED_GZIP_LEVEL if cached else GZIP_LEVEL
+    # mtime=0 makes the output depend on the body only.
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Derives the entity tag of a compressed variant of a representation.
+
+    A strong ETag identifies the exact bytes sent, so each encoding gets its
+    own, and a client holding one variant does not validate another.
+
+    Args:
+        etag (str): The quoted entity tag of the uncompressed representation.
+        encoding (str): The content encoding of the variant.
+
+    Returns:
+        str: The quoted entity tag of the variant.
+    """
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def encoding_headers(
+    headers: Dict[str, str], encoding: Optional[str]
+) -> Dict[str, str]:
+    """
+    Adds the headers of a body compressed with `encoding` to response headers.
+
+    Args:
+        headers (Dict[str, str]): The headers of the uncompressed response.
+        encoding (Optional[str]): The content encoding, or None if the body is sent as is.
+
+    Returns:
+        Dict[str, str]: A copy of the headers with Vary, and Content-Encoding
+            and the variant's ETag when the body is compressed.
+    """
+    headers = {**headers, "Vary": "Accept-Encoding"}
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        if "ETag" in headers:
+            headers["ETag"] = encoded_etag(headers["ETag"], encoding)
+    return headers
@@ -0,0 +1,33 @@
+from typing import Dict, Optional
+from fastapi import Request, Response, status
+from .. import utils
+from . import codecs
+
+
+def not_modified(
+    request: Request, headers: Dict[str, str], size: Optional[int] = None
+) -> Optional[Response]:
+    """
+    Answers a conditional GET whose client already holds the representation.
+
+    The encoding is negotiated first, as each encoding is a representation
+    with its own ETag, and If-None-Match is compared against the tag of the
+    one a 200 would send. Before the body is read its size is unknown and
+    the compressed variant is assumed; a body under COMPRESSION_MIN_SIZE is
+    sent as is, so call again with its size once it has been read.
+
+    Args:
+        request (Request): The incoming request.
+        headers (Dict[str, str]): The headers of the uncompressed response,
+            holding its ETag.
+        size (Optional[int]): Size of the uncompressed body, if it has been read.
+
+    Returns:
+        Optional[Response]: A 304 Not Modified with the ETag and Vary of the
+            selected variant, or None if the body must be sent.
+    """
+    encoding = codecs.negotiate(request.headers.get("Accept-Encoding"), size)
+    headers = codecs.encoding_headers(headers, encoding)
+    if not utils.etag_matches(request.headers.get("If-None-Match"), headers["ETag"]):
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,64 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from . import codecs
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON and text responses for clients that accept gzip or br.
+
+    Only responses sent in a single body are compressed; streamed ones, like
+    the NDJSON exports, pass through. Responses that already carry a
+    Content-Encoding, such as cached pages served with their precompressed
+    variant, are left untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if not accept_encoding:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None:
+                await send(message)
+                return
+            start, start_message = start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            content_type = headers.get("content-type", "")
+            if (
+                message["type"] != "http.response.body"
+                or message.get("more_body", False)
+                or "content-encoding" in headers
+                or not content_type.startswith(codecs.COMPRESSIBLE_TYPES)
+            ):
+                await send(start)
+                await send(message)
+                return
+            body = message.get("body", b"")
+            encoding = codecs.negotiate(accept_encoding, len(body))
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            if encoding is not None:
+                body = codecs.compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                if "etag" in headers:
+                    headers["ETag"] = codecs.encoded_etag(headers["etag"], encoding)
+                message = {**message, "body": body}
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
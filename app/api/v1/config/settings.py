@@ -0,0 +1,134 @@
+import os
+from pathlib import Path
+from dataclasses import dataclass, field
+
+DEFAULT_DATABASE_PATH = Path(__file__).resolve().parents[1] / "database.db"
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.getenv(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Runtime settings read from the environment when the process starts.
+
+    REPOSITORY_BACKEND selects where skills, languages and personal records
+    are read from: "sql" (the default) queries the database, "memory" serves
+    a read-only snapshot of it loaded at startup. In memory mode every
+    request other than GET, HEAD or OPTIONS is rejected with 405, as the
+    renderings, change log, counters and idempotency keys stay in the
+    database and would drift from rows written only to memory.
+    """
+
+    database_url: str = field(
+        default_factory=lambda: _env_str(
+            "DATABASE_URL", f"sqlite+aiosqlite:///{DEFAULT_DATABASE_PATH}"
+        )
+    )
+    repository_backend: str = field(
+        default_factory=lambda: _env_str("REPOSITORY_BACKEND", "sql")
+    )
+    database_echo: bool = field(
+        default_factory=lambda: _env_bool("DATABASE_ECHO", False)
+    )
+    database_pool_size: int = field(
+        default_factory=lambda: _env_int("DATABASE_POOL_SIZE", 5)
+    )
+    database_max_overflow: int = field(
+        default_factory=lambda: _env_int("DATABASE_MAX_OVERFLOW", 10)
+    )
+    database_pool_timeout: int = field(
+        default_factory=lambda: _env_int("DATABASE_POOL_TIMEOUT", 30)
+    )
+    database_busy_timeout_ms: int = field(
+        default_factory=lambda: _env_int("DATABASE_BUSY_TIMEOUT_MS", 5000)
+    )
+    database_cache_size_kib: int = field(
+        default_factory=lambda: _env_int("DATABASE_CACHE_SIZE_KIB", 64 * 1024)
+    )
+    database_mmap_size: int = field(
+        default_factory=lambda: _env_int("DATABASE_MMAP_SIZE", 256 * 1024 * 1024)
+    )
+    database_trace_transactions: bool = field(
+        default_factory=lambda: _env_bool("DATABASE_TRACE_TRANSACTIONS", False)
+    )
+    database_prewarm: bool = field(
+        default_factory=lambda: _env_bool("DATABASE_PREWARM", False)
+    )
+    write_batch_window_ms: int = field(
+        default_factory=lambda: _env_int("WRITE_BATCH_WINDOW_MS", 2)
+    )
+    write_batch_max_size: int = field(
+        default_factory=lambda: _env_int("WRITE_BATCH_MAX_SIZE", 64)
+    )
+    cache_max_entries: int = field(
+        default_factory=lambda: _env_int("CACHE_MAX_ENTRIES", 256)
+    )
+    cache_ttl_seconds: int = field(
+        default_factory=lambda: _env_int("CACHE_TTL_SECONDS", 60)
+    )
+    idempotency_enabled: bool = field(
+        default_factory=lambda: _env_bool("IDEMPOTENCY_ENABLED", True)
+    )
+    idempotency_ttl_seconds: int = field(
+        default_factory=lambda: _env_int("IDEMPOTENCY_TTL_SECONDS", 24 * 60 * 60)
+    )
+    admission_enabled: bool = field(
+        default_factory=lambda: _env_bool("ADMISSION_ENABLED", True)
+    )
+    admission_read_limit: int = field(
+        default_factory=lambda: _env_int("ADMISSION_READ_LIMIT", 64)
+    )
+    admission_read_queue_size: int = field(
+        default_factory=lambda: _env_int("ADMISSION_READ_QUEUE_SIZE", 256)
+    )
+    admission_write_limit: int = field(
+        default_factory=lambda: _env_int("ADMISSION_WRITE_LIMIT", 64)
+    )
+    admission_write_queue_size: int = field(
+        default_factory=lambda: _env_int("ADMISSION_WRITE_QUEUE_SIZE", 256)
+    )
+    admission_queue_timeout_ms: int = field(
+        default_factory=lambda: _env_int("ADMISSION_QUEUE_TIMEOUT_MS", 2000)
+    )
+    admission_retry_after_seconds: int = field(
+        default_factory=lambda: _env_int("ADMISSION_RETRY_AFTER_SECONDS", 1)
+    )
+    changes_poll_interval_ms: int = field(
+        default_factory=lambda: _env_int("CHANGES_POLL_INTERVAL_MS", 1000)
+    )
+    changes_queue_size: int = field(
+        default_factory=lambda: _env_int("CHANGES_QUEUE_SIZE", 256)
+    )
+    changes_heartbeat_seconds: int = field(
+        default_factory=lambda: _env_int("CHANGES_HEARTBEAT_SECONDS", 15)
+    )
+    compression_enabled: bool = field(
+        default_factory=lambda: _env_bool("COMPRESSION_ENABLED", True)
+    )
+    compression_min_size: int = field(
+        default_factory=lambda: _env_int("COMPRESSION_MIN_SIZE", 1024)
+    )
+    metrics_enabled: bool = field(
+        default_factory=lambda: _env_bool("METRICS_ENABLED", True)
+    )
+    startup_budget_ms: int = field(
+        default_factory=lambda: _env_int("STARTUP_BUDGET_MS", 500)
+    )
+
+
+settings = Settings()
@@ -1,5 +1,75 @@
+from typing import Optional
+from .. import config, utils
 from .language_crud import LanguageCrud
 from .skill_crud import SkillCrud
 from .personal_crud import PersonalCrud
+from .rendering_crud import RenderingCrud
+from .row_count_crud import RowCountCrud
+from .idempotency_key_crud import IdempotencyKeyCrud
+from .change_log_crud import ChangeLogCrud
+from .repositories import (
+    RowStream,
+    read_all,
+    SkillRepository,
+    LanguageRepository,
+    PersonalRepository,
+    RowCountRepository,
+)
+from .memory_crud import (
+    MemoryTable,
+    InMemoryStore,
+    InMemorySkillCrud,
+    InMemoryLanguageCrud,
+    InMemoryPersonalCrud,
+    InMemoryRowCountCrud,
+)
 
-__all__ = ["LanguageCrud", "SkillCrud", "PersonalCrud"]
+try:
+    repository_backend = utils.RepositoryBackend(config.settings.repository_backend)
+except ValueError:
+    raise ValueError(
+        f"Invalid REPOSITORY_BACKEND {config.settings.repository_backend!r}; "
+        f"expected one of: {', '.join(b.value for b in utils.RepositoryBackend)}."
+    ) from None
+
+skills: SkillRepository = SkillCrud
+languages: LanguageRepository = LanguageCrud
+personal: PersonalRepository = PersonalCrud
+row_counts: RowCountRepository = RowCountCrud
+# The tables of the in-memory backend, loaded from the database at startup.
+memory_store: Optional[InMemoryStore] = None
+
+if repository_backend == utils.RepositoryBackend.MEMORY:
+    memory_store = InMemoryStore()
+    skills = InMemorySkillCrud(memory_store)
+    languages = InMemoryLanguageCrud(memory_store)
+    personal = InMemoryPersonalCrud(memory_store)
+    row_counts = InMemoryRowCountCrud(memory_store)
+
+__all__ = [
+    "LanguageCrud",
+    "SkillCrud",
+    "PersonalCrud",
+    "RenderingCrud",
+    "RowCountCrud",
+    "IdempotencyKeyCrud",
+    "ChangeLogCrud",
+    "RowStream",
+    "read_all",
+    "SkillRepository",
+    "LanguageRepository",
+    "PersonalRepository",
+    "RowCountRepository",
+    "MemoryTable",
+    "InMemoryStore",
+    "InMemorySkillCrud",
+    "InMemoryLanguageCrud",
+    "InMemoryPersonalCrud",
+    "InMemoryRowCountCrud",
+    "skills",
+    "languages",
+    "personal",
+    "row_counts",
+    "repository_backend",
+    "memory_store",
+]
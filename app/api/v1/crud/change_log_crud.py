@@ -0,0 +1,53 @@
+from typing import List
+from sqlalchemy import Row, func, select
+from .. import models
+from pydantic import PositiveInt
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class ChangeLogCrud:
+    @staticmethod
+    async def get_after(
+        db: AsyncSession, after_id: int, limit: PositiveInt = 500
+    ) -> List[Row]:
+        """
+        Retrieves the changes logged after a given one, oldest first.
+
+        Args:
+            db (AsyncSession): A database session.
+            after_id (int): The id of the last change already seen.
+            limit (PositiveInt): Maximum number of changes. Defaults to 500.
+
+        Returns:
+            List[Row]: The changes, seeking on the primary key.
+        """
+        query = (
+            select(
+                models.ChangeLog.id,
+                models.ChangeLog.table_name,
+                models.ChangeLog.operation,
+                models.ChangeLog.row_id,
+                models.ChangeLog.personal_id,
+                models.ChangeLog.data,
+                models.ChangeLog.changed_at,
+            )
+            .where(models.ChangeLog.id > after_id)
+            .order_by(models.ChangeLog.id)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return result.all()
+
+    @staticmethod
+    async def get_last_id(db: AsyncSession) -> int:
+        """
+        Retrieves the id of the latest change.
+
+        Args:
+            db (AsyncSession): A database session.
+
+        Returns:
+            int: The id, 0 if nothing was logged yet.
+        """
+        result = await db.execute(select(func.max(models.ChangeLog.id)))
+        return result.scalar_one_or_none() or 0
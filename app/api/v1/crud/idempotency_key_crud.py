@@ -0,0 +1,125 @@
+from typing import Optional
+from sqlalchemy import Row, delete, select
+from .. import models
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.sqlite import insert
+
+
+class IdempotencyKeyCrud:
+    # The status code of a key whose request committed but whose response
+    # is not stored yet.
+    RESERVED_STATUS_CODE = 0
+
+    @staticmethod
+    async def get(db: AsyncSession, key: str, now: int) -> Optional[Row]:
+        """
+        Retrieves the stored response of an idempotency key, unless expired.
+
+        Args:
+            db (AsyncSession): A database session.
+            key (str): The digest of the method, path and Idempotency-Key.
+            now (int): The current time, in seconds since the epoch.
+
+        Returns:
+            Optional[Row]: The fingerprint, status code, content type and body.
+        """
+        query = select(
+            models.IdempotencyKey.fingerprint,
+            models.IdempotencyKey.status_code,
+            models.IdempotencyKey.content_type,
+            models.IdempotencyKey.body,
+        ).where(
+            models.IdempotencyKey.key == key,
+            models.IdempotencyKey.expires_at > now,
+        )
+        result = await db.execute(query)
+        return result.one_or_none()
+
+    @staticmethod
+    async def reserve(
+        db: AsyncSession, key: str, fingerprint: str, now: int, expires_at: int
+    ) -> None:
+        """
+        Reserves an idempotency key in the transaction of its request's write,
+        replacing an expired key.
+
+        Args:
+            db (AsyncSession): A database session.
+            key (str): The digest of the method, path and Idempotency-Key.
+            fingerprint (str): The digest of the request.
+            now (int): The current time, in seconds since the epoch.
+            expires_at (int): When the key expires, in seconds since the epoch.
+        """
+        values = dict(
+            fingerprint=fingerprint,
+            status_code=IdempotencyKeyCrud.RESERVED_STATUS_CODE,
+            content_type=None,
+            body=b"",
+            expires_at=expires_at,
+        )
+        query = (
+            insert(models.IdempotencyKey)
+            .values(key=key, **values)
+            .on_conflict_do_update(
+                index_elements=[models.IdempotencyKey.key],
+                set_=values,
+                where=models.IdempotencyKey.expires_at <= now,
+            )
+        )
+        await db.execute(query)
+
+    @staticmethod
+    async def save(
+        db: AsyncSession,
+        key: str,
+        fingerprint: str,
+        status_code: int,
+        content_type: Optional[str],
+        body: bytes,
+        expires_at: int,
+    ) -> None:
+        """
+        Stores the response of an idempotency key, filling its reservation
+        but keeping a response stored already.
+
+        Args:
+            db (AsyncSession): A database session.
+            key (str): The digest of the method, path and Idempotency-Key.
+            fingerprint (str): The digest of the request.
+            status_code (int): The status code of the response.
+            content_type (Optional[str]): The Content-Type of the response.
+            body (bytes): The body of the response.
+            expires_at (int): When the key expires, in seconds since the epoch.
+        """
+        values = dict(
+            fingerprint=fingerprint,
+            status_code=status_code,
+            content_type=content_type,
+            body=body,
+            expires_at=expires_at,
+        )
+        query = (
+            insert(models.IdempotencyKey)
+            .values(key=key, **values)
+            .on_conflict_do_update(
+                index_elements=[models.IdempotencyKey.key],
+                set_=values,
+                where=models.IdempotencyKey.status_code
+                == IdempotencyKeyCrud.RESERVED_STATUS_CODE,
+            )
+        )
+        await db.execute(query)
+
+    @staticmethod
+    async def delete_expired(db: AsyncSession, now: int) -> None:
+        """
+        Deletes the keys that expired, seeking on the expiry index.
+
+        Args:
+            db (AsyncSession): A database session.
+            now (int): The current time, in seconds since the epoch.
+        """
+        query = delete(models.IdempotencyKey).where(
+            models.IdempotencyKey.expires_at <= now
+        )
+        await db.execute(query)
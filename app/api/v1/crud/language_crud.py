@@ -1,9 +1,20 @@
-from typing import Optional
-from sqlalchemy import select
-from .. import schemas, models
+from typing import List, Optional
+from sqlalchemy import Row, delete, select, update, func, union
+from .. import schemas, models, utils, database
 from pydantic import PositiveInt
 from fastapi import HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncScalarResult
+from sqlalchemy.dialects.sqlite import insert
+
+
+def _in_profile(personal_id: Optional[int]):
+    """
+    Filters languages to one profile, or to the unscoped languages served by the
+    top-level routes when `personal_id` is None.
+    """
+    if personal_id is None:
+        return models.Language.personal_id.is_(None)
+    return models.Language.personal_id == personal_id
 
 
 class LanguageCrud:
@@ -12,57 +23,255 @@ class LanguageCrud:
         db: AsyncSession,
         page: Optional[PositiveInt] = 1,
         items_per_page: Optional[PositiveInt] = 100,
-    ):
+        after_id: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.LanguageRow]:
         """
         Retrieves all languages from the database.
 
+        When `after_id` is given the page is located by seeking on the primary
+        key index instead of skipping `(page - 1) * items_per_page` rows.
+
         Args:
             db (AsyncSession): A database session.
             page (Optional[PositiveInt]): Page number. Defaults to 1.
             items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+            after_id (Optional[int]): Return languages with an ID greater than this one.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
-            List[models.Language]: List of languages.
+            List[schemas.LanguageRow]: List of languages, as plain dicts.
         """
-        page = page or 1
-        items_per_page = items_per_page or 100
-        offset = (page - 1) * items_per_page
+        items_per_page = utils.clamp_items_per_page(items_per_page)
+        columns = [
+            getattr(models.Language, field)
+            for field in schemas.LanguageRow.__annotations__
+        ]
         query = (
-            select(models.Language)
+            select(*columns)
+            .where(_in_profile(personal_id))
             .order_by(models.Language.id.asc())
-            .offset(offset)
-            .limit(items_per_page)
+        )
+        if after_id is not None:
+            query = query.where(models.Language.id > after_id)
+        else:
+            page = page or 1
+            query = query.offset((page - 1) * items_per_page)
+        query = query.limit(items_per_page)
+        result = await db.execute(query)
+        return [row._asdict() for row in result]
+
+    @staticmethod
+    async def get_by_name(
+        db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> Row:
+        """
+        Retrieves a language by name, ignoring case and whitespace.
+
+        The lookup seeks on the unique index over the normalized name key.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the language.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            Row: The language.
+
+        Raises:
+            HTTPException: If the language does not exist (404).
+        """
+        query = select(*models.Language.__table__.columns).where(
+            _in_profile(personal_id),
+            models.Language.name_key == utils.normalize_name(name),
         )
         result = await db.execute(query)
-        return result.scalars().all()
+        language = result.one_or_none()
+        if language is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Language not found.",
+            )
+        return language
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        limit: PositiveInt = 100,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.LanguageRow]:
+        """
+        Searches languages by name, ignoring case.
+
+        Queries of at least three characters, once surrounding and repeated
+        whitespace is dropped, are answered from the trigram index in
+        `languages_fts`. Shorter ones cannot be expressed as a trigram: prefixes
+        seek on the name key index and substrings scan the keys.
+        The first `limit` matches in index order, plus the exact match, are
+        then ranked with shorter names first, so exact and prefix matches
+        lead without sorting every match of a common trigram.
+
+        Args:
+            db (AsyncSession): A database session.
+            q (str): Text to look for.
+            mode (utils.SearchMode): Match names starting with `q`, or containing it.
+            limit (PositiveInt): Maximum number of languages. Defaults to 100.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            List[schemas.LanguageRow]: The matching languages, as plain dicts.
+        """
+        name = models.Language.name
+        columns = [
+            getattr(models.Language, field)
+            for field in schemas.LanguageRow.__annotations__
+        ]
+        # Paths are chosen on the normalized text: "  py " is two characters,
+        # too short for a trigram.
+        text = " ".join(q.split())
+        key = utils.normalize_name(q)
+        candidates = select(models.Language.id).where(_in_profile(personal_id))
+        if len(text) >= utils.MIN_TRIGRAM_LENGTH:
+            phrase = utils.quote_phrase(text)
+            if mode == utils.SearchMode.PREFIX:
+                phrase = "^" + phrase
+            candidates = candidates.join(
+                database.languages_fts,
+                database.languages_fts.c.rowid == models.Language.id,
+            ).where(database.languages_fts.c.name.match(phrase))
+        else:
+            if mode == utils.SearchMode.PREFIX:
+                candidates = candidates.where(
+                    models.Language.name_key >= key,
+                    models.Language.name_key < key + "\U0010ffff",
+                )
+            else:
+                candidates = candidates.where(
+                    func.instr(models.Language.name_key, key) > 0
+                )
+        exact = select(models.Language.id).where(
+            _in_profile(personal_id), models.Language.name_key == key
+        )
+        ids = union(select(candidates.limit(limit).subquery().c.id), exact).subquery()
+        query = (
+            select(*columns)
+            .join(ids, ids.c.id == models.Language.id)
+            .order_by(func.length(name), name)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return [row._asdict() for row in result]
+
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession,
+        chunk_size: PositiveInt = 500,
+        personal_id: Optional[int] = None,
+    ) -> AsyncScalarResult[models.Language]:
+        """
+        Streams all languages from the database through a server-side cursor.
+
+        Args:
+            db (AsyncSession): A database session.
+            chunk_size (PositiveInt): Rows fetched per round trip. Defaults to 500.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            AsyncScalarResult[models.Language]: An async result over the languages.
+        """
+        query = (
+            select(models.Language)
+            .where(_in_profile(personal_id))
+            .order_by(models.Language.id.asc())
+            .execution_options(yield_per=chunk_size)
+        )
+        return await db.stream_scalars(query)
 
     @staticmethod
-    async def create(db: AsyncSession, language: schemas.LanguageIn):
+    async def create(
+        db: AsyncSession,
+        language: schemas.LanguageIn,
+        personal_id: Optional[int] = None,
+    ) -> Row:
         """
         Creates a language in the database.
 
+        The row is inserted and read back with a single INSERT ... RETURNING
+        statement.
+
         Args:
             db (AsyncSession): A database session.
             language (schemas.LanguageIn): The language to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
-            models.Language: The created language.
+            Row: The created language, with its generated columns.
         """
-        language_dict = language.model_dump()
-        language = models.Language(**language_dict)
-        db.add(language)
-        await db.commit()
-        await db.refresh(language)
-        return language
+        query = (
+            insert(models.Language)
+            .values(
+                **language.model_dump(),
+                name_key=utils.normalize_name(language.name),
+                personal_id=personal_id,
+            )
+            .returning(*models.Language.__table__.columns)
+        )
+        result = await db.execute(query)
+        created_language = result.one()
+        return created_language
 
     @staticmethod
-    async def delete_by_id(db: AsyncSession, id: PositiveInt):
+    async def bulk_create(
+        db: AsyncSession,
+        languages: List[schemas.LanguageIn],
+        personal_id: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Creates many languages with a single multi-row INSERT in one transaction.
+
+        Rows whose name key already exists, in the table or earlier in the
+        batch, are skipped instead of aborting the statement.
+
+        Args:
+            db (AsyncSession): A database session.
+            languages (List[schemas.LanguageIn]): The languages to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            List[Row]: The languages that were created.
+        """
+        query = (
+            insert(models.Language)
+            .values(
+                [
+                    dict(
+                        **language.model_dump(),
+                        name_key=utils.normalize_name(language.name),
+                        personal_id=personal_id,
+                    )
+                    for language in languages
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(*models.Language.__table__.columns)
+        )
+        result = await db.execute(query)
+        created = result.all()
+        return created
+
+    @staticmethod
+    async def delete_by_id(
+        db: AsyncSession, id: PositiveInt, personal_id: Optional[int] = None
+    ):
         """
         Deletes a language by its ID from the database.
 
         Args:
             db (AsyncSession): A database session.
             id (PositiveInt): The ID of the language to delete.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
             None
@@ -70,42 +279,65 @@ class LanguageCrud:
         Raises:
             HTTPException: If the language does not exist (404) or if there is an internal server error (500).
         """
-        language = await db.get(models.Language, id)
-        if not language:
+        query = (
+            delete(models.Language)
+            .where(models.Language.id == id, _in_profile(personal_id))
+            .returning(models.Language.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(query)
+        if result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Language not found.",
             )
-        await db.delete(language)
-        await db.commit()
 
     @staticmethod
     async def update_by_id(
-        db: AsyncSession, id: PositiveInt, language: schemas.LanguageUpdate
-    ) -> models.Language:
+        db: AsyncSession,
+        id: PositiveInt,
+        language: schemas.LanguageUpdate,
+        personal_id: Optional[int] = None,
+    ) -> Row:
         """
         Updates a language by its ID in the database.
 
+        The row is updated and read back with a single UPDATE ... RETURNING
+        statement; an empty update only reads the row.
+
         Args:
             db (AsyncSession): A database session.
             id (PositiveInt): The ID of the language to update.
             language (schemas.LanguageUpdate): The language update data.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
-            models.Language: The updated language.
+            Row: The updated language.
 
         Raises:
             HTTPException: If the language does not exist (404).
         """
         update_data = language.model_dump(exclude_unset=True)
-        language = await db.get(models.Language, id)
-        if not language:
+        if update_data.get("name") is not None:
+            update_data["name_key"] = utils.normalize_name(update_data["name"])
+        columns = models.Language.__table__.columns
+        if update_data:
+            query = (
+                update(models.Language)
+                .where(models.Language.id == id, _in_profile(personal_id))
+                .values(**update_data)
+                .returning(*columns)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            query = select(*columns).where(
+                models.Language.id == id, _in_profile(personal_id)
+            )
+        result = await db.execute(query)
+        updated_language = result.one_or_none()
+        if updated_language is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Language not found.",
             )
-        for field, value in update_data.items():
-            setattr(language, field, value)
-        await db.commit()
-        await db.refresh(language)
-        return language
+        return updated_language
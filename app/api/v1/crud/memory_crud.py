@@ -0,0 +1,727 @@
+import re
+from .. import schemas, models, utils, database
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from itertools import islice
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from pydantic import BaseModel, PositiveInt
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_TERM = re.compile(r'"((?:[^"]|"")*)"(\*?)')
+_WORD = re.compile(r"\w+")
+
+
+def _now() -> datetime:
+    # Same value as SQLite's CURRENT_TIMESTAMP: naive UTC, whole seconds.
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def _unique_violation(table: str, column: str) -> IntegrityError:
+    return IntegrityError(
+        f"INSERT INTO {table}",
+        None,
+        Exception(f"UNIQUE constraint failed: {table}.{column}"),
+    )
+
+
+class MemoryTable:
+    """
+    Rows of one table, indexed by ID and, per profile, by ID and name key.
+
+    `ids` and `keys` hold the IDs and the name keys of each profile in
+    sorted order, so pages are sliced after a binary search and prefix
+    searches are a range of `keys`, like the SQLite indexes they stand for.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.clear()
+
+    def clear(self) -> None:
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.ids: Dict[Optional[int], List[int]] = {}
+        self.keys: Dict[Optional[int], List[str]] = {}
+        self.by_key: Dict[Optional[int], Dict[str, int]] = {}
+        self.next_id = 1
+        self.version = 0
+        self.versions: Dict[Optional[int], int] = {}
+
+    def touch(self, scope: Optional[int]) -> None:
+        """
+        Bumps the version of the table and of one of its scopes.
+        """
+        self.version += 1
+        self.versions[scope] = self.versions.get(scope, 0) + 1
+
+    def insert(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        scope = values.get("personal_id")
+        id, self.next_id = self.next_id, self.next_id + 1
+        now = _now()
+        row = {"id": id, **values, "created_at": now, "updated_at": now}
+        self.rows[id] = row
+        # IDs only grow, so appending keeps them sorted.
+        self.ids.setdefault(scope, []).append(id)
+        if "name_key" in row:
+            insort(self.keys.setdefault(scope, []), row["name_key"])
+            self.by_key.setdefault(scope, {})[row["name_key"]] = id
+        return row
+
+    def rekey(self, row: Dict[str, Any], name_key: str) -> None:
+        scope = row["personal_id"]
+        keys = self.keys[scope]
+        del keys[bisect_left(keys, row["name_key"])]
+        del self.by_key[scope][row["name_key"]]
+        insort(keys, name_key)
+        self.by_key[scope][name_key] = row["id"]
+        row["name_key"] = name_key
+
+    def delete(self, row: Dict[str, Any]) -> None:
+        scope = row.get("personal_id")
+        ids = self.ids[scope]
+        del ids[bisect_left(ids, row["id"])]
+        if "name_key" in row:
+            keys = self.keys[scope]
+            del keys[bisect_left(keys, row["name_key"])]
+            del self.by_key[scope][row["name_key"]]
+        del self.rows[row["id"]]
+
+    def restore(self, row: Dict[str, Any]) -> None:
+        """
+        Puts back a row under its own ID, e.g. a deleted or loaded one.
+        """
+        scope = row.get("personal_id")
+        self.rows[row["id"]] = row
+        insort(self.ids.setdefault(scope, []), row["id"])
+        if "name_key" in row:
+            insort(self.keys.setdefault(scope, []), row["name_key"])
+            self.by_key.setdefault(scope, {})[row["name_key"]] = row["id"]
+        self.next_id = max(self.next_id, row["id"] + 1)
+
+    def find(self, id: int, personal_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        row = self.rows.get(id)
+        if row is None or row.get("personal_id") != personal_id:
+            return None
+        return row
+
+    def count(self, personal_id: Optional[int] = None) -> int:
+        return len(self.ids.get(personal_id, ()))
+
+
+def _undo_on_rollback(
+    db: AsyncSession, table: MemoryTable, scope: Optional[int], undo: Callable
+) -> None:
+    # The undo bumps the version again rather than restoring it, so a page
+    # cached while the write was visible is never served again.
+    def rollback() -> None:
+        undo()
+        table.touch(scope)
+
+    database.on_rollback(db, rollback)
+
+
+class InMemoryStore:
+    """
+    The tables of an in-memory repository backend.
+
+    Writes are applied when the repository method runs, so the reads of
+    the same transaction, e.g. the uniqueness checks of a batch or the
+    re-rendering before its commit, see them. Each write registers its
+    undo with database.on_rollback, so a write whose savepoint rolls back,
+    or whose transaction fails to commit, leaves no trace.
+
+    The tables start as a snapshot of the database loaded at startup by
+    `load`. The app serves that snapshot read-only and rejects writes, as
+    the renderings, change log and idempotency keys stay in the database;
+    the write methods keep the repositories interchangeable with SQL.
+    """
+
+    def __init__(self):
+        self.tables = {
+            name: MemoryTable(name)
+            for name in (
+                models.Personal.__tablename__,
+                models.Skill.__tablename__,
+                models.Language.__tablename__,
+            )
+        }
+
+    async def load(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        Replaces the tables with the rows and version stamps of the database.
+
+        Args:
+            db (AsyncSession): A session on the database to load.
+
+        Returns:
+            Dict[str, int]: The number of rows loaded, per table.
+        """
+        loaded = {}
+        for name, table in self.tables.items():
+            table.clear()
+            source = database.base.metadata.tables[name]
+            result = await db.stream(select(source).order_by(source.c.id))
+            async for row in result.mappings():
+                table.restore(dict(row))
+            loaded[name] = len(table.rows)
+            scopes = await db.execute(
+                select(models.RowCount.scope, models.RowCount.version).where(
+                    models.RowCount.name == name
+                )
+            )
+            table.versions = {scope or None: version for scope, version in scopes}
+            table.version = sum(table.versions.values())
+        return loaded
+
+
+class _RowStream:
+    def __init__(self, rows: List[Dict[str, Any]], chunk_size: int):
+        self.rows = rows
+        self.chunk_size = chunk_size
+
+    async def partitions(self):
+        for start in range(0, len(self.rows), self.chunk_size):
+            yield [
+                SimpleNamespace(**row)
+                for row in self.rows[start : start + self.chunk_size]
+            ]
+
+
+class _InMemoryNamedCrud:
+    """
+    Shared implementation of the skill and language repositories.
+    """
+
+    not_found = "Not found."
+    fields: Sequence[str] = ()
+
+    def __init__(self, store: InMemoryStore, table: str):
+        self.table = store.tables[table]
+
+    def _out(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: row[field] for field in self.fields}
+
+    def _not_found(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=self.not_found
+        )
+
+    def _insert(
+        self, db: AsyncSession, item: BaseModel, personal_id: Optional[int]
+    ) -> Dict[str, Any]:
+        values = item.model_dump(mode="json")
+        name_key = utils.normalize_name(values["name"])
+        if name_key in self.table.by_key.get(personal_id, {}):
+            raise _unique_violation(self.table.name, "name_key")
+        values.update(name_key=name_key, personal_id=personal_id)
+        row = self.table.insert(values)
+        self.table.touch(personal_id)
+        _undo_on_rollback(db, self.table, personal_id, lambda: self.table.delete(row))
+        return row
+
+    async def _create(
+        self, db: AsyncSession, item: BaseModel, personal_id: Optional[int]
+    ) -> Any:
+        return SimpleNamespace(**self._insert(db, item, personal_id))
+
+    async def _bulk_create(
+        self, db: AsyncSession, items: List[BaseModel], personal_id: Optional[int]
+    ) -> List[Any]:
+        created = []
+        for item in items:
+            try:
+                created.append(SimpleNamespace(**self._insert(db, item, personal_id)))
+            except IntegrityError:
+                continue
+        return created
+
+    async def get_all(
+        self,
+        db: AsyncSession,
+        page: Optional[PositiveInt] = 1,
+        items_per_page: Optional[PositiveInt] = 100,
+        after_id: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves a page of rows of one profile, ordered by ID.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            page (Optional[PositiveInt]): Page number. Defaults to 1.
+            items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+            after_id (Optional[int]): Return rows with an ID greater than this one.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped rows.
+
+        Returns:
+            List[Dict[str, Any]]: The rows of the page, as plain dicts.
+        """
+        items_per_page = utils.clamp_items_per_page(items_per_page)
+        ids = self.table.ids.get(personal_id, [])
+        if after_id is not None:
+            start = bisect_right(ids, after_id)
+        else:
+            start = ((page or 1) - 1) * items_per_page
+        rows = self.table.rows
+        return [self._out(rows[id]) for id in ids[start : start + items_per_page]]
+
+    async def get_by_name(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> Any:
+        """
+        Retrieves a row by name, ignoring case and whitespace.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            name (str): The name to look up.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped rows.
+
+        Returns:
+            Any: The row.
+
+        Raises:
+            HTTPException: If there is no such row (404).
+        """
+        id = self.table.by_key.get(personal_id, {}).get(utils.normalize_name(name))
+        if id is None:
+            raise self._not_found()
+        return SimpleNamespace(**self.table.rows[id])
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        limit: PositiveInt = 100,
+        personal_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches rows by name key, shortest names first.
+
+        Prefixes are a range of the sorted name keys; substrings scan them.
+        As in SQL, only the first `limit` matches in key order, plus the
+        exact match, are ranked.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            q (str): Text to look for.
+            mode (utils.SearchMode): Match names starting with `q`, or containing it.
+            limit (PositiveInt): Maximum number of rows. Defaults to 100.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped rows.
+
+        Returns:
+            List[Dict[str, Any]]: The matching rows, as plain dicts.
+        """
+        key = utils.normalize_name(q)
+        keys = self.table.keys.get(personal_id, [])
+        if mode == utils.SearchMode.PREFIX:
+            start = bisect_left(keys, key)
+            end = bisect_left(keys, key + "\U0010ffff", start)
+            matches = keys[start : min(end, start + limit)]
+        else:
+            matches = list(islice((k for k in keys if key in k), limit))
+        by_key = self.table.by_key.get(personal_id, {})
+        if key in by_key and key not in matches:
+            matches.append(key)
+        rows = [self.table.rows[by_key[k]] for k in matches]
+        rows.sort(key=lambda row: (len(row["name"]), row["name"]))
+        return [self._out(row) for row in rows[:limit]]
+
+    async def stream_all(
+        self,
+        db: AsyncSession,
+        chunk_size: PositiveInt = 500,
+        personal_id: Optional[int] = None,
+    ) -> _RowStream:
+        """
+        Streams the rows of one profile in chunks, ordered by ID.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            chunk_size (PositiveInt): Rows per chunk. Defaults to 500.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped rows.
+
+        Returns:
+            _RowStream: The rows as of the call.
+        """
+        rows = self.table.rows
+        ids = self.table.ids.get(personal_id, [])
+        return _RowStream([dict(rows[id]) for id in ids], chunk_size)
+
+    async def _update_by_id(
+        self, db: AsyncSession, id: int, item: BaseModel, personal_id: Optional[int]
+    ) -> Any:
+        row = self.table.find(id, personal_id)
+        if row is None:
+            raise self._not_found()
+        update_data = item.model_dump(mode="json", exclude_unset=True)
+        name_key = row["name_key"]
+        if update_data.get("name") is not None:
+            name_key = utils.normalize_name(update_data["name"])
+            owner = self.table.by_key[personal_id].get(name_key)
+            if owner is not None and owner != id:
+                raise _unique_violation(self.table.name, "name_key")
+        if update_data:
+            previous = dict(row)
+            if name_key != row["name_key"]:
+                self.table.rekey(row, name_key)
+            row.update(update_data, updated_at=_now())
+            self.table.touch(personal_id)
+
+            def undo() -> None:
+                if row["name_key"] != previous["name_key"]:
+                    self.table.rekey(row, previous["name_key"])
+                row.update(previous)
+
+            _undo_on_rollback(db, self.table, personal_id, undo)
+        return SimpleNamespace(**row)
+
+
+class InMemorySkillCrud(_InMemoryNamedCrud):
+    """
+    SkillRepository holding the skills in memory.
+    """
+
+    not_found = "Skill not found."
+    fields = tuple(schemas.SkillRow.__annotations__)
+
+    def __init__(self, store: InMemoryStore):
+        super().__init__(store, models.Skill.__tablename__)
+
+    async def create(
+        self,
+        db: AsyncSession,
+        skill: schemas.SkillIn,
+        personal_id: Optional[int] = None,
+    ) -> Any:
+        """
+        Creates a skill.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            skill (schemas.SkillIn): The skill to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            Any: The created skill.
+
+        Raises:
+            IntegrityError: If the profile already has a skill of that name.
+        """
+        return await self._create(db, skill, personal_id)
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        skills: List[schemas.SkillIn],
+        personal_id: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Creates many skills, skipping the names that already exist.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            skills (List[schemas.SkillIn]): The skills to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            List[Any]: The skills that were created.
+        """
+        return await self._bulk_create(db, skills, personal_id)
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        id: PositiveInt,
+        skill: schemas.SkillUpdate,
+        personal_id: Optional[int] = None,
+    ) -> Any:
+        """
+        Updates a skill by its ID.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            id (PositiveInt): The ID of the skill to update.
+            skill (schemas.SkillUpdate): The skill update data.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            Any: The updated skill.
+
+        Raises:
+            HTTPException: If the skill does not exist (404).
+            IntegrityError: If the profile already has a skill of the new name.
+        """
+        return await self._update_by_id(db, id, skill, personal_id)
+
+
+class InMemoryLanguageCrud(_InMemoryNamedCrud):
+    """
+    LanguageRepository holding the languages in memory.
+    """
+
+    not_found = "Language not found."
+    fields = tuple(schemas.LanguageRow.__annotations__)
+
+    def __init__(self, store: InMemoryStore):
+        super().__init__(store, models.Language.__tablename__)
+
+    async def create(
+        self,
+        db: AsyncSession,
+        language: schemas.LanguageIn,
+        personal_id: Optional[int] = None,
+    ) -> Any:
+        """
+        Creates a language.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            language (schemas.LanguageIn): The language to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            Any: The created language.
+
+        Raises:
+            IntegrityError: If the profile already has a language of that name.
+        """
+        return await self._create(db, language, personal_id)
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        languages: List[schemas.LanguageIn],
+        personal_id: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Creates many languages, skipping the names that already exist.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            languages (List[schemas.LanguageIn]): The languages to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            List[Any]: The languages that were created.
+        """
+        return await self._bulk_create(db, languages, personal_id)
+
+    async def delete_by_id(
+        self, db: AsyncSession, id: PositiveInt, personal_id: Optional[int] = None
+    ) -> None:
+        """
+        Deletes a language by its ID.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            id (PositiveInt): The ID of the language to delete.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Raises:
+            HTTPException: If the language does not exist (404).
+        """
+        row = self.table.find(id, personal_id)
+        if row is None:
+            raise self._not_found()
+        self.table.delete(row)
+        self.table.touch(personal_id)
+        _undo_on_rollback(db, self.table, personal_id, lambda: self.table.restore(row))
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        id: PositiveInt,
+        language: schemas.LanguageUpdate,
+        personal_id: Optional[int] = None,
+    ) -> Any:
+        """
+        Updates a language by its ID.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            id (PositiveInt): The ID of the language to update.
+            language (schemas.LanguageUpdate): The language update data.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            Any: The updated language.
+
+        Raises:
+            HTTPException: If the language does not exist (404).
+            IntegrityError: If the profile already has a language of the new name.
+        """
+        return await self._update_by_id(db, id, language, personal_id)
+
+
+class InMemoryPersonalCrud:
+    """
+    PersonalRepository holding the personal records in memory.
+    """
+
+    unique_columns = ("full_name", "email", "phone", "github_link", "linkedin_link")
+
+    def __init__(self, store: InMemoryStore):
+        self.table = store.tables[models.Personal.__tablename__]
+
+    async def create(self, db: AsyncSession, personal: schemas.PersonalIn) -> Any:
+        """
+        Creates a personal record.
+
+        Args:
+            db (AsyncSession): The session whose rollback undoes the write.
+            personal (schemas.PersonalIn): The record to create.
+
+        Returns:
+            Any: The created record.
+
+        Raises:
+            IntegrityError: If another record has the same name, email, phone or links.
+        """
+        values = personal.model_dump(mode="json")
+        for row in self.table.rows.values():
+            for column in self.unique_columns:
+                if row[column] == values[column]:
+                    raise _unique_violation(self.table.name, column)
+        row = self.table.insert(values)
+        self.table.touch(row["id"])
+        _undo_on_rollback(db, self.table, row["id"], lambda: self.table.delete(row))
+        return SimpleNamespace(**row)
+
+    async def get_first(self, db: AsyncSession) -> Optional[Any]:
+        """
+        Retrieves the personal record with the lowest ID.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+
+        Returns:
+            Optional[Any]: The personal record, if there is one.
+        """
+        ids = self.table.ids.get(None)
+        return SimpleNamespace(**self.table.rows[ids[0]]) if ids else None
+
+    async def get_by_id(self, db: AsyncSession, id: PositiveInt) -> Optional[Any]:
+        """
+        Retrieves a personal record by its ID.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            id (PositiveInt): The ID of the personal record.
+
+        Returns:
+            Optional[Any]: The personal record, if it exists.
+        """
+        row = self.table.rows.get(id)
+        return SimpleNamespace(**row) if row is not None else None
+
+    async def exists(self, db: AsyncSession, id: PositiveInt) -> bool:
+        """
+        Checks whether a personal record exists.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            id (PositiveInt): The ID of the personal record.
+
+        Returns:
+            bool: True if the record exists.
+        """
+        return id in self.table.rows
+
+    async def search(
+        self, db: AsyncSession, terms: str, limit: PositiveInt = 100
+    ) -> List[Any]:
+        """
+        Searches personal records by job title and professional summary.
+
+        Takes the FTS5 query built by utils.match_terms: every quoted word
+        must appear, those followed by `*` as a prefix. Words are compared
+        casefolded but not stemmed, and records are returned by ID.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            terms (str): The FTS5 query.
+            limit (PositiveInt): Maximum number of records. Defaults to 100.
+
+        Returns:
+            List[Any]: The matching records.
+        """
+        wanted: List[Tuple[str, bool]] = [
+            (word.replace('""', '"').casefold(), bool(star))
+            for word, star in _TERM.findall(terms)
+        ]
+        found = []
+        for id in self.table.ids.get(None, []):
+            row = self.table.rows[id]
+            words = _WORD.findall(
+                f"{row['job_title']} {row['professional_summary']}".casefold()
+            )
+            if all(
+                any(w.startswith(term) if prefix else w == term for w in words)
+                for term, prefix in wanted
+            ):
+                found.append(SimpleNamespace(**row))
+                if len(found) == limit:
+                    break
+        return found
+
+
+class InMemoryRowCountCrud:
+    """
+    RowCountRepository over the tables of an InMemoryStore.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def get_count(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> int:
+        """
+        Retrieves the number of rows of a table in one scope.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            name (str): The name of the table.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        table = self.store.tables.get(name)
+        return table.count(personal_id) if table else 0
+
+    async def get_version(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> int:
+        """
+        Retrieves the version stamp of a table in one scope.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            name (str): The name of the table.
+            personal_id (Optional[int]): ID of the profile, or of the personal
+                record for the personal table; None for the unscoped rows.
+
+        Returns:
+            int: The version, bumped on every write to the scope.
+        """
+        table = self.store.tables.get(name)
+        return table.versions.get(personal_id, 0) if table else 0
+
+    async def get_table_version(self, db: AsyncSession, name: str) -> int:
+        """
+        Retrieves the version stamp of a whole table.
+
+        Args:
+            db (AsyncSession): Unused; the rows are held in memory.
+            name (str): The name of the table.
+
+        Returns:
+            int: The version, bumped on every write to any scope.
+        """
+        table = self.store.tables.get(name)
+        return table.version if table else 0
@@ -1,13 +1,93 @@
-from .. import schemas, models
+from .. import schemas, models, database
+from typing import List, Optional
+from pydantic import PositiveInt
+from sqlalchemy import Row, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class PersonalCrud:
     @staticmethod
-    async def create(db: AsyncSession, personal: schemas.PersonalIn):
-        personal_dict = personal.model_dump()
-        personal = models.Personal(**personal_dict)
-        db.add(personal)
-        await db.commit()
-        await db.refresh(personal)
-        return personal
+    async def create(db: AsyncSession, personal: schemas.PersonalIn) -> Row:
+        query = (
+            insert(models.Personal)
+            .values(**personal.model_dump(mode="json"))
+            .returning(*models.Personal.__table__.columns)
+        )
+        result = await db.execute(query)
+        created_personal = result.one()
+        return created_personal
+
+    @staticmethod
+    async def get_first(db: AsyncSession) -> Optional[models.Personal]:
+        """
+        Retrieves the personal record with the lowest ID.
+
+        Args:
+            db (AsyncSession): A database session.
+
+        Returns:
+            Optional[models.Personal]: The personal record, if there is one.
+        """
+        query = select(models.Personal).order_by(models.Personal.id.asc()).limit(1)
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, id: PositiveInt) -> Optional[models.Personal]:
+        """
+        Retrieves a personal record by its ID.
+
+        Args:
+            db (AsyncSession): A database session.
+            id (PositiveInt): The ID of the personal record.
+
+        Returns:
+            Optional[models.Personal]: The personal record, if it exists.
+        """
+        query = select(models.Personal).where(models.Personal.id == id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def exists(db: AsyncSession, id: PositiveInt) -> bool:
+        """
+        Checks whether a personal record exists.
+
+        Args:
+            db (AsyncSession): A database session.
+            id (PositiveInt): The ID of the personal record.
+
+        Returns:
+            bool: True if the record exists.
+        """
+        query = select(models.Personal.id).where(models.Personal.id == id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    async def search(
+        db: AsyncSession, terms: str, limit: PositiveInt = 100
+    ) -> List[models.Personal]:
+        """
+        Searches personal records by job title and professional summary.
+
+        Args:
+            db (AsyncSession): A database session.
+            terms (str): An FTS5 query over `personal_fts`.
+            limit (PositiveInt): Maximum number of records. Defaults to 100.
+
+        Returns:
+            List[models.Personal]: The matching records, best match first.
+        """
+        query = (
+            select(models.Personal)
+            .join(
+                database.personal_fts,
+                database.personal_fts.c.rowid == models.Personal.id,
+            )
+            .where(database.personal_fts.c.personal_fts.match(terms))
+            .order_by(database.personal_fts.c.rank)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return list(result.scalars())
@@ -0,0 +1,95 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.sql import func
+from .. import models
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.sqlite import insert
+
+
+class RenderingCrud:
+    @staticmethod
+    async def get_content(
+        db: AsyncSession, format: str, section: str, personal_id: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Retrieves one stored rendering.
+
+        Args:
+            db (AsyncSession): A database session.
+            format (str): The format of the rendering.
+            section (str): The section of the rendering.
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+
+        Returns:
+            Optional[str]: The content, if it has been rendered.
+        """
+        query = select(models.Rendering.content).where(
+            models.Rendering.scope == (personal_id or 0),
+            models.Rendering.format == format,
+            models.Rendering.section == section,
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_all(
+        db: AsyncSession, personal_id: Optional[int] = None
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Retrieves every stored rendering of one resume.
+
+        Args:
+            db (AsyncSession): A database session.
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+
+        Returns:
+            Dict[Tuple[str, str], str]: The content, by format and section.
+        """
+        query = select(
+            models.Rendering.format, models.Rendering.section, models.Rendering.content
+        ).where(models.Rendering.scope == (personal_id or 0))
+        result = await db.execute(query)
+        return {(format, section): content for format, section, content in result}
+
+    @staticmethod
+    async def get_unrendered_profiles(db: AsyncSession, section: str) -> List[int]:
+        """
+        Lists the profiles without a stored rendering of a section.
+
+        Args:
+            db (AsyncSession): A database session.
+            section (str): The section of the rendering.
+
+        Returns:
+            List[int]: The IDs of the personal records, in ascending order.
+        """
+        rendered = select(models.Rendering.scope).where(
+            models.Rendering.section == section
+        )
+        query = (
+            select(models.Personal.id)
+            .where(models.Personal.id.not_in(rendered))
+            .order_by(models.Personal.id)
+        )
+        result = await db.execute(query)
+        return list(result.scalars())
+
+    @staticmethod
+    async def upsert(db: AsyncSession, renderings: List[dict]) -> None:
+        """
+        Inserts or replaces renderings with a single multi-row statement.
+
+        Args:
+            db (AsyncSession): A database session.
+            renderings (List[dict]): Rows with scope, format, section and content.
+        """
+        query = insert(models.Rendering).values(renderings)
+        query = query.on_conflict_do_update(
+            index_elements=[
+                models.Rendering.scope,
+                models.Rendering.format,
+                models.Rendering.section,
+            ],
+            set_={"content": query.excluded.content, "updated_at": func.now()},
+        )
+        await db.execute(query)
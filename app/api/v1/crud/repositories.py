@@ -0,0 +1,195 @@
+from .. import schemas, utils
+from typing import (
+    Any,
+    AsyncIterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+)
+from pydantic import PositiveInt
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class RowStream(Protocol):
+    """
+    Rows of a table read in chunks, as returned by `stream_all`.
+    """
+
+    def partitions(self) -> AsyncIterator[Sequence[Any]]: ...
+
+
+async def read_all(repository: Any, db: AsyncSession, **kwargs: Any) -> List[Any]:
+    """
+    Reads every row of a repository through its `stream_all`.
+
+    Args:
+        repository (Any): A skill or language repository.
+        db (AsyncSession): A database session.
+        **kwargs: Passed to `stream_all`, e.g. personal_id.
+
+    Returns:
+        List[Any]: The rows, in ID order.
+    """
+    result = await repository.stream_all(db=db, **kwargs)
+    return [row async for rows in result.partitions() for row in rows]
+
+
+class SkillRepository(Protocol):
+    """
+    Storage of the skills, implemented by SkillCrud and InMemorySkillCrud.
+
+    Names are unique per profile, ignoring case and whitespace; a duplicate
+    raises IntegrityError. Rows are returned as objects with one attribute
+    per column, pages and search results as SkillRow dicts.
+    """
+
+    async def create(
+        self,
+        db: AsyncSession,
+        skill: schemas.SkillIn,
+        personal_id: Optional[int] = None,
+    ) -> Any: ...
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        skills: List[schemas.SkillIn],
+        personal_id: Optional[int] = None,
+    ) -> List[Any]: ...
+
+    async def get_all(
+        self,
+        db: AsyncSession,
+        page: Optional[PositiveInt] = 1,
+        items_per_page: Optional[PositiveInt] = 100,
+        after_id: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.SkillRow]: ...
+
+    async def get_by_name(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> Any: ...
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        limit: PositiveInt = 100,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.SkillRow]: ...
+
+    async def stream_all(
+        self,
+        db: AsyncSession,
+        chunk_size: PositiveInt = 500,
+        personal_id: Optional[int] = None,
+    ) -> RowStream: ...
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        id: PositiveInt,
+        skill: schemas.SkillUpdate,
+        personal_id: Optional[int] = None,
+    ) -> Any: ...
+
+
+class LanguageRepository(Protocol):
+    """
+    Storage of the languages, implemented by LanguageCrud and
+    InMemoryLanguageCrud.
+
+    Same semantics as SkillRepository; languages can also be deleted.
+    """
+
+    async def create(
+        self,
+        db: AsyncSession,
+        language: schemas.LanguageIn,
+        personal_id: Optional[int] = None,
+    ) -> Any: ...
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        languages: List[schemas.LanguageIn],
+        personal_id: Optional[int] = None,
+    ) -> List[Any]: ...
+
+    async def get_all(
+        self,
+        db: AsyncSession,
+        page: Optional[PositiveInt] = 1,
+        items_per_page: Optional[PositiveInt] = 100,
+        after_id: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.LanguageRow]: ...
+
+    async def get_by_name(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> Any: ...
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        limit: PositiveInt = 100,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.LanguageRow]: ...
+
+    async def stream_all(
+        self,
+        db: AsyncSession,
+        chunk_size: PositiveInt = 500,
+        personal_id: Optional[int] = None,
+    ) -> RowStream: ...
+
+    async def delete_by_id(
+        self, db: AsyncSession, id: PositiveInt, personal_id: Optional[int] = None
+    ) -> None: ...
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        id: PositiveInt,
+        language: schemas.LanguageUpdate,
+        personal_id: Optional[int] = None,
+    ) -> Any: ...
+
+
+class PersonalRepository(Protocol):
+    """
+    Storage of the personal records, implemented by PersonalCrud and
+    InMemoryPersonalCrud.
+    """
+
+    async def create(self, db: AsyncSession, personal: schemas.PersonalIn) -> Any: ...
+
+    async def get_first(self, db: AsyncSession) -> Optional[Any]: ...
+
+    async def get_by_id(self, db: AsyncSession, id: PositiveInt) -> Optional[Any]: ...
+
+    async def exists(self, db: AsyncSession, id: PositiveInt) -> bool: ...
+
+    async def search(
+        self, db: AsyncSession, terms: str, limit: PositiveInt = 100
+    ) -> List[Any]: ...
+
+
+class RowCountRepository(Protocol):
+    """
+    Number of rows and version stamp of the tables, per profile.
+    """
+
+    async def get_count(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> int: ...
+
+    async def get_version(
+        self, db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> int: ...
+
+    async def get_table_version(self, db: AsyncSession, name: str) -> int: ...
@@ -0,0 +1,70 @@
+from typing import Optional
+from sqlalchemy import func, select
+from .. import models
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class RowCountCrud:
+    @staticmethod
+    async def get_count(
+        db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> int:
+        """
+        Retrieves the number of rows of a table in one scope.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the table.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped rows.
+
+        Returns:
+            int: The number of rows, maintained by triggers.
+        """
+        query = select(models.RowCount.count).where(
+            models.RowCount.name == name,
+            models.RowCount.scope == (personal_id or 0),
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none() or 0
+
+    @staticmethod
+    async def get_version(
+        db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> int:
+        """
+        Retrieves the version stamp of a table in one scope.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the table.
+            personal_id (Optional[int]): ID of the profile, or of the personal
+                record for the personal table; None for the unscoped rows.
+
+        Returns:
+            int: The version, bumped by triggers on every write to the scope.
+        """
+        query = select(models.RowCount.version).where(
+            models.RowCount.name == name,
+            models.RowCount.scope == (personal_id or 0),
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none() or 0
+
+    @staticmethod
+    async def get_table_version(db: AsyncSession, name: str) -> int:
+        """
+        Retrieves the version stamp of a whole table.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the table.
+
+        Returns:
+            int: The sum of the versions of its scopes, which grows with every
+            write to any of them.
+        """
+        query = select(func.coalesce(func.sum(models.RowCount.version), 0)).where(
+            models.RowCount.name == name
+        )
+        result = await db.execute(query)
+        return result.scalar_one()
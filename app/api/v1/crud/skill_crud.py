@@ -1,86 +1,307 @@
-from typing import Optional
-from sqlalchemy import select
-from .. import models, schemas
+from typing import List, Optional
+from sqlalchemy import Row, select, update, func, union
+from .. import schemas, models, utils, database
 from pydantic import PositiveInt
 from fastapi import HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncScalarResult
+from sqlalchemy.dialects.sqlite import insert
+
+
+def _in_profile(personal_id: Optional[int]):
+    """
+    Filters skills to one profile, or to the unscoped skills served by the
+    top-level routes when `personal_id` is None.
+    """
+    if personal_id is None:
+        return models.Skill.personal_id.is_(None)
+    return models.Skill.personal_id == personal_id
 
 
 class SkillCrud:
     @staticmethod
-    async def create(db: AsyncSession, skill: schemas.SkillIn):
+    async def create(
+        db: AsyncSession, skill: schemas.SkillIn, personal_id: Optional[int] = None
+    ) -> Row:
         """
         Creates a skill in the database.
 
+        The row is inserted and read back with a single INSERT ... RETURNING
+        statement.
+
         Args:
             db (AsyncSession): A database session.
             skill (schemas.SkillIn): The skill to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
 
         Returns:
-            models.Skill: The created skill.
+            Row: The created skill, with its generated columns.
         """
-        skill_dict = skill.model_dump()
-        skill = models.Skill(**skill_dict)
-        db.add(skill)
-        await db.commit()
-        await db.refresh(skill)
-        return skill
+        query = (
+            insert(models.Skill)
+            .values(
+                **skill.model_dump(),
+                name_key=utils.normalize_name(skill.name),
+                personal_id=personal_id,
+            )
+            .returning(*models.Skill.__table__.columns)
+        )
+        result = await db.execute(query)
+        created_skill = result.one()
+        return created_skill
+
+    @staticmethod
+    async def bulk_create(
+        db: AsyncSession,
+        skills: List[schemas.SkillIn],
+        personal_id: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Creates many skills with a single multi-row INSERT in one transaction.
+
+        Rows whose name key already exists, in the table or earlier in the
+        batch, are skipped instead of aborting the statement.
+
+        Args:
+            db (AsyncSession): A database session.
+            skills (List[schemas.SkillIn]): The skills to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            List[Row]: The skills that were created.
+        """
+        query = (
+            insert(models.Skill)
+            .values(
+                [
+                    dict(
+                        **skill.model_dump(),
+                        name_key=utils.normalize_name(skill.name),
+                        personal_id=personal_id,
+                    )
+                    for skill in skills
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(*models.Skill.__table__.columns)
+        )
+        result = await db.execute(query)
+        created = result.all()
+        return created
 
     @staticmethod
     async def get_all(
         db: AsyncSession,
         page: Optional[PositiveInt] = 1,
         items_per_page: Optional[PositiveInt] = 100,
-    ):
+        after_id: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.SkillRow]:
         """
         Retrieves all skills from the database.
 
+        When `after_id` is given the page is located by seeking on the primary
+        key index instead of skipping `(page - 1) * items_per_page` rows.
+
         Args:
             db (AsyncSession): A database session.
             page (Optional[PositiveInt]): Page number. Defaults to 1.
             items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+            after_id (Optional[int]): Return skills with an ID greater than this one.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
 
         Returns:
-            List[models.Skill]: List of skills.
+            List[schemas.SkillRow]: List of skills, as plain dicts.
         """
-        page = page or 1
-        items_per_page = items_per_page or 100
-        offset = (page - 1) * items_per_page
+        items_per_page = utils.clamp_items_per_page(items_per_page)
+        columns = [
+            getattr(models.Skill, field) for field in schemas.SkillRow.__annotations__
+        ]
         query = (
-            select(models.Skill)
+            select(*columns)
+            .where(_in_profile(personal_id))
             .order_by(models.Skill.id.asc())
-            .offset(offset)
-            .limit(items_per_page)
+        )
+        if after_id is not None:
+            query = query.where(models.Skill.id > after_id)
+        else:
+            page = page or 1
+            query = query.offset((page - 1) * items_per_page)
+        query = query.limit(items_per_page)
+        result = await db.execute(query)
+        return [row._asdict() for row in result]
+
+    @staticmethod
+    async def get_by_name(
+        db: AsyncSession, name: str, personal_id: Optional[int] = None
+    ) -> Row:
+        """
+        Retrieves a skill by name, ignoring case and whitespace.
+
+        The lookup seeks on the unique index over the normalized name key.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the skill.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            Row: The skill.
+
+        Raises:
+            HTTPException: If the skill does not exist (404).
+        """
+        query = select(*models.Skill.__table__.columns).where(
+            _in_profile(personal_id),
+            models.Skill.name_key == utils.normalize_name(name),
+        )
+        result = await db.execute(query)
+        skill = result.one_or_none()
+        if skill is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Skill not found.",
+            )
+        return skill
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        limit: PositiveInt = 100,
+        personal_id: Optional[int] = None,
+    ) -> List[schemas.SkillRow]:
+        """
+        Searches skills by name, ignoring case.
+
+        Queries of at least three characters, once surrounding and repeated
+        whitespace is dropped, are answered from the trigram index in
+        `skills_fts`. Shorter ones cannot be expressed as a trigram: prefixes
+        seek on the name key index and substrings scan the keys.
+        The first `limit` matches in index order, plus the exact match, are
+        then ranked with shorter names first, so exact and prefix matches
+        lead without sorting every match of a common trigram.
+
+        Args:
+            db (AsyncSession): A database session.
+            q (str): Text to look for.
+            mode (utils.SearchMode): Match names starting with `q`, or containing it.
+            limit (PositiveInt): Maximum number of skills. Defaults to 100.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            List[schemas.SkillRow]: The matching skills, as plain dicts.
+        """
+        name = models.Skill.name
+        columns = [
+            getattr(models.Skill, field) for field in schemas.SkillRow.__annotations__
+        ]
+        # Paths are chosen on the normalized text: "  py " is two characters,
+        # too short for a trigram.
+        text = " ".join(q.split())
+        key = utils.normalize_name(q)
+        candidates = select(models.Skill.id).where(_in_profile(personal_id))
+        if len(text) >= utils.MIN_TRIGRAM_LENGTH:
+            phrase = utils.quote_phrase(text)
+            if mode == utils.SearchMode.PREFIX:
+                phrase = "^" + phrase
+            candidates = candidates.join(
+                database.skills_fts, database.skills_fts.c.rowid == models.Skill.id
+            ).where(database.skills_fts.c.name.match(phrase))
+        else:
+            if mode == utils.SearchMode.PREFIX:
+                candidates = candidates.where(
+                    models.Skill.name_key >= key,
+                    models.Skill.name_key < key + "\U0010ffff",
+                )
+            else:
+                candidates = candidates.where(
+                    func.instr(models.Skill.name_key, key) > 0
+                )
+        exact = select(models.Skill.id).where(
+            _in_profile(personal_id), models.Skill.name_key == key
+        )
+        ids = union(select(candidates.limit(limit).subquery().c.id), exact).subquery()
+        query = (
+            select(*columns)
+            .join(ids, ids.c.id == models.Skill.id)
+            .order_by(func.length(name), name)
+            .limit(limit)
         )
         result = await db.execute(query)
-        return result.scalars().all()
+        return [row._asdict() for row in result]
+
+    @staticmethod
+    async def stream_all(
+        db: AsyncSession,
+        chunk_size: PositiveInt = 500,
+        personal_id: Optional[int] = None,
+    ) -> AsyncScalarResult[models.Skill]:
+        """
+        Streams all skills from the database through a server-side cursor.
+
+        Args:
+            db (AsyncSession): A database session.
+            chunk_size (PositiveInt): Rows fetched per round trip. Defaults to 500.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            AsyncScalarResult[models.Skill]: An async result over the skills.
+        """
+        query = (
+            select(models.Skill)
+            .where(_in_profile(personal_id))
+            .order_by(models.Skill.id.asc())
+            .execution_options(yield_per=chunk_size)
+        )
+        return await db.stream_scalars(query)
 
     @staticmethod
     async def update_by_id(
-        db: AsyncSession, id: PositiveInt, skill: schemas.SkillUpdate
-    ) -> models.Skill:
+        db: AsyncSession,
+        id: PositiveInt,
+        skill: schemas.SkillUpdate,
+        personal_id: Optional[int] = None,
+    ) -> Row:
         """
         Updates a skill by its ID in the database.
 
+        The row is updated and read back with a single UPDATE ... RETURNING
+        statement; an empty update only reads the row.
+
         Args:
             db (AsyncSession): A database session.
             id (PositiveInt): The ID of the skill to update.
             skill (schemas.SkillUpdate): The skill update data.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
 
         Returns:
-            models.Skill: The updated skill.
+            Row: The updated skill.
 
         Raises:
             HTTPException: If the skill does not exist (404).
         """
         update_data = skill.model_dump(exclude_unset=True)
-        skill = await db.get(models.Skill, id)
-        if not skill:
+        if update_data.get("name") is not None:
+            update_data["name_key"] = utils.normalize_name(update_data["name"])
+        columns = models.Skill.__table__.columns
+        if update_data:
+            query = (
+                update(models.Skill)
+                .where(models.Skill.id == id, _in_profile(personal_id))
+                .values(**update_data)
+                .returning(*columns)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            query = select(*columns).where(
+                models.Skill.id == id, _in_profile(personal_id)
+            )
+        result = await db.execute(query)
+        updated_skill = result.one_or_none()
+        if updated_skill is None:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Language not found."
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Skill not found.",
             )
-        for field, value in update_data.items():
-            setattr(skill, field, value)
-        await db.commit()
-        await db.refresh(skill)
-        return skill
+        return updated_skill
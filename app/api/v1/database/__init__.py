@@ -1,3 +1,63 @@
-from .database import get_db, base, create_tables
+from .. import config
+from .database import (
+    get_db,
+    get_read_db,
+    read_snapshot,
+    write_hook,
+    on_commit,
+    on_rollback,
+    before_commit,
+    run_before_commit,
+    run_on_commit,
+    run_on_rollback,
+    base,
+    migrate,
+    prewarm_pool,
+    pool_stats,
+    engine,
+    read_engine,
+    Session,
+    ReadSession,
+)
+from .stats import (
+    TransactionStats,
+    engine_transaction_stats,
+    request_transaction_stats,
+)
+from .search import skills_fts, languages_fts, personal_fts
+from .coalescer import WriteCoalescer
 
-__all__ = ["get_db", "base", "create_tables"]
+write_coalescer = WriteCoalescer(
+    Session,
+    window_ms=config.settings.write_batch_window_ms,
+    max_batch_size=config.settings.write_batch_max_size,
+)
+
+__all__ = [
+    "get_db",
+    "get_read_db",
+    "read_snapshot",
+    "write_hook",
+    "on_commit",
+    "on_rollback",
+    "before_commit",
+    "run_before_commit",
+    "run_on_commit",
+    "run_on_rollback",
+    "base",
+    "migrate",
+    "prewarm_pool",
+    "pool_stats",
+    "engine",
+    "read_engine",
+    "Session",
+    "ReadSession",
+    "TransactionStats",
+    "engine_transaction_stats",
+    "request_transaction_stats",
+    "skills_fts",
+    "languages_fts",
+    "personal_fts",
+    "WriteCoalescer",
+    "write_coalescer",
+]
@@ -0,0 +1,146 @@
+import asyncio
+from .. import metrics
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from .database import run_before_commit, run_on_commit, run_on_rollback, write_hook
+from .stats import TransactionStats, request_transaction_stats
+
+T = TypeVar("T")
+Write = Callable[[AsyncSession], Awaitable[T]]
+Pending = Tuple[Write, asyncio.Future, Optional[TransactionStats]]
+
+
+def _with_hook(
+    write: Write[T], hook: Callable[[AsyncSession], Awaitable[None]]
+) -> Write[T]:
+    async def hooked(db: AsyncSession) -> T:
+        result = await write(db)
+        await hook(db)
+        return result
+
+    return hooked
+
+
+class WriteCoalescer:
+    """
+    Applies concurrent writes in shared transactions (group commit).
+
+    Writes submitted while a batch is being applied, or within `window_ms`
+    of the first pending one, are applied together: one BEGIN IMMEDIATE,
+    one SAVEPOINT per write, one COMMIT. A write that raises only rolls back
+    its own savepoint, and runs the on_rollback callbacks it registered, and
+    its caller gets its own exception; every other caller gets its own
+    result once the shared commit succeeded. Batches are applied one at a
+    time, as SQLite only has one writer anyway, so under load the batch size
+    grows with the queue instead of every request waiting for the write
+    lock. The shared transaction is counted in the transaction stats of
+    every request with a write in the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        window_ms: float = 2,
+        max_batch_size: int = 64,
+    ):
+        self.session_factory = session_factory
+        self.window_seconds = window_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.batches = 0
+        self.writes = 0
+        self._pending: List[Pending] = []
+        self._full = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, write: Write[T]) -> T:
+        """
+        Queues a write and waits until it is committed.
+
+        The request's database.write_hook and transaction stats are captured
+        here, as the batch runs in another task; the hook runs in the write's
+        savepoint after it.
+
+        Args:
+            write (Write[T]): Coroutine function performing the write on the given session.
+
+        Returns:
+            T: The result of the write, once its transaction has committed.
+
+        Raises:
+            Exception: Whatever the write raised, or the error of the shared commit.
+        """
+        hook = write_hook.get()
+        if hook is not None:
+            write = _with_hook(write, hook)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((write, future, request_transaction_stats.get()))
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        # The task inherits the context of the request that started it; its
+        # statements and transactions are the batch's, not that request's.
+        metrics.request_query_stats.set(None)
+        request_transaction_stats.set(None)
+        while self._pending:
+            if len(self._pending) < self.max_batch_size and self.window_seconds > 0:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.window_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            self._full.clear()
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            await self._apply(batch)
+
+    async def _apply(self, batch: List[Pending]) -> None:
+        results = []
+        failure: Optional[Exception] = None
+        batch_stats = TransactionStats()
+        token = request_transaction_stats.set(batch_stats)
+        try:
+            async with self.session_factory() as db:
+                try:
+                    conn = await db.connection()
+                    await conn.exec_driver_sql("BEGIN IMMEDIATE")
+                    for write, future, _ in batch:
+                        savepoint = len(db.info.get("on_rollback", ()))
+                        try:
+                            async with db.begin_nested():
+                                results.append((future, await write(db), None))
+                        except Exception as e:
+                            run_on_rollback(db, savepoint)
+                            results.append((future, None, e))
+                    await run_before_commit(db)
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    run_on_rollback(db)
+                    db.info.pop("on_commit", None)
+                    failure = e
+                finally:
+                    db.info.pop("before_commit", None)
+        finally:
+            request_transaction_stats.reset(token)
+        # Counted before any caller resumes, so its response reports it.
+        for stats in {id(s): s for _, _, s in batch if s is not None}.values():
+            stats.add(batch_stats)
+        if failure is not None:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(failure)
+            return
+        run_on_commit(db)
+        self.batches += 1
+        self.writes += len(batch)
+        metrics.db_write_batch_size.observe(len(batch))
+        for future, result, error in results:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
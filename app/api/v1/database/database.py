@@ -1,31 +1,362 @@
+from .. import config, metrics
+from . import stats, migrations
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
 
-DATABASE_URL = "sqlite+aiosqlite:///app/api/v1/database.db"
+DATABASE_URL = config.settings.database_url
+
+SQLITE_PRAGMAS = (
+    f"PRAGMA busy_timeout={config.settings.database_busy_timeout_ms}",
+    f"PRAGMA cache_size=-{config.settings.database_cache_size_kib}",
+    f"PRAGMA mmap_size={config.settings.database_mmap_size}",
+    "PRAGMA temp_store=MEMORY",
+)
+SQLITE_WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+)
+SQLITE_READ_PRAGMAS = ("PRAGMA query_only=ON",)
+
+
+def _is_file_database(url: str) -> bool:
+    database = make_url(url).database
+    return database not in (None, "", ":memory:") and "mode=memory" not in url
+
+
+def _read_only_url(url: str) -> URL:
+    """
+    Builds the URL of the read engine: the same SQLite file, opened through
+    a `mode=ro` URI so its connections can never write.
+    """
+    url = make_url(url)
+    return url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    )
+
+
+def _engine_options(url: str, pool: str, pool_size: int, max_overflow: int) -> dict:
+    """
+    Builds the keyword arguments for create_async_engine from the settings.
+
+    In-memory SQLite databases use a single static connection, so pool sizing
+    only applies to file databases; their pool records checkout waits under
+    the name `pool`.
+    """
+    options = {"echo": config.settings.database_echo}
+    if not _is_file_database(url):
+        return options
+    options.update(
+        poolclass=stats.InstrumentedQueuePool,
+        pool_logging_name=pool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=config.settings.database_pool_timeout,
+    )
+    return options
+
+
+def _install_pragmas(engine: AsyncEngine, pragmas: Sequence[str]) -> None:
+    """
+    Runs the given pragmas on every new SQLite connection of `engine`.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        if engine.dialect.name != "sqlite":
+            return
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+# SQLite has a single writer, so writes go through one connection and queue
+# for it in the pool instead of on the file lock. WAL lets readers proceed
+# while that writer commits, and busy_timeout makes a connection blocked by
+# another process wait for the lock instead of failing with "database is
+# locked".
+engine = create_async_engine(
+    DATABASE_URL, **_engine_options(DATABASE_URL, "write", 1, 0)
+)
+_install_pragmas(engine, SQLITE_PRAGMAS + SQLITE_WRITE_PRAGMAS)
+
+# Reads use their own pool of read-only connections, each served by its own
+# aiosqlite thread, so they neither wait behind writes nor take their lock.
+# An in-memory database exists only in its one connection and is shared.
+if _is_file_database(DATABASE_URL):
+    read_engine = create_async_engine(
+        _read_only_url(DATABASE_URL),
+        **_engine_options(
+            DATABASE_URL,
+            "read",
+            config.settings.database_pool_size,
+            config.settings.database_max_overflow,
+        ),
+    )
+    _install_pragmas(read_engine, SQLITE_PRAGMAS + SQLITE_READ_PRAGMAS)
+else:
+    read_engine = engine
 
-engine = create_async_engine(url=DATABASE_URL)
 base = declarative_base()
 Session = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+ReadSession = async_sessionmaker(
+    bind=read_engine, autoflush=False, expire_on_commit=False
+)
+ENGINES = {"write": engine, "read": read_engine}
+for _engine in {engine, read_engine}:
+    stats.install_transaction_counters(_engine.sync_engine)
+    if config.settings.metrics_enabled:
+        stats.install_query_metrics(_engine.sync_engine)
+
+
+def _pools() -> Dict[str, stats.InstrumentedQueuePool]:
+    return {
+        name: pool_engine.pool
+        for name, pool_engine in ENGINES.items()
+        if isinstance(pool_engine.pool, stats.InstrumentedQueuePool)
+    }
+
+
+def pool_stats() -> Dict[str, dict]:
+    """
+    Reports the usage of the read and write connection pools.
+
+    Returns:
+        Dict[str, dict]: The counters of each pool, see InstrumentedQueuePool.usage.
+    """
+    return {name: pool.usage() for name, pool in _pools().items()}
+
+
+def _collect_pool_metrics() -> None:
+    for name, pool in _pools().items():
+        metrics.db_pool_checked_out.set(pool.checkedout(), name)
+
+
+if config.settings.metrics_enabled:
+    metrics.registry.add_collector(_collect_pool_metrics)
+
+
+async def migrate() -> List[str]:
+    """
+    Brings the database schema up to date.
+
+    An up-to-date database costs a single read of `schema_version`.
+    Otherwise the pending migrations run in one transaction that takes the
+    write lock up front, so workers starting together apply them once, one
+    after the other, instead of racing.
+
+    Returns:
+        List[str]: The names of the migrations that were applied.
+    """
+    async with engine.connect() as conn:
+        version = await conn.run_sync(migrations.current_version)
+    if version >= migrations.LATEST_VERSION:
+        return []
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+        applied = await conn.run_sync(migrations.apply_migrations, base.metadata)
+        await conn.commit()
+    return applied
+
+
+async def prewarm_pool(connections: int) -> int:
+    """
+    Opens pooled connections ahead of the first requests.
+
+    Each new connection runs the SQLite pragmas once; opening them at startup
+    keeps that cost out of the first requests.
+
+    Args:
+        connections (int): The number of connections to open in each pool, capped at its size.
+
+    Returns:
+        int: The number of connections opened.
+    """
+    opened = []
+    for name, pool in _pools().items():
+        pool_engine = ENGINES[name]
+        opened += await asyncio.gather(
+            *(pool_engine.connect() for _ in range(min(connections, pool.size())))
+        )
+    for conn in opened:
+        await conn.close()
+    return len(opened)
 
 
-async def create_tables():
+# Work that the writes of the current request must commit with, e.g. the
+# reservation of its Idempotency-Key. get_db runs it before its commit; the
+# write coalescer captures it on submit and runs it in the write's savepoint.
+write_hook: ContextVar[Optional[Callable[[AsyncSession], Awaitable[None]]]] = (
+    ContextVar("write_hook", default=None)
+)
+
+
+def on_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Registers a callback to run once the session's transaction has committed.
+
+    Args:
+        db (AsyncSession): A session yielded by get_db.
+        callback (Callable[[], None]): The callback, e.g. a cache invalidation.
+    """
+    db.info.setdefault("on_commit", []).append(callback)
+
+
+def before_commit(
+    db: AsyncSession,
+    key: Hashable,
+    callback: Callable[[AsyncSession], Awaitable[None]],
+) -> None:
+    """
+    Registers a coroutine to run in the session's transaction just before it
+    commits.
+
+    Callbacks registered under the same key run once, so work requested by
+    several writes of one transaction, e.g. a re-rendering, is done once.
+
+    Args:
+        db (AsyncSession): A session yielded by get_db or used by the write coalescer.
+        key (Hashable): Identity of the work.
+        callback (Callable[[AsyncSession], Awaitable[None]]): The work, given the session.
+    """
+    db.info.setdefault("before_commit", {})[key] = callback
+
+
+def on_rollback(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Registers a callback undoing a change made outside the database, e.g. in
+    memory, if the session's transaction or the write's savepoint rolls back.
+
+    Args:
+        db (AsyncSession): A session yielded by get_db or used by the write coalescer.
+        callback (Callable[[], None]): The undo of the change.
+    """
+    db.info.setdefault("on_rollback", []).append(callback)
+
+
+async def run_before_commit(db: AsyncSession) -> None:
+    """
+    Runs the callbacks registered with before_commit.
+    """
+    for callback in db.info.pop("before_commit", {}).values():
+        await callback(db)
+
+
+def run_on_commit(db: AsyncSession) -> None:
     """
-    Create tables in the database using SQLAlchemy's declarative_base.
+    Runs the callbacks registered with on_commit, once the commit succeeded.
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(base.metadata.create_all)
+    db.info.pop("on_rollback", None)
+    for callback in db.info.pop("on_commit", []):
+        callback()
+
+
+def run_on_rollback(db: AsyncSession, since: int = 0) -> None:
+    """
+    Runs the callbacks registered with on_rollback, latest first.
+
+    Args:
+        db (AsyncSession): The session that rolled back.
+        since (int): Number of callbacks to keep, e.g. those registered
+            before a savepoint that rolled back. Defaults to 0, for all.
+    """
+    callbacks = db.info.get("on_rollback", [])
+    while len(callbacks) > since:
+        callbacks.pop()()
 
 
 async def get_db():
     """
-    Async context manager that yields a database session.
+    Async context manager that yields a unit-of-work database session.
+
+    CRUD methods only execute statements; the whole request is committed
+    once here, or rolled back if the handler raises. The request's
+    write_hook and the callbacks registered with before_commit run just
+    before the commit, those registered with on_commit after it succeeded
+    and those registered with on_rollback after a rollback.
+
+    Routes should depend on it with `scope="function"` so the commit happens
+    before the response is sent.
     """
     db = Session()
     try:
         yield db
+        hook = write_hook.get()
+        if hook is not None:
+            await hook(db)
+        await run_before_commit(db)
         await db.commit()
     except Exception:
         await db.rollback()
+        run_on_rollback(db)
         raise
+    else:
+        run_on_commit(db)
+    finally:
+        db.info.pop("before_commit", None)
+        db.info.pop("on_commit", None)
+        db.info.pop("on_rollback", None)
+        await db.close()
+
+
+async def get_read_db():
+    """
+    Async context manager that yields a read-only database session.
+
+    The session is bound to the read engine, whose connections are opened
+    read-only, so GET requests never wait for the write connection and
+    cannot write by mistake; whatever it read is released when the session
+    closes.
+    """
+    db = ReadSession()
+    try:
+        yield db
     finally:
         await db.close()
+
+
+@asynccontextmanager
+async def read_snapshot(
+    session_factory: async_sessionmaker = ReadSession,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Async context manager that yields a read session seeing one snapshot.
+
+    The driver only opens transactions for writes, so the statements of a
+    plain read session each see the latest commit. Here a read transaction
+    is begun explicitly, and every statement sees the database as of the
+    first one, however many writes commit in between.
+
+    Args:
+        session_factory (async_sessionmaker): Factory of the read session.
+    """
+    async with session_factory() as db:
+        if _is_file_database(DATABASE_URL):
+            conn = await db.connection()
+            await conn.exec_driver_sql("BEGIN")
+        try:
+            yield db
+        finally:
+            await db.rollback()
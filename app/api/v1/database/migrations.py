@@ -0,0 +1,260 @@
+from .. import utils
+from . import triggers, search
+from typing import Callable, List, Tuple
+from sqlalchemy import MetaData, Table
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+
+NAME_KEY_TABLES = ("skills", "languages")
+IDEMPOTENCY_TABLE = "idempotency_keys"
+CHANGE_LOG_TABLE = "change_log"
+RENDERINGS_TABLE = "renderings"
+TABLE_VERSIONS_TABLE = "table_versions"
+
+SCHEMA_VERSION_DDL = (
+    "CREATE TABLE IF NOT EXISTS schema_version ("
+    "version INTEGER NOT NULL PRIMARY KEY, "
+    "name VARCHAR NOT NULL, "
+    "applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+)
+
+
+def add_name_keys(conn: Connection) -> None:
+    """
+    Adds and fills the `name_key` column of tables created before it existed.
+
+    Rows whose names share a key, e.g. "Python" and "python", are
+    deduplicated by keeping the oldest one, so the unique index can be
+    created. Stored renderings are dropped when rows were removed and are
+    rebuilt at startup.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+    """
+    removed = 0
+    for table in NAME_KEY_TABLES:
+        columns = {
+            row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")
+        }
+        if "name_key" in columns:
+            continue
+        conn.exec_driver_sql(
+            f"ALTER TABLE {table} ADD COLUMN name_key VARCHAR NOT NULL DEFAULT ''"
+        )
+        rows = conn.exec_driver_sql(f"SELECT id, name FROM {table} ORDER BY id").all()
+        keys, duplicates, updates = set(), [], []
+        for id, name in rows:
+            key = utils.normalize_name(name)
+            if key in keys:
+                duplicates.append((id,))
+            else:
+                keys.add(key)
+                updates.append((key, id))
+        if duplicates:
+            conn.exec_driver_sql(f"DELETE FROM {table} WHERE id = ?", duplicates)
+            removed += len(duplicates)
+        if updates:
+            conn.exec_driver_sql(
+                f"UPDATE {table} SET name_key = ? WHERE id = ?", updates
+            )
+        conn.exec_driver_sql(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{table}_name_key "
+            f"ON {table} (name_key)"
+        )
+    if removed:
+        conn.exec_driver_sql("DELETE FROM renderings")
+
+
+def _rebuild_table(conn: Connection, table: Table) -> None:
+    """
+    Recreates `table` with its current definition, keeping its rows.
+
+    SQLite cannot drop a constraint or add a foreign key in place, so the
+    table is created under a temporary name, filled, swapped in and given
+    its indexes. Triggers on the old table are dropped with it and must be
+    created again afterwards.
+    """
+    temporary = f"{table.name}_rebuild"
+    ddl = str(CreateTable(table).compile(conn))
+    conn.exec_driver_sql(
+        ddl.replace(f"CREATE TABLE {table.name} ", f"CREATE TABLE {temporary} ", 1)
+    )
+    existing = {
+        row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")
+    }
+    columns = ", ".join(c.name for c in table.columns if c.name in existing)
+    conn.exec_driver_sql(
+        f"INSERT INTO {temporary} ({columns}) SELECT {columns} FROM {table.name}"
+    )
+    conn.exec_driver_sql(f"DROP TABLE {table.name}")
+    conn.exec_driver_sql(f"ALTER TABLE {temporary} RENAME TO {table.name}")
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def add_personal_scope(conn: Connection, metadata: MetaData) -> None:
+    """
+    Scopes the skills and languages of databases created before profiles.
+
+    The tables are rebuilt with the `personal_id` foreign key and with name
+    uniqueness moved from the global `name` constraint to the per-profile
+    name key indexes. Existing rows keep `personal_id` NULL, the scope of
+    the top-level skill and language routes.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+        metadata (MetaData): The metadata holding the current table definitions.
+    """
+    for name in NAME_KEY_TABLES:
+        columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({name})")}
+        if "personal_id" not in columns:
+            _rebuild_table(conn, metadata.tables[name])
+
+
+def create_change_log(conn: Connection, metadata: MetaData) -> None:
+    """
+    Creates the `change_log` table and the triggers that append to it.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+        metadata (MetaData): The metadata holding the current table definitions.
+    """
+    metadata.tables[CHANGE_LOG_TABLE].create(conn, checkfirst=True)
+    for statement in triggers.change_log_trigger_statements():
+        conn.exec_driver_sql(statement)
+
+
+def add_scope_versions(conn: Connection) -> None:
+    """
+    Adds the per-scope `version` of `row_counts` and the triggers bumping it.
+
+    The row count triggers are recreated, so the counts are recomputed once
+    and updates and personal records are tracked as well.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+    """
+    triggers.drop_row_count_triggers(conn)
+    triggers.create_row_count_triggers(conn)
+
+
+def scope_renderings(conn: Connection, metadata: MetaData) -> None:
+    """
+    Recreates `renderings` keyed by profile as well as format and section.
+
+    Renderings are derived data, rebuilt at startup, so the table is
+    dropped rather than migrated.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+        metadata (MetaData): The metadata holding the current table definitions.
+    """
+    columns = {
+        row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({RENDERINGS_TABLE})")
+    }
+    if "scope" not in columns:
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {RENDERINGS_TABLE}")
+        metadata.tables[RENDERINGS_TABLE].create(conn)
+
+
+def drop_table_versions(conn: Connection) -> None:
+    """
+    Drops `table_versions` and the triggers that bumped it on every write.
+
+    The per-scope versions of `row_counts` replace it: scope 0 holds the
+    version of the unscoped rows and the sum of a table's scopes grows with
+    every write to it, so one set of triggers keeps every version.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+    """
+    for table in triggers.COUNTED_TABLES:
+        for operation in ("insert", "update", "delete"):
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {table}_{operation}_version")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {TABLE_VERSIONS_TABLE}")
+
+
+Migration = Tuple[int, str, Callable[[Connection, MetaData], None]]
+
+# Applied in order, each at most once per database. Migration 1 creates the
+# current schema, so every later migration must also be a no-op on a
+# database it created; append new entries, never renumber existing ones.
+MIGRATIONS: Tuple[Migration, ...] = (
+    (1, "create tables", lambda conn, metadata: metadata.create_all(conn)),
+    (2, "add name keys", lambda conn, metadata: add_name_keys(conn)),
+    (3, "add personal scope", add_personal_scope),
+    # Created `table_versions` and its triggers, which migration 11 drops;
+    # kept as a no-op so the numbers stay stable.
+    (4, "create version triggers", lambda conn, metadata: None),
+    (
+        5,
+        "create row count triggers",
+        lambda conn, metadata: triggers.create_row_count_triggers(conn),
+    ),
+    (
+        6,
+        "create search indexes",
+        lambda conn, metadata: search.create_search_indexes(conn),
+    ),
+    (
+        7,
+        "create idempotency keys",
+        lambda conn, metadata: metadata.tables[IDEMPOTENCY_TABLE].create(
+            conn, checkfirst=True
+        ),
+    ),
+    (8, "create change log", create_change_log),
+    (9, "add scope versions", lambda conn, metadata: add_scope_versions(conn)),
+    (10, "scope renderings", scope_renderings),
+    (11, "drop table versions", lambda conn, metadata: drop_table_versions(conn)),
+)
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version(conn: Connection) -> int:
+    """
+    Reads the schema version of the database.
+
+    Args:
+        conn (Connection): A database connection.
+
+    Returns:
+        int: The number of the last applied migration, 0 for a new database.
+    """
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    ).first()
+    if exists is None:
+        return 0
+    return conn.exec_driver_sql(
+        "SELECT coalesce(max(version), 0) FROM schema_version"
+    ).scalar_one()
+
+
+def apply_migrations(conn: Connection, metadata: MetaData) -> List[str]:
+    """
+    Applies the migrations newer than the schema version of the database.
+
+    Every migration before versioning was introduced is idempotent, so a
+    database created by an earlier release is brought up to date by running
+    them all once.
+
+    Args:
+        conn (Connection): A connection holding the database write lock.
+        metadata (MetaData): The metadata holding the current table definitions.
+
+    Returns:
+        List[str]: The names of the migrations that were applied.
+    """
+    conn.exec_driver_sql(SCHEMA_VERSION_DDL)
+    version = current_version(conn)
+    applied = []
+    for number, name, migration in MIGRATIONS:
+        if number <= version:
+            continue
+        migration(conn, metadata)
+        conn.exec_driver_sql(
+            "INSERT INTO schema_version (version, name) VALUES (?, ?)", (number, name)
+        )
+        applied.append(name)
+    return applied
@@ -0,0 +1,67 @@
+from sqlalchemy import column, table
+from sqlalchemy.engine import Connection
+
+# Virtual table -> (content table, indexed columns, tokenizer). Names use the
+# trigram tokenizer so any substring of three or more characters is an index
+# lookup; the personal columns are prose and are tokenized into stemmed words.
+SEARCH_INDEXES = {
+    "skills_fts": ("skills", ("name",), "trigram"),
+    "languages_fts": ("languages", ("name",), "trigram"),
+    "personal_fts": (
+        "personal",
+        ("job_title", "professional_summary"),
+        "porter unicode61 remove_diacritics 2",
+    ),
+}
+
+skills_fts = table("skills_fts", column("rowid"), column("name"))
+languages_fts = table("languages_fts", column("rowid"), column("name"))
+personal_fts = table(
+    "personal_fts", column("rowid"), column("personal_fts"), column("rank")
+)
+
+
+def _index_statements(name: str, content: str, columns: tuple, tokenize: str):
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    insert_new = (
+        f"INSERT INTO {name} (rowid, {column_list}) VALUES (new.id, {new_values});"
+    )
+    delete_old = (
+        f"INSERT INTO {name} ({name}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({column_list}, "
+        f"content='{content}', content_rowid='id', tokenize='{tokenize}')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {content} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {content} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF {column_list} "
+        f"ON {content} BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def create_search_indexes(conn: Connection) -> None:
+    """
+    Creates the FTS5 indexes and the triggers that keep them in sync.
+
+    The indexes are external-content tables: they store only the index and
+    read the text from their content table. An index created over a table
+    that already has rows is rebuilt once, so existing databases are
+    searchable after the upgrade.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+    """
+    for name, (content, columns, tokenize) in SEARCH_INDEXES.items():
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (name,),
+        ).first()
+        for statement in _index_statements(name, content, columns, tokenize):
+            conn.exec_driver_sql(statement)
+        if exists is None:
+            conn.exec_driver_sql(f"INSERT INTO {name} ({name}) VALUES ('rebuild')")
@@ -0,0 +1,152 @@
+from .. import metrics
+from typing import Optional
+from time import perf_counter
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+_READ_PREFIXES = ("SELECT", "PRAGMA", "WITH")
+_OPERATIONS = ("select", "insert", "update", "delete")
+
+
+@dataclass
+class TransactionStats:
+    """
+    Transaction counters of an engine or of a single request.
+
+    `write_commits` counts commits that followed at least one write
+    statement. Each one appends to the SQLite write-ahead log; with
+    synchronous=NORMAL the WAL is only fsynced at checkpoints, with
+    synchronous=FULL every write commit costs one fsync.
+    """
+
+    transactions: int = 0
+    commits: int = 0
+    write_commits: int = 0
+    rollbacks: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+    def add(self, other: "TransactionStats") -> None:
+        """
+        Adds the counters of `other` to these.
+        """
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+engine_transaction_stats = TransactionStats()
+request_transaction_stats: ContextVar[Optional[TransactionStats]] = ContextVar(
+    "request_transaction_stats", default=None
+)
+
+
+def _record(field: str) -> None:
+    for stats in (engine_transaction_stats, request_transaction_stats.get()):
+        if stats is not None:
+            setattr(stats, field, getattr(stats, field) + 1)
+
+
+def install_transaction_counters(engine: Engine) -> None:
+    """
+    Hooks the transaction events of `engine` into the counters.
+
+    Args:
+        engine (Engine): The synchronous engine behind an AsyncEngine.
+    """
+
+    @event.listens_for(engine, "begin")
+    def on_begin(conn):
+        _record("transactions")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip()[:6].upper().startswith(_READ_PREFIXES):
+            conn.info["wrote"] = True
+
+    @event.listens_for(engine, "commit")
+    def on_commit(conn):
+        _record("commits")
+        if conn.info.pop("wrote", False):
+            _record("write_commits")
+
+    @event.listens_for(engine, "rollback")
+    def on_rollback(conn):
+        conn.info.pop("wrote", None)
+        _record("rollbacks")
+
+
+def _operation(statement: str) -> str:
+    keyword = statement.lstrip()[:6].lower()
+    return keyword if keyword in _OPERATIONS else "other"
+
+
+def install_query_metrics(engine: Engine) -> None:
+    """
+    Hooks the cursor events of `engine` into the SQL metrics.
+
+    Every statement is counted and timed by operation, and added to the
+    statistics of the request it runs for, if any.
+
+    Args:
+        engine (Engine): The synchronous engine behind an AsyncEngine.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def on_before_execute(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_start = perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def on_after_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = perf_counter() - context._metrics_start
+        operation = _operation(statement)
+        metrics.db_statements_total.inc(operation)
+        metrics.db_statement_duration_seconds.observe(elapsed, operation)
+        query_stats = metrics.request_query_stats.get()
+        if query_stats is not None:
+            query_stats.statements += 1
+            query_stats.duration += elapsed
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waited for a connection.
+
+    The wait includes opening a new connection when the pool has to grow.
+    Waits are labelled with the pool's logging name, e.g. "read" or "write".
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = self._orig_logging_name or "default"
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = perf_counter() - start
+            self.checkouts += 1
+            self.wait_seconds += elapsed
+            metrics.db_pool_wait_seconds.observe(elapsed, self.name)
+
+    def usage(self) -> dict:
+        """
+        Reports the size and the checkouts of the pool.
+
+        Returns:
+            dict: The pool size, the connections checked out and in overflow,
+                and the checkouts and time spent waiting for them since startup.
+        """
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "wait_seconds": self.wait_seconds,
+        }
@@ -0,0 +1,151 @@
+from sqlalchemy.engine import Connection
+
+# Tables whose rows are counted and versioned per scope, with the column
+# holding the scope: the profile of a skill or language, the ID of a
+# personal record.
+COUNTED_TABLES = {"skills": "personal_id", "languages": "personal_id", "personal": "id"}
+
+
+def _row_count_statements(table: str, column: str) -> list[str]:
+    scope = f"coalesce({{row}}.{column}, 0)"
+    increment = (
+        "INSERT INTO row_counts (name, scope, count, version) "
+        f"VALUES ('{table}', {scope.format(row='new')}, 1, 1) "
+        "ON CONFLICT (name, scope) DO UPDATE "
+        "SET count = count + 1, version = version + 1;"
+    )
+    decrement = (
+        "UPDATE row_counts SET count = count - 1, version = version + 1 "
+        f"WHERE name = '{table}' AND scope = {scope.format(row='old')};"
+    )
+    touch = (
+        "UPDATE row_counts SET version = version + 1 "
+        f"WHERE name = '{table}' AND scope = {scope.format(row='new')};"
+    )
+    statements = [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_insert_count AFTER INSERT ON {table} "
+        f"FOR EACH ROW BEGIN {increment} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_delete_count AFTER DELETE ON {table} "
+        f"FOR EACH ROW BEGIN {decrement} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_update_count AFTER UPDATE ON {table} "
+        f"FOR EACH ROW BEGIN {touch} END",
+    ]
+    if column != "id":
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_move_count "
+            f"AFTER UPDATE OF {column} ON {table} FOR EACH ROW "
+            f"WHEN old.{column} IS NOT new.{column} BEGIN {decrement} {increment} END"
+        )
+    return statements
+
+
+def drop_row_count_triggers(conn: Connection) -> None:
+    """
+    Drops the triggers created by create_row_count_triggers.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+    """
+    for table in COUNTED_TABLES:
+        for suffix in ("insert", "delete", "update", "move"):
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {table}_{suffix}_count")
+
+
+def create_row_count_triggers(conn: Connection) -> None:
+    """
+    Creates the triggers that keep `row_counts` in step with each table.
+
+    Counts and versions are kept per scope, with scope 0 for rows without a
+    profile, and change inside the writing transaction: every insert, update
+    and delete bumps the version of the scope of its row, and a row moved to
+    another profile bumps both. When a table's triggers are missing, e.g. on
+    first start or after the table was rebuilt, its counts are recomputed
+    once from the table before the triggers are created; the versions are
+    bumped rather than reset, so they never repeat.
+
+    Args:
+        conn (Connection): A connection inside a transaction.
+    """
+    columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(row_counts)")}
+    if "version" not in columns:
+        conn.exec_driver_sql(
+            "ALTER TABLE row_counts ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+        )
+    for table, column in COUNTED_TABLES.items():
+        installed = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+            (f"{table}_insert_count",),
+        ).first()
+        if installed is None:
+            conn.exec_driver_sql(
+                "UPDATE row_counts SET count = 0, version = version + 1 WHERE name = ?",
+                (table,),
+            )
+            # WHERE true keeps SQLite from reading ON CONFLICT as a join
+            # constraint of the SELECT.
+            conn.exec_driver_sql(
+                "INSERT INTO row_counts (name, scope, count, version) "
+                f"SELECT '{table}', coalesce({column}, 0), count(*), 1 "
+                f"FROM {table} WHERE true GROUP BY coalesce({column}, 0) "
+                "ON CONFLICT (name, scope) DO UPDATE SET count = excluded.count"
+            )
+        for statement in _row_count_statements(table, column):
+            conn.exec_driver_sql(statement)
+
+
+# Columns published in the change log, per table; timestamps and name keys
+# are left out. Keep in step with the models: the triggers copy them.
+CHANGE_LOG_COLUMNS = {
+    "skills": ("id", "personal_id", "name"),
+    "languages": ("id", "personal_id", "name", "proficiency"),
+    "personal": (
+        "id",
+        "full_name",
+        "email",
+        "phone",
+        "job_title",
+        "github_link",
+        "linkedin_link",
+        "professional_summary",
+    ),
+}
+CHANGE_LOG_RETENTION = 10000
+
+
+def change_log_trigger_statements() -> list[str]:
+    """
+    Builds the DDL that appends every write to `change_log`.
+
+    Each inserted, updated or deleted row adds one entry, inside the writing
+    transaction, holding the row's id, its profile and, unless it was
+    deleted, its columns as a JSON object. Only the latest
+    CHANGE_LOG_RETENTION entries are kept.
+
+    Returns:
+        list[str]: Idempotent SQL statements.
+    """
+    statements = []
+    for table, columns in CHANGE_LOG_COLUMNS.items():
+        scope = "{row}.id" if table == "personal" else "{row}.personal_id"
+        data = "json_object({})".format(
+            ", ".join(f"'{column}', new.{column}" for column in columns)
+        )
+        for operation, row, payload in (
+            ("INSERT", "new", data),
+            ("UPDATE", "new", data),
+            ("DELETE", "old", "NULL"),
+        ):
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_{operation.lower()}_change "
+                f"AFTER {operation} ON {table} FOR EACH ROW BEGIN "
+                "INSERT INTO change_log "
+                "(table_name, operation, row_id, personal_id, data) "
+                f"VALUES ('{table}', '{operation.lower()}', {row}.id, "
+                f"{scope.format(row=row)}, {payload}); END"
+            )
+    statements.append(
+        "CREATE TRIGGER IF NOT EXISTS change_log_retention "
+        "AFTER INSERT ON change_log FOR EACH ROW BEGIN "
+        f"DELETE FROM change_log WHERE id <= new.id - {CHANGE_LOG_RETENTION}; END"
+    )
+    return statements
@@ -0,0 +1,3 @@
+from .middleware import IdempotencyMiddleware
+
+__all__ = ["IdempotencyMiddleware"]
@@ -0,0 +1,229 @@
+import json
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from starlette.datastructures import Headers
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .. import database, services
+
+HEADER = "idempotency-key"
+MAX_KEY_LENGTH = 255
+REPLAYED_HEADER = b"idempotent-replayed"
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class IdempotencyMiddleware:
+    """
+    Replays the first response to POST requests that repeat an
+    Idempotency-Key.
+
+    The first request with a key runs as usual; the key is reserved in the
+    transaction of its write, so the write and the reservation commit or
+    roll back together. Its response is then stored with an expiry, unless
+    it is a server error, and retries get the same status, Content-Type and
+    body byte for byte. If the response could not be stored after the write
+    committed, retries get 409 rather than repeating the write. Duplicates
+    that arrive while the first one is still running wait for it instead of
+    creating the row again. A key reused with a different body or query
+    string is rejected with 422. Requests without the header pass through.
+
+    Responses answered here never reach the router, so the route they were
+    sent to is matched here and stored in the scope, where the metrics
+    middleware reads its label from.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        idempotency_key = Headers(scope=scope).get(HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        _match_route(scope)
+        idempotency_key = idempotency_key.strip()
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await _send_error(
+                send,
+                400,
+                f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters long.",
+            )
+            return
+
+        body = await _read_body(receive)
+        key = services.IdempotencyService.key(
+            scope["method"], scope["path"], idempotency_key
+        )
+        fingerprint = services.IdempotencyService.fingerprint(
+            scope.get("query_string", b""), body
+        )
+
+        # Duplicates wait for the request that claimed the key; it looks up
+        # the stored response itself, so no lookup can race with a save.
+        pending = self._in_flight.get(key)
+        while pending is not None:
+            stored = await asyncio.shield(pending)
+            if stored is not None:
+                await _replay(send, stored, fingerprint)
+                return
+            pending = self._in_flight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        stored = None
+        messages: List[Message] = []
+        try:
+            stored = await services.IdempotencyService.get(key)
+            if stored is None:
+                messages = await self._run(scope, body, key, fingerprint)
+                stored = await self._save(key, messages, fingerprint)
+        finally:
+            del self._in_flight[key]
+            future.set_result(stored)
+        if not messages:
+            await _replay(send, stored, fingerprint)
+            return
+        for message in messages:
+            await send(message)
+
+    async def _save(
+        self, key: str, messages: List[Message], fingerprint: str
+    ) -> Optional[services.StoredResponse]:
+        """
+        Stores the captured response, unless it must not be replayed.
+        """
+        stored = _stored_response(messages, fingerprint)
+        if stored is None:
+            return None
+        try:
+            await services.IdempotencyService.save(key, stored)
+        except Exception:
+            # The write committed with the reservation; retries get 409.
+            logger.exception("Failed to store the idempotent response.")
+            return None
+        return stored
+
+    async def _run(
+        self, scope: Scope, body: bytes, key: str, fingerprint: str
+    ) -> List[Message]:
+        """
+        Runs the app on the buffered request and captures its response,
+        reserving the key with the request's writes.
+        """
+        messages: List[Message] = []
+        received = False
+
+        async def receive() -> Message:
+            nonlocal received
+            if received:
+                return {"type": "http.disconnect"}
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture(message: Message) -> None:
+            messages.append(message)
+
+        async def reserve(db) -> None:
+            await services.IdempotencyService.reserve(db, key, fingerprint)
+
+        token = database.write_hook.set(reserve)
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            database.write_hook.reset(token)
+        return messages
+
+
+def _match_route(scope: Scope) -> None:
+    app = scope.get("app")
+    for route in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            scope["route"] = route
+            return
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _stored_response(
+    messages: List[Message], fingerprint: str
+) -> Optional[services.StoredResponse]:
+    """
+    Builds the response to store from the captured messages, or None for a
+    server error.
+    """
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    if start["status"] >= 500:
+        return None
+    headers = Headers(raw=start.get("headers", []))
+    return services.StoredResponse(
+        fingerprint=fingerprint,
+        status_code=start["status"],
+        content_type=headers.get("content-type"),
+        body=b"".join(
+            m.get("body", b"") for m in messages if m["type"] == "http.response.body"
+        ),
+    )
+
+
+async def _replay(
+    send: Send, stored: services.StoredResponse, fingerprint: str
+) -> None:
+    if stored.fingerprint != fingerprint:
+        await _send_error(
+            send, 422, "Idempotency-Key was used with a different request."
+        )
+        return
+    if stored.reserved:
+        await _send_error(
+            send,
+            409,
+            "A request with this Idempotency-Key was already processed; "
+            "its response was not recorded.",
+        )
+        return
+    headers = [
+        (b"content-length", str(len(stored.body)).encode()),
+        (REPLAYED_HEADER, b"true"),
+    ]
+    if stored.content_type is not None:
+        headers.append((b"content-type", stored.content_type.encode("latin-1")))
+    await send(
+        {
+            "type": "http.response.start",
+            "status": stored.status_code,
+            "headers": headers,
+        }
+    )
+    await send({"type": "http.response.body", "body": stored.body})
+
+
+async def _send_error(send: Send, status_code: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
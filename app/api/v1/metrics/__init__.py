@@ -0,0 +1,51 @@
+from .registry import (
+    CONTENT_TYPE,
+    Registry,
+    Metric,
+    Counter,
+    Gauge,
+    Histogram,
+)
+from .instruments import (
+    registry,
+    QueryStats,
+    request_query_stats,
+    http_requests_total,
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_requests_shed_total,
+    http_requests_queued,
+    db_statements_total,
+    db_statement_duration_seconds,
+    db_request_statements,
+    db_request_duration_seconds,
+    db_pool_wait_seconds,
+    db_pool_checked_out,
+    db_write_batch_size,
+)
+from .middleware import MetricsMiddleware
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Registry",
+    "Metric",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "registry",
+    "QueryStats",
+    "request_query_stats",
+    "http_requests_total",
+    "http_request_duration_seconds",
+    "http_requests_in_progress",
+    "http_requests_shed_total",
+    "http_requests_queued",
+    "db_statements_total",
+    "db_statement_duration_seconds",
+    "db_request_statements",
+    "db_request_duration_seconds",
+    "db_pool_wait_seconds",
+    "db_pool_checked_out",
+    "db_write_batch_size",
+    "MetricsMiddleware",
+]
@@ -0,0 +1,129 @@
+from typing import Optional
+from contextvars import ContextVar
+from dataclasses import dataclass
+from .registry import Registry, Counter, Gauge, Histogram
+
+SQL_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+registry = Registry()
+
+http_requests_total = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests handled, by method, route and status code.",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration_seconds = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time to handle an HTTP request, by method and route.",
+        ("method", "route"),
+    )
+)
+http_requests_in_progress = registry.register(
+    Gauge(
+        "http_requests_in_progress",
+        "HTTP requests currently being handled, by method.",
+        ("method",),
+    )
+)
+http_requests_shed_total = registry.register(
+    Counter(
+        "http_requests_shed_total",
+        "HTTP requests rejected with 503 by admission control, by limiter and reason.",
+        ("limiter", "reason"),
+    )
+)
+http_requests_queued = registry.register(
+    Gauge(
+        "http_requests_queued",
+        "HTTP requests waiting for admission, by limiter.",
+        ("limiter",),
+    )
+)
+db_statements_total = registry.register(
+    Counter(
+        "db_statements_total",
+        "SQL statements executed, by operation.",
+        ("operation",),
+    )
+)
+db_statement_duration_seconds = registry.register(
+    Histogram(
+        "db_statement_duration_seconds",
+        "Time to execute a SQL statement, by operation.",
+        ("operation",),
+        SQL_BUCKETS,
+    )
+)
+db_request_statements = registry.register(
+    Histogram(
+        "db_request_statements",
+        "SQL statements executed per HTTP request, by route.",
+        ("route",),
+        STATEMENT_COUNT_BUCKETS,
+    )
+)
+db_request_duration_seconds = registry.register(
+    Histogram(
+        "db_request_duration_seconds",
+        "Time spent executing SQL per HTTP request, by route.",
+        ("route",),
+        SQL_BUCKETS,
+    )
+)
+db_pool_wait_seconds = registry.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time to check a connection out of a pool, by pool.",
+        ("pool",),
+        SQL_BUCKETS,
+    )
+)
+db_pool_checked_out = registry.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of a pool, by pool.",
+        ("pool",),
+    )
+)
+db_write_batch_size = registry.register(
+    Histogram(
+        "db_write_batch_size",
+        "Writes committed together by the write coalescer.",
+        (),
+        BATCH_SIZE_BUCKETS,
+    )
+)
+
+
+@dataclass
+class QueryStats:
+    """
+    SQL statements executed on behalf of a single request.
+    """
+
+    statements: int = 0
+    duration: float = 0.0
+
+
+request_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
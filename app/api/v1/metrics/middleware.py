@@ -0,0 +1,50 @@
+from time import perf_counter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from . import instruments
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Records the count, latency and in-flight gauge of HTTP requests.
+
+    Requests are labelled with the path template of the route that handled
+    them, e.g. /api/v1/skills/{id}, so the number of series stays bounded;
+    requests that matched no route share a single label. It is a plain ASGI
+    middleware, so the request runs in the same task and the SQL statements
+    it executes are attributed to it through `request_query_stats`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        query_stats = instruments.QueryStats()
+        token = instruments.request_query_stats.set(query_stats)
+        instruments.http_requests_in_progress.inc(method)
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            instruments.http_requests_in_progress.dec(method)
+            instruments.request_query_stats.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            instruments.http_requests_total.inc(method, route, str(status_code))
+            instruments.http_request_duration_seconds.observe(elapsed, method, route)
+            instruments.db_request_statements.observe(query_stats.statements, route)
+            instruments.db_request_duration_seconds.observe(query_stats.duration, route)
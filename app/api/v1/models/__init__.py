@@ -1,5 +1,17 @@
 from .language_model import Language
 from .skill_model import Skill
 from .personal_model import Personal
+from .rendering_model import Rendering
+from .row_count_model import RowCount
+from .idempotency_key_model import IdempotencyKey
+from .change_log_model import ChangeLog
 
-__all__ = ["Language", "Skill", "Personal"]
+__all__ = [
+    "Language",
+    "Skill",
+    "Personal",
+    "Rendering",
+    "RowCount",
+    "IdempotencyKey",
+    "ChangeLog",
+]
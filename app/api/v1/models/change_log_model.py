@@ -0,0 +1,18 @@
+from .. import database
+from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Text, DateTime
+
+
+class ChangeLog(database.base):
+    __tablename__ = "change_log"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String, nullable=False)
+    operation = Column(String, nullable=False)
+    row_id = Column(Integer, nullable=False)
+    personal_id = Column(Integer, nullable=True)
+    data = Column(Text, nullable=True)
+    changed_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -0,0 +1,13 @@
+from .. import database
+from sqlalchemy import Column, Integer, LargeBinary, String
+
+
+class IdempotencyKey(database.base):
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    status_code = Column(Integer, nullable=False)
+    content_type = Column(String, nullable=True)
+    body = Column(LargeBinary, nullable=False)
+    expires_at = Column(Integer, nullable=False, index=True)
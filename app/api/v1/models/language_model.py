@@ -1,13 +1,29 @@
 from .. import database
-from sqlalchemy.sql import func
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func, text
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, DateTime
 
 
 class Language(database.base):
     __tablename__ = "languages"
+    __table_args__ = (
+        Index("ix_languages_personal_id_id", "personal_id", "id"),
+        Index(
+            "ix_languages_personal_id_name_key", "personal_id", "name_key", unique=True
+        ),
+        Index(
+            "ix_languages_name_key",
+            "name_key",
+            unique=True,
+            sqlite_where=text("personal_id IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    name = Column(String, nullable=False, unique=True)
+    personal_id = Column(
+        Integer, ForeignKey("personal.id", ondelete="CASCADE"), nullable=True
+    )
+    name = Column(String, nullable=False)
+    name_key = Column(String, nullable=False)
     proficiency = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), default=func.now())
     updated_at = Column(
@@ -0,0 +1,15 @@
+from .. import database
+from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Text, DateTime
+
+
+class Rendering(database.base):
+    __tablename__ = "renderings"
+
+    scope = Column(Integer, primary_key=True, default=0)
+    format = Column(String, primary_key=True)
+    section = Column(String, primary_key=True)
+    content = Column(Text, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,11 @@
+from .. import database
+from sqlalchemy import Column, Integer, String
+
+
+class RowCount(database.base):
+    __tablename__ = "row_counts"
+
+    name = Column(String, primary_key=True)
+    scope = Column(Integer, primary_key=True, default=0)
+    count = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,19 @@
+from .. import utils
+from .base_renderer import ResumeRenderer
+from .json_resume_renderer import JsonResumeRenderer
+from .markdown_renderer import MarkdownRenderer
+from .html_renderer import HtmlRenderer
+
+RENDERERS = {
+    utils.ResumeFormat.JSON: JsonResumeRenderer(),
+    utils.ResumeFormat.MARKDOWN: MarkdownRenderer(),
+    utils.ResumeFormat.HTML: HtmlRenderer(),
+}
+
+__all__ = [
+    "ResumeRenderer",
+    "JsonResumeRenderer",
+    "MarkdownRenderer",
+    "HtmlRenderer",
+    "RENDERERS",
+]
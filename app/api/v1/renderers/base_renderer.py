@@ -0,0 +1,28 @@
+from typing import Dict, List, Optional
+from abc import ABC, abstractmethod
+from .. import schemas, utils
+
+
+class ResumeRenderer(ABC):
+    """
+    Renders a resume one section at a time.
+
+    Sections are rendered independently so that a change to one of them only
+    re-renders that section; `assemble` then stitches the stored sections
+    into the final document without touching the database.
+    """
+
+    format: utils.ResumeFormat
+    media_type: str
+
+    @abstractmethod
+    def render_basics(self, personal: Optional[schemas.PersonalOut]) -> str: ...
+
+    @abstractmethod
+    def render_skills(self, skills: List[schemas.SkillOut]) -> str: ...
+
+    @abstractmethod
+    def render_languages(self, languages: List[schemas.LanguageOut]) -> str: ...
+
+    @abstractmethod
+    def assemble(self, sections: Dict[utils.ResumeSection, str]) -> str: ...
@@ -0,0 +1,56 @@
+from html import escape
+from typing import Dict, List, Optional
+from .. import schemas, utils
+from .base_renderer import ResumeRenderer
+
+
+class HtmlRenderer(ResumeRenderer):
+    """
+    Renders the resume as a static HTML page.
+    """
+
+    format = utils.ResumeFormat.HTML
+    media_type = "text/html; charset=utf-8"
+
+    def render_basics(self, personal: Optional[schemas.PersonalOut]) -> str:
+        if personal is None:
+            return ""
+        github_link = escape(str(personal.github_link))
+        linkedin_link = escape(str(personal.linkedin_link))
+        return (
+            "<header>"
+            f"<h1>{escape(personal.full_name)}</h1>"
+            f"<p><strong>{escape(personal.job_title)}</strong></p>"
+            "<ul>"
+            f"<li>Email: {escape(personal.email)}</li>"
+            f"<li>Phone: {escape(personal.phone)}</li>"
+            f'<li>GitHub: <a href="{github_link}">{github_link}</a></li>'
+            f'<li>LinkedIn: <a href="{linkedin_link}">{linkedin_link}</a></li>'
+            "</ul>"
+            f"<p>{escape(personal.professional_summary)}</p>"
+            "</header>"
+        )
+
+    def render_skills(self, skills: List[schemas.SkillOut]) -> str:
+        if not skills:
+            return ""
+        items = "".join(f"<li>{escape(skill.name)}</li>" for skill in skills)
+        return f"<section><h2>Skills</h2><ul>{items}</ul></section>"
+
+    def render_languages(self, languages: List[schemas.LanguageOut]) -> str:
+        if not languages:
+            return ""
+        items = "".join(
+            f"<li>{escape(language.name)} ({escape(language.proficiency.value)})</li>"
+            for language in languages
+        )
+        return f"<section><h2>Languages</h2><ul>{items}</ul></section>"
+
+    def assemble(self, sections: Dict[utils.ResumeSection, str]) -> str:
+        body = "".join(sections[section] for section in utils.ResumeSection)
+        return (
+            "<!DOCTYPE html>"
+            '<html lang="en"><head><meta charset="utf-8">'
+            "<title>Resume</title></head>"
+            f"<body>{body}</body></html>"
+        )
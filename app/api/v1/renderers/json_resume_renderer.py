@@ -0,0 +1,53 @@
+import json
+from typing import Dict, List, Optional
+from .. import schemas, utils
+from .base_renderer import ResumeRenderer
+
+JSON_RESUME_SCHEMA = (
+    "https://raw.githubusercontent.com/jsonresume/resume-schema/v1.0.0/schema.json"
+)
+
+
+class JsonResumeRenderer(ResumeRenderer):
+    """
+    Renders the resume in the JSON Resume format (https://jsonresume.org).
+    """
+
+    format = utils.ResumeFormat.JSON
+    media_type = "application/json"
+
+    def render_basics(self, personal: Optional[schemas.PersonalOut]) -> str:
+        if personal is None:
+            return "{}"
+        return json.dumps(
+            {
+                "name": personal.full_name,
+                "label": personal.job_title,
+                "email": personal.email,
+                "phone": personal.phone,
+                "summary": personal.professional_summary,
+                "profiles": [
+                    {"network": "GitHub", "url": str(personal.github_link)},
+                    {"network": "LinkedIn", "url": str(personal.linkedin_link)},
+                ],
+            }
+        )
+
+    def render_skills(self, skills: List[schemas.SkillOut]) -> str:
+        return json.dumps([{"name": skill.name} for skill in skills])
+
+    def render_languages(self, languages: List[schemas.LanguageOut]) -> str:
+        return json.dumps(
+            [
+                {"language": language.name, "fluency": language.proficiency.value}
+                for language in languages
+            ]
+        )
+
+    def assemble(self, sections: Dict[utils.ResumeSection, str]) -> str:
+        return (
+            f'{{"$schema":{json.dumps(JSON_RESUME_SCHEMA)},'
+            f'"basics":{sections[utils.ResumeSection.BASICS]},'
+            f'"skills":{sections[utils.ResumeSection.SKILLS]},'
+            f'"languages":{sections[utils.ResumeSection.LANGUAGES]}}}'
+        )
@@ -0,0 +1,52 @@
+import re
+from typing import Dict, List, Optional
+from .. import schemas, utils
+from .base_renderer import ResumeRenderer
+
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_{}\[\]()#+\-!|<>])")
+
+
+def _escape(text: str) -> str:
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", text)
+
+
+class MarkdownRenderer(ResumeRenderer):
+    """
+    Renders the resume as a Markdown document.
+    """
+
+    format = utils.ResumeFormat.MARKDOWN
+    media_type = "text/markdown; charset=utf-8"
+
+    def render_basics(self, personal: Optional[schemas.PersonalOut]) -> str:
+        if personal is None:
+            return ""
+        return (
+            f"# {_escape(personal.full_name)}\n\n"
+            f"**{_escape(personal.job_title)}**\n\n"
+            f"- Email: {_escape(personal.email)}\n"
+            f"- Phone: {_escape(personal.phone)}\n"
+            f"- GitHub: <{personal.github_link}>\n"
+            f"- LinkedIn: <{personal.linkedin_link}>\n\n"
+            f"{_escape(personal.professional_summary)}\n"
+        )
+
+    def render_skills(self, skills: List[schemas.SkillOut]) -> str:
+        if not skills:
+            return ""
+        items = "".join(f"- {_escape(skill.name)}\n" for skill in skills)
+        return f"## Skills\n\n{items}"
+
+    def render_languages(self, languages: List[schemas.LanguageOut]) -> str:
+        if not languages:
+            return ""
+        items = "".join(
+            f"- {_escape(language.name)} ({language.proficiency.value})\n"
+            for language in languages
+        )
+        return f"## Languages\n\n{items}"
+
+    def assemble(self, sections: Dict[utils.ResumeSection, str]) -> str:
+        return "\n".join(
+            sections[section] for section in utils.ResumeSection if sections[section]
+        )
@@ -1,5 +1,21 @@
 from .language_router import language_router
 from .skill_router import skill_router
 from .personal_router import personal_router
+from .personal_skill_router import personal_skill_router
+from .personal_language_router import personal_language_router
+from .personal_resume_router import personal_resume_router
+from .resume_router import resume_router
+from .stats_router import stats_router
+from .change_router import change_router
 
-__all__ = ["language_router", "skill_router", "personal_router"]
+__all__ = [
+    "language_router",
+    "skill_router",
+    "personal_router",
+    "personal_skill_router",
+    "personal_language_router",
+    "personal_resume_router",
+    "resume_router",
+    "stats_router",
+    "change_router",
+]
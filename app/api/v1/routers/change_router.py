@@ -0,0 +1,37 @@
+from typing import Optional
+from .. import services
+from fastapi import APIRouter, Header
+from fastapi.responses import StreamingResponse
+
+change_router = APIRouter()
+
+
+@change_router.get(
+    path="/stream",
+    response_class=StreamingResponse,
+    summary="Stream changes.",
+    description="Stream the changes to skills, languages and personal data as Server-Sent Events (text/event-stream).",
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream(
+    last_event_id: Optional[int] = Header(
+        default=None,
+        ge=0,
+        alias="Last-Event-ID",
+        description="ID of the last change received, to resume after it.",
+    ),
+) -> StreamingResponse:
+    """
+    Streams the changes committed to the database as Server-Sent Events.
+
+    Args:
+        last_event_id (Optional[int]): The ID of the last change received; only new changes are sent without it.
+
+    Returns:
+        StreamingResponse: One `change` event per inserted, updated or deleted row.
+    """
+    return StreamingResponse(
+        content=services.ChangeService.stream(last_event_id=last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,8 +1,9 @@
 from pydantic import PositiveInt
 from typing import List, Optional
-from .. import schemas, database, services
+from .. import schemas, database, services, utils, compression
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import APIRouter, Path, status, Body, Depends, Query
+from fastapi import APIRouter, Path, status, Body, Depends, Query, Request, Response
 
 language_router = APIRouter()
 
@@ -14,25 +15,171 @@ language_router = APIRouter()
     description="Get all languages.",
 )
 async def get_all(
-    db: AsyncSession = Depends(database.get_db),
+    request: Request,
+    db: AsyncSession = Depends(database.get_read_db),
     page: Optional[PositiveInt] = Query(ge=1, default=1, description="Page number."),
     items_per_page: Optional[PositiveInt] = Query(
-        ge=1, default=100, description="Items per page."
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Items per page.",
     ),
-) -> List[schemas.LanguageOut]:
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque cursor from X-Next-Cursor; overrides page.",
+    ),
+) -> Response:
     """
     Retrieves all languages from the database.
 
+    Full pages carry an `X-Next-Cursor` header that can be passed back as
+    `cursor` to fetch the next page by seeking on the ID index. Every page
+    carries the number of languages in `X-Total-Count`, read from a counter
+    maintained by triggers rather than counted.
+
+    Responses carry a strong ETag derived from the version of the unscoped
+    languages, which writes to profiles leave alone; a matching If-None-Match
+    is answered with 304 Not Modified before the page is read.
+
+    Pages are sent gzip or brotli compressed to clients that accept it; the
+    compressed variant is cached with the page, so it is built once.
+
     Args:
+        request (Request): The incoming request.
         db (AsyncSession): A database session.
         page (Optional[PositiveInt]): Page number. Defaults to 1.
         items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+        cursor (Optional[str]): Opaque cursor of the page to fetch.
+
+    Returns:
+        Response: JSON list of schemas.LanguageOut.
+    """
+    after_id = utils.decode_cursor(cursor) if cursor is not None else None
+    version = await services.LanguageService.get_version(db=db)
+    etag = utils.make_etag(
+        "GET /languages/", None, version, page, items_per_page, after_id
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response = compression.not_modified(request, headers)
+    if response is not None:
+        return response
+    cached_page = await services.LanguageService.get_all(
+        db=db,
+        page=page,
+        items_per_page=items_per_page,
+        after_id=after_id,
+        version=version,
+    )
+    response = compression.not_modified(request, headers, len(cached_page.body))
+    if response is not None:
+        return response
+    encoding = compression.negotiate(
+        request.headers.get("Accept-Encoding"), len(cached_page.body)
+    )
+    response = Response(
+        content=cached_page.encoded(encoding),
+        media_type="application/json",
+        headers=compression.encoding_headers(headers, encoding),
+    )
+    response.headers["X-Total-Count"] = str(cached_page.total)
+    if cached_page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = cached_page.next_cursor
+    return response
+
+
+@language_router.get(
+    path="/by-name/{name}",
+    response_model=schemas.LanguageOut,
+    summary="Get language by name.",
+    description="Get language by name, ignoring case and whitespace.",
+)
+async def get_by_name(
+    db: AsyncSession = Depends(database.get_read_db),
+    name: str = Path(min_length=1, max_length=50, description="Name of language."),
+) -> schemas.LanguageOut:
+    """
+    Retrieves a language by name.
+
+    "python", "Python" and " PYTHON " all name the same language.
+
+    Args:
+        db (AsyncSession): A database session.
+        name (str): The name of the language.
+
+    Returns:
+        schemas.LanguageOut: The language.
+
+    Raises:
+        HTTPException: If the language does not exist (404) or if there is an internal server error (500).
+    """
+    return await services.LanguageService.get_by_name(db=db, name=name)
+
+
+@language_router.get(
+    path="/search",
+    response_model=List[schemas.LanguageOut],
+    summary="Search languages.",
+    description="Search languages by name prefix or substring.",
+)
+async def search(
+    db: AsyncSession = Depends(database.get_read_db),
+    q: str = Query(
+        min_length=1,
+        max_length=utils.MAX_SEARCH_QUERY_LENGTH,
+        description="Text to look for in the name, ignoring case.",
+    ),
+    mode: utils.SearchMode = Query(
+        default=utils.SearchMode.SUBSTRING,
+        description="Match names starting with q, or containing it.",
+    ),
+    items_per_page: Optional[PositiveInt] = Query(
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Maximum number of languages.",
+    ),
+) -> Response:
+    """
+    Searches languages by name through the full-text index.
+
+    Args:
+        db (AsyncSession): A database session.
+        q (str): Text to look for.
+        mode (utils.SearchMode): Match names starting with q, or containing it.
+        items_per_page (Optional[PositiveInt]): Maximum number of languages. Defaults to 100.
 
     Returns:
-        List[schemas.LanguageOut]: List of languages.
+        Response: JSON list of schemas.LanguageOut, shortest names first.
+
+    Raises:
+        HTTPException: If there is an internal server error (500).
     """
-    return await services.LanguageService.get_all(
-        db=db, page=page, items_per_page=items_per_page
+    body = await services.LanguageService.search(
+        db=db, q=q, mode=mode, items_per_page=items_per_page
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@language_router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    summary="Export all languages.",
+    description="Export all languages as newline-delimited JSON (application/x-ndjson).",
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export(db: AsyncSession = Depends(database.get_read_db)) -> StreamingResponse:
+    """
+    Streams all languages from the database as newline-delimited JSON.
+
+    Args:
+        db (AsyncSession): A database session.
+
+    Returns:
+        StreamingResponse: One LanguageOut JSON object per line.
+    """
+    return StreamingResponse(
+        content=services.LanguageService.export(db=db),
+        media_type="application/x-ndjson",
     )
 
 
@@ -44,14 +191,12 @@ async def get_all(
     description="Create language.",
 )
 async def create(
-    db: AsyncSession = Depends(database.get_db),
     language: schemas.LanguageIn = Body(description="Language to create."),
 ) -> schemas.LanguageOut:
     """
     Creates a language in the database.
 
     Args:
-        db (AsyncSession): A database session.
         language (schemas.LanguageIn): The language to create.
 
     Returns:
@@ -60,7 +205,42 @@ async def create(
     Raises:
         HTTPException: If the language already exists (409) or if there is an internal server error (500).
     """
-    return await services.LanguageService.create(db=db, language=language)
+    return await database.write_coalescer.submit(
+        lambda db: services.LanguageService.create(db=db, language=language)
+    )
+
+
+@language_router.post(
+    path="/bulk",
+    response_model=List[schemas.LanguageBulkResult],
+    summary="Create languages in bulk.",
+    description="Create languages in bulk.",
+)
+async def bulk_create(
+    db: AsyncSession = Depends(database.get_db, scope="function"),
+    languages: List[schemas.LanguageIn] = Body(
+        min_length=1,
+        max_length=utils.MAX_BULK_ITEMS,
+        description="Languages to create.",
+    ),
+) -> List[schemas.LanguageBulkResult]:
+    """
+    Creates many languages in the database in one transaction.
+
+    A language whose name already exists is reported as a conflict without
+    aborting the rest of the batch.
+
+    Args:
+        db (AsyncSession): A database session.
+        languages (List[schemas.LanguageIn]): The languages to create.
+
+    Returns:
+        List[schemas.LanguageBulkResult]: The outcome of each language, in request order.
+
+    Raises:
+        HTTPException: If there is an internal server error (500).
+    """
+    return await services.LanguageService.bulk_create(db=db, languages=languages)
 
 
 @language_router.delete(
@@ -70,14 +250,12 @@ async def create(
     description="Delete language.",
 )
 async def delete_by_id(
-    db: AsyncSession = Depends(database.get_db),
     id: PositiveInt = Path(description="Language ID to delete."),
 ) -> None:
     """
     Deletes a language by its ID from the database.
 
     Args:
-        db (AsyncSession): A database session.
         id (PositiveInt): The ID of the language to delete.
 
     Returns:
@@ -86,7 +264,9 @@ async def delete_by_id(
     Raises:
         HTTPException: If the language does not exist (404) or if there is an internal server error (500).
     """
-    return await services.LanguageService.delete_by_id(db=db, id=id)
+    return await database.write_coalescer.submit(
+        lambda db: services.LanguageService.delete_by_id(db=db, id=id)
+    )
 
 
 @language_router.patch(
@@ -96,7 +276,6 @@ async def delete_by_id(
     description="Update language.",
 )
 async def update_by_id(
-    db: AsyncSession = Depends(database.get_db),
     id: PositiveInt = Path(description="Language ID to update."),
     language: schemas.LanguageUpdate = Body(description="Language to update."),
 ) -> schemas.LanguageOut:
@@ -104,7 +283,6 @@ async def update_by_id(
     Updates a language by its ID in the database.
 
     Args:
-        db (AsyncSession): A database session.
         id (PositiveInt): The ID of the language to update.
         language (schemas.LanguageUpdate): The language to update.
 
@@ -114,4 +292,8 @@ async def update_by_id(
     Raises:
         HTTPException: If the language does not exist (404) or if there is an internal server error (500).
     """
-    return await services.LanguageService.update_by_id(db=db, id=id, language=language)
+    return await database.write_coalescer.submit(
+        lambda db: services.LanguageService.update_by_id(
+            db=db, id=id, language=language
+        )
+    )
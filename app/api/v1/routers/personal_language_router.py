@@ -0,0 +1,182 @@
+from pydantic import PositiveInt
+from typing import List, Optional
+from .. import schemas, database, services, utils, compression
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Path, Query, status, Body, Depends, Request, Response
+
+personal_language_router = APIRouter()
+
+
+@personal_language_router.post(
+    path="/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=schemas.LanguageOut,
+    summary="Create language of a profile.",
+    description="Create language of a profile.",
+)
+async def create(
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    language: schemas.LanguageIn = Body(description="Language to create."),
+) -> schemas.LanguageOut:
+    """
+    Creates a language in a profile.
+
+    Names are unique within a profile, so different profiles can each have
+    a language of the same name.
+
+    Args:
+        personal_id (PositiveInt): The ID of the personal record.
+        language (schemas.LanguageIn): The language to create.
+
+    Returns:
+        schemas.LanguageOut: The created language.
+
+    Raises:
+        HTTPException: If the profile does not exist (404), if the language already exists (409) or if there is an internal server error (500).
+    """
+    return await database.write_coalescer.submit(
+        lambda db: services.LanguageService.create(
+            db=db, language=language, personal_id=personal_id
+        )
+    )
+
+
+@personal_language_router.get(
+    path="/",
+    response_model=List[schemas.LanguageOut],
+    summary="Get all languages of a profile.",
+    description="Get all languages of a profile.",
+)
+async def get_all(
+    request: Request,
+    db: AsyncSession = Depends(database.get_read_db),
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    page: Optional[PositiveInt] = Query(ge=1, default=1, description="Page number."),
+    items_per_page: Optional[PositiveInt] = Query(
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Items per page.",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque cursor from X-Next-Cursor; overrides page.",
+    ),
+) -> Response:
+    """
+    Retrieves the languages of a profile.
+
+    Pages are read from the (personal_id, id) index, so with a cursor a page
+    costs the same however many languages the other profiles hold. The
+    profile's number of languages is returned in `X-Total-Count`. The ETag is
+    derived from the version of the profile's languages, so writes to other
+    profiles do not invalidate it.
+
+    Args:
+        request (Request): The incoming request.
+        db (AsyncSession): A database session.
+        personal_id (PositiveInt): The ID of the personal record.
+        page (Optional[PositiveInt]): Page number. Defaults to 1.
+        items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+        cursor (Optional[str]): Opaque cursor of the page to fetch.
+
+    Returns:
+        Response: JSON list of schemas.LanguageOut.
+
+    Raises:
+        HTTPException: If the profile or its languages are not found (404) or if there is an internal server error (500).
+    """
+    after_id = utils.decode_cursor(cursor) if cursor is not None else None
+    version = await services.LanguageService.get_version(db=db, personal_id=personal_id)
+    etag = utils.make_etag(
+        "GET /languages/", personal_id, version, page, items_per_page, after_id
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response = compression.not_modified(request, headers)
+    if response is not None:
+        return response
+    cached_page = await services.LanguageService.get_all(
+        db=db,
+        page=page,
+        items_per_page=items_per_page,
+        after_id=after_id,
+        version=version,
+        personal_id=personal_id,
+    )
+    response = compression.not_modified(request, headers, len(cached_page.body))
+    if response is not None:
+        return response
+    encoding = compression.negotiate(
+        request.headers.get("Accept-Encoding"), len(cached_page.body)
+    )
+    response = Response(
+        content=cached_page.encoded(encoding),
+        media_type="application/json",
+        headers=compression.encoding_headers(headers, encoding),
+    )
+    response.headers["X-Total-Count"] = str(cached_page.total)
+    if cached_page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = cached_page.next_cursor
+    return response
+
+
+@personal_language_router.delete(
+    path="/{id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete language of a profile.",
+    description="Delete language of a profile.",
+)
+async def delete_by_id(
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    id: PositiveInt = Path(description="Language ID to delete."),
+) -> None:
+    """
+    Deletes a language of a profile.
+
+    Args:
+        personal_id (PositiveInt): The ID of the personal record.
+        id (PositiveInt): The ID of the language to delete.
+
+    Returns:
+        None
+
+    Raises:
+        HTTPException: If the language does not exist in the profile (404) or if there is an internal server error (500).
+    """
+    return await database.write_coalescer.submit(
+        lambda db: services.LanguageService.delete_by_id(
+            db=db, id=id, personal_id=personal_id
+        )
+    )
+
+
+@personal_language_router.patch(
+    path="/{id}",
+    response_model=schemas.LanguageOut,
+    summary="Update language of a profile.",
+    description="Update language of a profile.",
+)
+async def update_by_id(
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    id: PositiveInt = Path(description="Language ID to update."),
+    language: schemas.LanguageUpdate = Body(description="Language to update."),
+) -> schemas.LanguageOut:
+    """
+    Updates a language of a profile.
+
+    Args:
+        personal_id (PositiveInt): The ID of the personal record.
+        id (PositiveInt): The ID of the language to update.
+        language (schemas.LanguageUpdate): The language to update.
+
+    Returns:
+        schemas.LanguageOut: The updated language.
+
+    Raises:
+        HTTPException: If the language does not exist in the profile (404), if the name already exists (409) or if there is an internal server error (500).
+    """
+    return await database.write_coalescer.submit(
+        lambda db: services.LanguageService.update_by_id(
+            db=db, id=id, language=language, personal_id=personal_id
+        )
+    )
@@ -0,0 +1,105 @@
+from pydantic import PositiveInt
+from .. import schemas, database, services, utils, renderers, compression
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Path, Request, Response
+
+personal_resume_router = APIRouter()
+
+
+@personal_resume_router.get(
+    path="/",
+    response_model=schemas.ResumeOut,
+    summary="Get resume of a profile.",
+    description="Get the personal data, skills and languages of a profile in one request.",
+)
+async def get(
+    request: Request,
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+) -> Response:
+    """
+    Retrieves the whole resume of a profile in a single request.
+
+    The ETag is derived from the versions of the profile's personal record,
+    skills and languages, so writes to other profiles leave it valid; a
+    matching If-None-Match is answered with 304 Not Modified without reading
+    the resume. Otherwise the versions and the resume are read again in one
+    snapshot, and the ETag sent is the one of the data actually returned.
+    The JSON, and its gzip or brotli variant, is cached per version of the
+    profile's data.
+
+    Args:
+        request (Request): The incoming request.
+        personal_id (PositiveInt): The ID of the personal record.
+
+    Returns:
+        Response: JSON of schemas.ResumeOut.
+
+    Raises:
+        HTTPException: If the profile does not exist (404) or if there is an internal server error (500).
+    """
+    versions = await services.ResumeService.get_versions(personal_id=personal_id)
+    etag = utils.make_etag("resume", personal_id, sorted(versions.items()))
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response = compression.not_modified(request, headers)
+    if response is not None:
+        return response
+    versions, cached_body = await services.ResumeService.get_body(
+        personal_id=personal_id
+    )
+    headers["ETag"] = utils.make_etag("resume", personal_id, sorted(versions.items()))
+    response = compression.not_modified(request, headers, len(cached_body.body))
+    if response is not None:
+        return response
+    encoding = compression.negotiate(
+        request.headers.get("Accept-Encoding"), len(cached_body.body)
+    )
+    return Response(
+        content=cached_body.encoded(encoding),
+        media_type="application/json",
+        headers=compression.encoding_headers(headers, encoding),
+    )
+
+
+@personal_resume_router.get(
+    path="/{format}",
+    response_class=Response,
+    summary="Get rendered resume of a profile.",
+    description="Get the resume of a profile rendered as JSON Resume, Markdown or HTML.",
+    responses={
+        200: {
+            "content": {
+                "application/json": {},
+                "text/markdown": {},
+                "text/html": {},
+            }
+        }
+    },
+)
+async def render(
+    db: AsyncSession = Depends(database.get_read_db),
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    format: utils.ResumeFormat = Path(description="Format of the rendering."),
+) -> Response:
+    """
+    Retrieves a precomputed rendering of the resume of a profile.
+
+    Renderings are rebuilt section by section when the profile's data
+    changes, so serving one is a single read of the stored document. A
+    profile's resume is first rendered when the profile is created.
+
+    Args:
+        db (AsyncSession): A database session.
+        personal_id (PositiveInt): The ID of the personal record.
+        format (utils.ResumeFormat): Format of the rendering.
+
+    Returns:
+        Response: The rendered resume.
+
+    Raises:
+        HTTPException: If the profile does not exist (404) or if there is an internal server error (500).
+    """
+    await services.PersonalService.ensure_exists(db=db, id=personal_id)
+    document = await services.RenderingService.get(
+        db=db, format=format, personal_id=personal_id
+    )
+    return Response(content=document, media_type=renderers.RENDERERS[format].media_type)
@@ -1,6 +1,8 @@
-from .. import schemas, database, services
+from typing import List, Optional
+from pydantic import PositiveInt
+from .. import schemas, database, services, utils
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import APIRouter, Body, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
 
 personal_router = APIRouter()
 
@@ -13,7 +15,46 @@ personal_router = APIRouter()
     description="Create contact.",
 )
 async def create(
-    db: AsyncSession = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_db, scope="function"),
     personal: schemas.PersonalIn = Body(description="Contact to create."),
 ) -> schemas.PersonalOut:
     return await services.PersonalService.create(db=db, personal=personal)
+
+
+@personal_router.get(
+    path="/search",
+    response_model=List[schemas.PersonalOut],
+    summary="Search contacts.",
+    description="Full-text search over job titles and professional summaries.",
+)
+async def search(
+    db: AsyncSession = Depends(database.get_read_db),
+    q: str = Query(
+        min_length=1,
+        max_length=utils.MAX_SEARCH_QUERY_LENGTH,
+        description="Words to look for in the job title and professional summary.",
+    ),
+    items_per_page: Optional[PositiveInt] = Query(
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Maximum number of contacts.",
+    ),
+) -> List[schemas.PersonalOut]:
+    """
+    Searches contacts through the full-text index.
+
+    Args:
+        db (AsyncSession): A database session.
+        q (str): Words to look for.
+        items_per_page (Optional[PositiveInt]): Maximum number of contacts. Defaults to 100.
+
+    Returns:
+        List[schemas.PersonalOut]: The matching contacts, best match first.
+
+    Raises:
+        HTTPException: If there is an internal server error (500).
+    """
+    return await services.PersonalService.search(
+        db=db, q=q, items_per_page=items_per_page
+    )
@@ -0,0 +1,152 @@
+from pydantic import PositiveInt
+from typing import List, Optional
+from .. import schemas, database, services, utils, compression
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Path, Query, status, Body, Depends, Request, Response
+
+personal_skill_router = APIRouter()
+
+
+@personal_skill_router.post(
+    path="/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=schemas.SkillOut,
+    summary="Create skill of a profile.",
+    description="Create skill of a profile.",
+)
+async def create(
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    skill: schemas.SkillIn = Body(description="Skill to create."),
+) -> schemas.SkillOut:
+    """
+    Creates a skill in a profile.
+
+    Names are unique within a profile, so different profiles can each have
+    a skill of the same name.
+
+    Args:
+        personal_id (PositiveInt): The ID of the personal record.
+        skill (schemas.SkillIn): The skill to create.
+
+    Returns:
+        schemas.SkillOut: The created skill.
+
+    Raises:
+        HTTPException: If the profile does not exist (404), if the skill already exists (409) or if there is an internal server error (500).
+    """
+    return await database.write_coalescer.submit(
+        lambda db: services.SkillService.create(
+            db=db, skill=skill, personal_id=personal_id
+        )
+    )
+
+
+@personal_skill_router.get(
+    path="/",
+    response_model=List[schemas.SkillOut],
+    summary="Get all skills of a profile.",
+    description="Get all skills of a profile.",
+)
+async def get_all(
+    request: Request,
+    db: AsyncSession = Depends(database.get_read_db),
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    page: Optional[PositiveInt] = Query(ge=1, default=1, description="Page number."),
+    items_per_page: Optional[PositiveInt] = Query(
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Items per page.",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque cursor from X-Next-Cursor; overrides page.",
+    ),
+) -> Response:
+    """
+    Retrieves the skills of a profile.
+
+    Pages are read from the (personal_id, id) index, so with a cursor a page
+    costs the same however many skills the other profiles hold. The
+    profile's number of skills is returned in `X-Total-Count`. The ETag is
+    derived from the version of the profile's skills, so writes to other
+    profiles do not invalidate it.
+
+    Args:
+        request (Request): The incoming request.
+        db (AsyncSession): A database session.
+        personal_id (PositiveInt): The ID of the personal record.
+        page (Optional[PositiveInt]): Page number. Defaults to 1.
+        items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+        cursor (Optional[str]): Opaque cursor of the page to fetch.
+
+    Returns:
+        Response: JSON list of schemas.SkillOut.
+
+    Raises:
+        HTTPException: If the profile or its skills are not found (404) or if there is an internal server error (500).
+    """
+    after_id = utils.decode_cursor(cursor) if cursor is not None else None
+    version = await services.SkillService.get_version(db=db, personal_id=personal_id)
+    etag = utils.make_etag(
+        "GET /skills/", personal_id, version, page, items_per_page, after_id
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response = compression.not_modified(request, headers)
+    if response is not None:
+        return response
+    cached_page = await services.SkillService.get_all(
+        db=db,
+        page=page,
+        items_per_page=items_per_page,
+        after_id=after_id,
+        version=version,
+        personal_id=personal_id,
+    )
+    response = compression.not_modified(request, headers, len(cached_page.body))
+    if response is not None:
+        return response
+    encoding = compression.negotiate(
+        request.headers.get("Accept-Encoding"), len(cached_page.body)
+    )
+    response = Response(
+        content=cached_page.encoded(encoding),
+        media_type="application/json",
+        headers=compression.encoding_headers(headers, encoding),
+    )
+    response.headers["X-Total-Count"] = str(cached_page.total)
+    if cached_page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = cached_page.next_cursor
+    return response
+
+
+@personal_skill_router.patch(
+    path="/{id}",
+    response_model=schemas.SkillOut,
+    summary="Update skill of a profile.",
+    description="Update skill of a profile.",
+)
+async def update_by_id(
+    personal_id: PositiveInt = Path(description="ID of the personal record."),
+    id: PositiveInt = Path(description="Skill ID to update."),
+    skill: schemas.SkillUpdate = Body(description="Skill to update."),
+) -> schemas.SkillOut:
+    """
+    Updates a skill of a profile.
+
+    Args:
+        personal_id (PositiveInt): The ID of the personal record.
+        id (PositiveInt): The ID of the skill to update.
+        skill (schemas.SkillUpdate): The skill to update.
+
+    Returns:
+        schemas.SkillOut: The updated skill.
+
+    Raises:
+        HTTPException: If the skill does not exist in the profile (404), if the name already exists (409) or if there is an internal server error (500).
+    """
+    return await database.write_coalescer.submit(
+        lambda db: services.SkillService.update_by_id(
+            db=db, id=id, skill=skill, personal_id=personal_id
+        )
+    )
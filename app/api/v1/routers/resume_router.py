@@ -0,0 +1,103 @@
+from .. import schemas, database, services, utils, renderers, compression
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Path, Request, Response
+
+resume_router = APIRouter()
+
+
+@resume_router.get(
+    path="/",
+    response_model=schemas.ResumeOut,
+    summary="Get legacy resume.",
+    description=(
+        "Get the first personal record with the skills and languages that "
+        "belong to no profile. Use /personal/{personal_id}/resume instead."
+    ),
+    deprecated=True,
+)
+async def get(request: Request) -> Response:
+    """
+    Retrieves the legacy resume in a single request.
+
+    Kept from before profiles existed: it holds the first personal record
+    with the skills and languages that have no profile, and ignores every
+    profile's own skills and languages.
+
+    The ETag is derived from the versions of the personal, skills and
+    languages tables; a matching If-None-Match is answered with 304 Not
+    Modified without reading the resume. Otherwise the versions and the
+    resume are read again in one snapshot, and the ETag sent is the one of
+    the data actually returned. The JSON, and its gzip or brotli variant, is
+    cached per version of the data.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Response: JSON of schemas.ResumeOut.
+
+    Raises:
+        HTTPException: If there is no personal record (404) or if there is an internal server error (500).
+    """
+    versions = await services.ResumeService.get_versions()
+    etag = utils.make_etag("resume", sorted(versions.items()))
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response = compression.not_modified(request, headers)
+    if response is not None:
+        return response
+    versions, cached_body = await services.ResumeService.get_body()
+    headers["ETag"] = utils.make_etag("resume", sorted(versions.items()))
+    response = compression.not_modified(request, headers, len(cached_body.body))
+    if response is not None:
+        return response
+    encoding = compression.negotiate(
+        request.headers.get("Accept-Encoding"), len(cached_body.body)
+    )
+    return Response(
+        content=cached_body.encoded(encoding),
+        media_type="application/json",
+        headers=compression.encoding_headers(headers, encoding),
+    )
+
+
+@resume_router.get(
+    path="/{format}",
+    response_class=Response,
+    summary="Get rendered legacy resume.",
+    description=(
+        "Get the legacy resume rendered as JSON Resume, Markdown or HTML. "
+        "Use /personal/{personal_id}/resume/{format} instead."
+    ),
+    deprecated=True,
+    responses={
+        200: {
+            "content": {
+                "application/json": {},
+                "text/markdown": {},
+                "text/html": {},
+            }
+        }
+    },
+)
+async def render(
+    db: AsyncSession = Depends(database.get_read_db),
+    format: utils.ResumeFormat = Path(description="Format of the rendering."),
+) -> Response:
+    """
+    Retrieves a precomputed rendering of the legacy resume.
+
+    Renderings are rebuilt section by section when the data changes, so
+    serving one is a single read of the stored document.
+
+    Args:
+        db (AsyncSession): A database session.
+        format (utils.ResumeFormat): Format of the rendering.
+
+    Returns:
+        Response: The rendered resume.
+
+    Raises:
+        HTTPException: If there is an internal server error (500).
+    """
+    document = await services.RenderingService.get(db=db, format=format)
+    return Response(content=document, media_type=renderers.RENDERERS[format].media_type)
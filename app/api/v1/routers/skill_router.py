@@ -1,8 +1,9 @@
 from pydantic import PositiveInt
 from typing import List, Optional
-from .. import schemas, database, services
+from .. import schemas, database, services, utils, compression
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import APIRouter, Path, Query, status, Body, Depends
+from fastapi import APIRouter, Path, Query, status, Body, Depends, Request, Response
 
 skill_router = APIRouter()
 
@@ -15,14 +16,12 @@ skill_router = APIRouter()
     description="Create skill.",
 )
 async def create(
-    db: AsyncSession = Depends(database.get_db),
     skill: schemas.SkillIn = Body(description="Skill to create."),
 ) -> schemas.SkillOut:
     """
     Creates a skill in the database.
 
     Args:
-        db (AsyncSession): A database session.
         skill (schemas.SkillIn): The skill to create.
 
     Returns:
@@ -31,7 +30,42 @@ async def create(
     Raises:
         HTTPException: If the skill already exists (409) or if there is an internal server error (500).
     """
-    return await services.SkillService.create(db=db, skill=skill)
+    return await database.write_coalescer.submit(
+        lambda db: services.SkillService.create(db=db, skill=skill)
+    )
+
+
+@skill_router.post(
+    path="/bulk",
+    response_model=List[schemas.SkillBulkResult],
+    summary="Create skills in bulk.",
+    description="Create skills in bulk.",
+)
+async def bulk_create(
+    db: AsyncSession = Depends(database.get_db, scope="function"),
+    skills: List[schemas.SkillIn] = Body(
+        min_length=1,
+        max_length=utils.MAX_BULK_ITEMS,
+        description="Skills to create.",
+    ),
+) -> List[schemas.SkillBulkResult]:
+    """
+    Creates many skills in the database in one transaction.
+
+    A skill whose name already exists is reported as a conflict without
+    aborting the rest of the batch.
+
+    Args:
+        db (AsyncSession): A database session.
+        skills (List[schemas.SkillIn]): The skills to create.
+
+    Returns:
+        List[schemas.SkillBulkResult]: The outcome of each skill, in request order.
+
+    Raises:
+        HTTPException: If there is an internal server error (500).
+    """
+    return await services.SkillService.bulk_create(db=db, skills=skills)
 
 
 @skill_router.get(
@@ -41,28 +75,174 @@ async def create(
     description="Get all skills.",
 )
 async def get_all(
-    db: AsyncSession = Depends(database.get_db),
+    request: Request,
+    db: AsyncSession = Depends(database.get_read_db),
     page: Optional[PositiveInt] = Query(ge=1, default=1, description="Page number."),
     items_per_page: Optional[PositiveInt] = Query(
-        ge=1, default=100, description="Items per page."
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Items per page.",
     ),
-) -> List[schemas.SkillOut]:
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque cursor from X-Next-Cursor; overrides page.",
+    ),
+) -> Response:
     """
     Retrieves all skills from the database.
 
+    Full pages carry an `X-Next-Cursor` header that can be passed back as
+    `cursor` to fetch the next page by seeking on the ID index. Every page
+    carries the number of skills in `X-Total-Count`, read from a counter
+    maintained by triggers rather than counted.
+
+    Responses carry a strong ETag derived from the version of the unscoped
+    skills, which writes to profiles leave alone; a matching If-None-Match
+    is answered with 304 Not Modified before the page is read.
+
+    Pages are sent gzip or brotli compressed to clients that accept it; the
+    compressed variant is cached with the page, so it is built once.
+
     Args:
+        request (Request): The incoming request.
         db (AsyncSession): A database session.
         page (Optional[PositiveInt]): Page number. Defaults to 1.
         items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+        cursor (Optional[str]): Opaque cursor of the page to fetch.
 
     Returns:
-        List[schemas.SkillOut]: List of skills.
+        Response: JSON list of schemas.SkillOut.
 
     Raises:
         HTTPException: If skills not found (404) or if there is an internal server error (500).
     """
-    return await services.SkillService.get_all(
-        db=db, page=page, items_per_page=items_per_page
+    after_id = utils.decode_cursor(cursor) if cursor is not None else None
+    version = await services.SkillService.get_version(db=db)
+    etag = utils.make_etag(
+        "GET /skills/", None, version, page, items_per_page, after_id
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response = compression.not_modified(request, headers)
+    if response is not None:
+        return response
+    cached_page = await services.SkillService.get_all(
+        db=db,
+        page=page,
+        items_per_page=items_per_page,
+        after_id=after_id,
+        version=version,
+    )
+    response = compression.not_modified(request, headers, len(cached_page.body))
+    if response is not None:
+        return response
+    encoding = compression.negotiate(
+        request.headers.get("Accept-Encoding"), len(cached_page.body)
+    )
+    response = Response(
+        content=cached_page.encoded(encoding),
+        media_type="application/json",
+        headers=compression.encoding_headers(headers, encoding),
+    )
+    response.headers["X-Total-Count"] = str(cached_page.total)
+    if cached_page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = cached_page.next_cursor
+    return response
+
+
+@skill_router.get(
+    path="/by-name/{name}",
+    response_model=schemas.SkillOut,
+    summary="Get skill by name.",
+    description="Get skill by name, ignoring case and whitespace.",
+)
+async def get_by_name(
+    db: AsyncSession = Depends(database.get_read_db),
+    name: str = Path(min_length=1, max_length=50, description="Name of skill."),
+) -> schemas.SkillOut:
+    """
+    Retrieves a skill by name.
+
+    "python", "Python" and " PYTHON " all name the same skill.
+
+    Args:
+        db (AsyncSession): A database session.
+        name (str): The name of the skill.
+
+    Returns:
+        schemas.SkillOut: The skill.
+
+    Raises:
+        HTTPException: If the skill does not exist (404) or if there is an internal server error (500).
+    """
+    return await services.SkillService.get_by_name(db=db, name=name)
+
+
+@skill_router.get(
+    path="/search",
+    response_model=List[schemas.SkillOut],
+    summary="Search skills.",
+    description="Search skills by name prefix or substring.",
+)
+async def search(
+    db: AsyncSession = Depends(database.get_read_db),
+    q: str = Query(
+        min_length=1,
+        max_length=utils.MAX_SEARCH_QUERY_LENGTH,
+        description="Text to look for in the name, ignoring case.",
+    ),
+    mode: utils.SearchMode = Query(
+        default=utils.SearchMode.SUBSTRING,
+        description="Match names starting with q, or containing it.",
+    ),
+    items_per_page: Optional[PositiveInt] = Query(
+        ge=1,
+        le=utils.MAX_ITEMS_PER_PAGE,
+        default=utils.DEFAULT_ITEMS_PER_PAGE,
+        description="Maximum number of skills.",
+    ),
+) -> Response:
+    """
+    Searches skills by name through the full-text index.
+
+    Args:
+        db (AsyncSession): A database session.
+        q (str): Text to look for.
+        mode (utils.SearchMode): Match names starting with q, or containing it.
+        items_per_page (Optional[PositiveInt]): Maximum number of skills. Defaults to 100.
+
+    Returns:
+        Response: JSON list of schemas.SkillOut, shortest names first.
+
+    Raises:
+        HTTPException: If there is an internal server error (500).
+    """
+    body = await services.SkillService.search(
+        db=db, q=q, mode=mode, items_per_page=items_per_page
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@skill_router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    summary="Export all skills.",
+    description="Export all skills as newline-delimited JSON (application/x-ndjson).",
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export(db: AsyncSession = Depends(database.get_read_db)) -> StreamingResponse:
+    """
+    Streams all skills from the database as newline-delimited JSON.
+
+    Args:
+        db (AsyncSession): A database session.
+
+    Returns:
+        StreamingResponse: One SkillOut JSON object per line.
+    """
+    return StreamingResponse(
+        content=services.SkillService.export(db=db),
+        media_type="application/x-ndjson",
     )
 
 
@@ -73,7 +253,6 @@ async def get_all(
     description="Update skill.",
 )
 async def update_by_id(
-    db: AsyncSession = Depends(database.get_db),
     id: int = Path(gt=0, description="ID of skill."),
     skill: schemas.SkillUpdate = Body(description="Skill to update."),
 ) -> schemas.SkillOut:
@@ -81,7 +260,6 @@ async def update_by_id(
     Updates a skill in the database.
 
     Args:
-        db (AsyncSession): A database session.
         id (int): The id of the skill to update.
         skill (schemas.SkillUpdate): The skill to update.
 
@@ -91,4 +269,6 @@ async def update_by_id(
     Raises:
         HTTPException: If the skill does not exist (404) or if there is an internal server error (500).
     """
-    return await services.SkillService.update_by_id(db=db, id=id, skill=skill)
+    return await database.write_coalescer.submit(
+        lambda db: services.SkillService.update_by_id(db=db, id=id, skill=skill)
+    )
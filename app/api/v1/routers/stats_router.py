@@ -0,0 +1,20 @@
+from .. import schemas, services
+from fastapi import APIRouter
+
+stats_router = APIRouter()
+
+
+@stats_router.get(
+    path="/",
+    response_model=schemas.StatsOut,
+    summary="Get runtime stats.",
+    description="Get runtime stats.",
+)
+async def get() -> schemas.StatsOut:
+    """
+    Retrieves the runtime counters of the API, such as cache hits and misses.
+
+    Returns:
+        schemas.StatsOut: The runtime counters.
+    """
+    return await services.StatsService.get()
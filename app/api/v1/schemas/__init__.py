@@ -1,16 +1,48 @@
 from .root_schema import RootOut
-from .language_schema import LanguageIn, LanguageOut, LanguageUpdate
-from .skill_schema import SkillIn, SkillOut, SkillUpdate
+from .language_schema import (
+    LanguageIn,
+    LanguageOut,
+    LanguageUpdate,
+    LanguageBulkResult,
+    LanguageRow,
+)
+from .skill_schema import (
+    SkillIn,
+    SkillOut,
+    SkillUpdate,
+    SkillBulkResult,
+    SkillRow,
+)
 from .personal_schema import PersonalIn, PersonalOut
+from .resume_schema import ResumeOut
+from .change_schema import ChangeOut
+from .stats_schema import (
+    CacheStatsOut,
+    TransactionStatsOut,
+    PoolStatsOut,
+    AdmissionStatsOut,
+    StatsOut,
+)
 
 __all__ = [
     "RootOut",
     "LanguageIn",
     "LanguageOut",
     "LanguageUpdate",
+    "LanguageBulkResult",
+    "LanguageRow",
     "SkillIn",
     "SkillOut",
     "SkillUpdate",
+    "SkillBulkResult",
+    "SkillRow",
     "PersonalIn",
     "PersonalOut",
+    "ResumeOut",
+    "ChangeOut",
+    "CacheStatsOut",
+    "TransactionStatsOut",
+    "PoolStatsOut",
+    "AdmissionStatsOut",
+    "StatsOut",
 ]
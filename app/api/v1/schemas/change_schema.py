@@ -0,0 +1,18 @@
+from .. import utils
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field, PositiveInt
+
+
+class ChangeOut(BaseModel):
+    id: PositiveInt = Field(description="ID of change, sent as the SSE event id.")
+    table: str = Field(description="Table that changed: skills, languages or personal.")
+    operation: utils.ChangeOperation = Field(description="Kind of write.")
+    row_id: PositiveInt = Field(description="ID of the row that changed.")
+    personal_id: Optional[int] = Field(
+        default=None, description="ID of the profile of the row, if any."
+    )
+    data: Optional[Dict[str, Any]] = Field(
+        default=None, description="Columns of the row after the write; none if deleted."
+    )
+    changed_at: datetime = Field(description="Date and time of change.")
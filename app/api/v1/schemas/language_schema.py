@@ -1,5 +1,5 @@
 from .. import utils
-from typing import Optional
+from typing import Optional, TypedDict
 from datetime import datetime
 from pydantic import BaseModel, Field, PositiveInt
 
@@ -51,3 +51,35 @@ class LanguageOut(LanguageIn):
 
     class Config:
         from_attributes = True
+
+
+class LanguageBulkResult(BaseModel):
+    index: int = Field(
+        ge=0, description="Position of the language in the request.", examples=[0, 1, 2]
+    )
+    status: utils.BulkStatus = Field(
+        description="Outcome of the language.", examples=[s for s in utils.BulkStatus]
+    )
+    language: Optional[LanguageOut] = Field(
+        default=None, description="The created language, if it was created."
+    )
+    detail: Optional[str] = Field(
+        default=None,
+        description="Reason why the language was not created.",
+        examples=["Language already exists."],
+    )
+
+
+class LanguageRow(TypedDict):
+    """
+    A language as read from the database, in LanguageOut field order.
+
+    Rows are trusted database output, so they are serialized straight to
+    JSON without being validated into LanguageOut first.
+    """
+
+    name: str
+    proficiency: str
+    id: int
+    created_at: datetime
+    updated_at: datetime
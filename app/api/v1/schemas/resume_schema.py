@@ -0,0 +1,11 @@
+from typing import List
+from pydantic import BaseModel, Field
+from .skill_schema import SkillOut
+from .language_schema import LanguageOut
+from .personal_schema import PersonalOut
+
+
+class ResumeOut(BaseModel):
+    personal: PersonalOut = Field(description="Personal data of the resume.")
+    skills: List[SkillOut] = Field(description="Skills of the resume.")
+    languages: List[LanguageOut] = Field(description="Languages of the resume.")
@@ -1,4 +1,5 @@
-from typing import Optional
+from .. import utils
+from typing import Optional, TypedDict
 from datetime import datetime
 from pydantic import BaseModel, PositiveInt, Field
 
@@ -36,3 +37,34 @@ class SkillUpdate(BaseModel):
         description="Name of skill.",
         examples=["Python", "Java", "JavaScript", "C++", "C#"],
     )
+
+
+class SkillBulkResult(BaseModel):
+    index: int = Field(
+        ge=0, description="Position of the skill in the request.", examples=[0, 1, 2]
+    )
+    status: utils.BulkStatus = Field(
+        description="Outcome of the skill.", examples=[s for s in utils.BulkStatus]
+    )
+    skill: Optional[SkillOut] = Field(
+        default=None, description="The created skill, if it was created."
+    )
+    detail: Optional[str] = Field(
+        default=None,
+        description="Reason why the skill was not created.",
+        examples=["Skill already exists."],
+    )
+
+
+class SkillRow(TypedDict):
+    """
+    A skill as read from the database, in SkillOut field order.
+
+    Rows are trusted database output, so they are serialized straight to
+    JSON without being validated into SkillOut first.
+    """
+
+    name: str
+    id: int
+    created_at: datetime
+    updated_at: datetime
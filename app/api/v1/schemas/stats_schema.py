@@ -0,0 +1,61 @@
+from typing import Dict
+from pydantic import BaseModel, Field
+
+
+class CacheStatsOut(BaseModel):
+    hits: int = Field(ge=0, description="Lookups served from the cache.")
+    misses: int = Field(ge=0, description="Lookups that went to the database.")
+    evictions: int = Field(ge=0, description="Pages dropped to respect max_entries.")
+    invalidations: int = Field(ge=0, description="Pages dropped by writes.")
+    size: int = Field(ge=0, description="Pages currently cached.")
+    max_entries: int = Field(ge=0, description="Maximum number of cached pages.")
+    ttl_seconds: float = Field(ge=0, description="Time to live of a cached page.")
+
+
+class TransactionStatsOut(BaseModel):
+    transactions: int = Field(ge=0, description="Transactions begun.")
+    commits: int = Field(ge=0, description="Transactions committed.")
+    write_commits: int = Field(ge=0, description="Commits that wrote at least one row.")
+    rollbacks: int = Field(ge=0, description="Transactions rolled back.")
+
+
+class PoolStatsOut(BaseModel):
+    size: int = Field(ge=0, description="Connections kept open by the pool.")
+    checked_out: int = Field(ge=0, description="Connections currently in use.")
+    overflow: int = Field(ge=0, description="Connections open beyond the pool size.")
+    checkouts: int = Field(ge=0, description="Connections checked out since startup.")
+    wait_seconds: float = Field(
+        ge=0, description="Time spent waiting for a connection since startup."
+    )
+
+
+class AdmissionStatsOut(BaseModel):
+    limit: int = Field(ge=0, description="Requests admitted at a time.")
+    queue_size: int = Field(ge=0, description="Requests allowed to wait for a slot.")
+    active: int = Field(ge=0, description="Requests currently admitted.")
+    queued: int = Field(ge=0, description="Requests currently waiting.")
+    admitted: int = Field(ge=0, description="Requests admitted since startup.")
+    shed_queue_full: int = Field(
+        ge=0, description="Requests rejected because the queue was full."
+    )
+    shed_queue_timeout: int = Field(
+        ge=0, description="Requests rejected after waiting too long."
+    )
+    queue_wait_seconds: float = Field(
+        ge=0, description="Time spent waiting for a slot since startup."
+    )
+
+
+class StatsOut(BaseModel):
+    caches: Dict[str, CacheStatsOut] = Field(
+        description="Response cache counters, by resource."
+    )
+    transactions: TransactionStatsOut = Field(
+        description="Database transaction counters since startup."
+    )
+    pools: Dict[str, PoolStatsOut] = Field(
+        description="Connection pool usage, by engine (read or write)."
+    )
+    admission: Dict[str, AdmissionStatsOut] = Field(
+        description="Admission control counters, by limiter (read or write)."
+    )
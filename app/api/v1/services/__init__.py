@@ -1,5 +1,22 @@
+from .rendering_service import RenderingService
 from .language_service import LanguageService
 from .skill_service import SkillService
 from .personal_service import PersonalService
+from .resume_service import ResumeService
+from .stats_service import StatsService
+from .warmup_service import WarmupService
+from .idempotency_service import IdempotencyService, StoredResponse
+from .change_service import ChangeService
 
-__all__ = ["LanguageService", "SkillService", "PersonalService"]
+__all__ = [
+    "LanguageService",
+    "SkillService",
+    "PersonalService",
+    "ResumeService",
+    "RenderingService",
+    "StatsService",
+    "WarmupService",
+    "IdempotencyService",
+    "StoredResponse",
+    "ChangeService",
+]
@@ -0,0 +1,39 @@
+from typing import AsyncIterator, Optional
+from .. import changes, config
+
+RESET_EVENT = "reset"
+
+
+class ChangeService:
+    @staticmethod
+    async def stream(last_event_id: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Streams the changes to skills, languages and personal data as
+        Server-Sent Events.
+
+        Each change is a `change` event whose id is its position in the
+        change log, so a client reconnecting with Last-Event-ID gets the
+        changes it missed first. If some of them were already dropped from
+        the log, a `reset` event is sent instead, after which the client
+        should reload its data. Comments are sent while idle to keep the
+        connection open.
+
+        Args:
+            last_event_id (Optional[int]): The last change the client has seen.
+
+        Returns:
+            AsyncIterator[bytes]: The event stream.
+        """
+        yield changes.format_retry()
+        previous = last_event_id
+        async for event in changes.broadcaster.subscribe(
+            last_event_id=last_event_id,
+            heartbeat_seconds=config.settings.changes_heartbeat_seconds,
+        ):
+            if event is None:
+                yield changes.format_comment("ping")
+                continue
+            if previous is not None and event.id != previous + 1:
+                yield changes.format_event(event.id - 1, RESET_EVENT, "{}")
+            previous = event.id
+            yield event.message
@@ -0,0 +1,142 @@
+import time
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+from .. import crud, config, database
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """
+    The first response to a request carrying an Idempotency-Key.
+    """
+
+    fingerprint: str
+    status_code: int
+    content_type: Optional[str]
+    body: bytes
+
+    @property
+    def reserved(self) -> bool:
+        """
+        Whether the request committed but its response was not stored.
+        """
+        return self.status_code == crud.IdempotencyKeyCrud.RESERVED_STATUS_CODE
+
+
+class IdempotencyService:
+    @staticmethod
+    def key(method: str, path: str, idempotency_key: str) -> str:
+        """
+        Derives the stored key of a request, so the same Idempotency-Key
+        sent to two endpoints names two responses.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path of the request.
+            idempotency_key (str): The value of the Idempotency-Key header.
+
+        Returns:
+            str: A fixed-size digest of the three.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (method, path, idempotency_key):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def fingerprint(query_string: bytes, body: bytes) -> str:
+        """
+        Digests the parts of a request that a retry must repeat.
+
+        Args:
+            query_string (bytes): The raw query string.
+            body (bytes): The raw request body.
+
+        Returns:
+            str: The digest.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(query_string)
+        digest.update(b"\0")
+        digest.update(body)
+        return digest.hexdigest()
+
+    @staticmethod
+    async def get(
+        key: str, session_factory: async_sessionmaker = database.ReadSession
+    ) -> Optional[StoredResponse]:
+        """
+        Retrieves the response stored for a key, unless it expired.
+
+        Args:
+            key (str): The key, see IdempotencyService.key.
+            session_factory (async_sessionmaker): Factory of the session used to read it.
+
+        Returns:
+            Optional[StoredResponse]: The stored response, if any.
+        """
+        async with session_factory() as db:
+            row = await crud.IdempotencyKeyCrud.get(
+                db=db, key=key, now=int(time.time())
+            )
+        if row is None:
+            return None
+        return StoredResponse(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            content_type=row.content_type,
+            body=row.body,
+        )
+
+    @staticmethod
+    async def reserve(db: AsyncSession, key: str, fingerprint: str) -> None:
+        """
+        Reserves a key in the transaction of the request's write, so a retry
+        cannot repeat a write that committed even if its response is lost.
+
+        Args:
+            db (AsyncSession): The session of the write.
+            key (str): The key, see IdempotencyService.key.
+            fingerprint (str): The fingerprint of the request.
+        """
+        now = int(time.time())
+        await crud.IdempotencyKeyCrud.reserve(
+            db=db,
+            key=key,
+            fingerprint=fingerprint,
+            now=now,
+            expires_at=now + config.settings.idempotency_ttl_seconds,
+        )
+
+    @staticmethod
+    async def save(key: str, response: StoredResponse) -> None:
+        """
+        Stores the response of a key until it expires.
+
+        The write goes through the write coalescer, in the same transaction
+        as the expired keys it purges. It fills the reservation made with
+        the request's write; if a response was already stored for the key,
+        it is kept.
+
+        Args:
+            key (str): The key, see IdempotencyService.key.
+            response (StoredResponse): The response to store.
+        """
+        now = int(time.time())
+
+        async def write(db: AsyncSession) -> None:
+            await crud.IdempotencyKeyCrud.delete_expired(db=db, now=now)
+            await crud.IdempotencyKeyCrud.save(
+                db=db,
+                key=key,
+                fingerprint=response.fingerprint,
+                status_code=response.status_code,
+                content_type=response.content_type,
+                body=response.body,
+                expires_at=now + config.settings.idempotency_ttl_seconds,
+            )
+
+        await database.write_coalescer.submit(write)
@@ -1,43 +1,103 @@
-from .. import schemas, crud
-from pydantic import PositiveInt
-from typing import List, Optional
+from .. import schemas, crud, models, utils, cache, database
+from pydantic import PositiveInt, TypeAdapter
+from typing import AsyncIterator, List, Optional
 from fastapi import status, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from .rendering_service import RenderingService
+from .personal_service import PersonalService
+
+languages_adapter = TypeAdapter(List[schemas.LanguageRow])
 
 
 class LanguageService:
+    @staticmethod
+    async def get_version(db: AsyncSession, personal_id: Optional[int] = None) -> int:
+        """
+        Retrieves the version stamp of the languages of one profile.
+
+        Args:
+            db (AsyncSession): A database session.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
+
+        Returns:
+            int: The version, bumped by every write to the languages of the profile.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            return await crud.row_counts.get_version(
+                db=db, name=models.Language.__tablename__, personal_id=personal_id
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get languages version: {str(e)}",
+            )
+
     @staticmethod
     async def get_all(
         db: AsyncSession,
         page: Optional[PositiveInt] = 1,
         items_per_page: Optional[PositiveInt] = 100,
-    ) -> List[schemas.LanguageOut]:
+        after_id: Optional[int] = None,
+        version: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> cache.CachedPage:
         """
-        Retrieves all languages from the database.
+        Retrieves all languages from the database, serialized as a JSON list.
+
+        Pages are served from the in-process language cache when possible; on a
+        miss the page is read, serialized once and stored for later requests.
 
         Args:
             db (AsyncSession): A database session.
             page (Optional[PositiveInt]): Page number. Defaults to 1.
             items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+            after_id (Optional[int]): Return languages with an ID greater than this one.
+            version (Optional[int]): Version of the profile's languages read before the page.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
-            List[schemas.LanguageOut]: List of languages.
+            cache.CachedPage: The JSON body of the page, its next cursor and the total.
 
         Raises:
             HTTPException: If languages not found (404) or if there is an internal server error (500).
         """
+        items_per_page = utils.clamp_items_per_page(items_per_page)
+        page = None if after_id is not None else (page or 1)
+        key = ("GET /languages/", personal_id, version, page, items_per_page, after_id)
+        cached_page = cache.language_cache.get(key)
+        if cached_page is not None:
+            return cached_page
+        generation = cache.language_cache.generation
         try:
-            languages = await crud.LanguageCrud.get_all(
-                db=db, page=page, items_per_page=items_per_page
+            languages = await crud.languages.get_all(
+                db=db,
+                page=page,
+                items_per_page=items_per_page,
+                after_id=after_id,
+                personal_id=personal_id,
             )
             if not languages:
+                if personal_id is not None:
+                    await PersonalService.ensure_exists(db=db, id=personal_id)
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Languages not found."
                 )
-            return [
-                schemas.LanguageOut.model_validate(language) for language in languages
-            ]
+            cached_page = cache.CachedPage(
+                body=languages_adapter.dump_json(languages),
+                first_id=languages[0]["id"],
+                last_id=languages[-1]["id"],
+                scope=personal_id,
+                next_cursor=utils.next_cursor(languages, items_per_page),
+                total=await crud.row_counts.get_count(
+                    db=db, name=models.Language.__tablename__, personal_id=personal_id
+                ),
+            )
+            cache.language_cache.set(key, cached_page, generation)
+            return cached_page
         except HTTPException:
             raise
         except Exception as e:
@@ -46,9 +106,95 @@ class LanguageService:
                 detail=f"Failed to get languages: {str(e)}",
             )
 
+    @staticmethod
+    async def export(db: AsyncSession) -> AsyncIterator[bytes]:
+        """
+        Exports all languages as newline-delimited JSON.
+
+        Rows are read through a server-side cursor and encoded one chunk at a
+        time, so memory use does not grow with the size of the table.
+
+        Args:
+            db (AsyncSession): A database session.
+
+        Yields:
+            bytes: One or more NDJSON lines, each holding a LanguageOut.
+        """
+        result = await crud.languages.stream_all(db=db)
+        async for languages in result.partitions():
+            yield b"".join(
+                schemas.LanguageOut.model_validate(language).model_dump_json().encode()
+                + b"\n"
+                for language in languages
+            )
+
+    @staticmethod
+    async def get_by_name(db: AsyncSession, name: str) -> schemas.LanguageOut:
+        """
+        Retrieves a language by name, ignoring case and whitespace.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the language.
+
+        Returns:
+            schemas.LanguageOut: The language.
+
+        Raises:
+            HTTPException: If the language does not exist (404) or if there is an internal server error (500).
+        """
+        try:
+            language = await crud.languages.get_by_name(db=db, name=name)
+            return schemas.LanguageOut.model_validate(language)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get language: {str(e)}",
+            )
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        items_per_page: Optional[PositiveInt] = 100,
+    ) -> bytes:
+        """
+        Searches languages by name, serialized as a JSON list.
+
+        Args:
+            db (AsyncSession): A database session.
+            q (str): Text to look for.
+            mode (utils.SearchMode): Match names starting with `q`, or containing it.
+            items_per_page (Optional[PositiveInt]): Maximum number of languages. Defaults to 100.
+
+        Returns:
+            bytes: JSON list of the matching languages, possibly empty.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            languages = await crud.languages.search(
+                db=db,
+                q=q,
+                mode=mode,
+                limit=utils.clamp_items_per_page(items_per_page),
+            )
+            return languages_adapter.dump_json(languages)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to search languages: {str(e)}",
+            )
+
     @staticmethod
     async def create(
-        db: AsyncSession, language: schemas.LanguageIn
+        db: AsyncSession,
+        language: schemas.LanguageIn,
+        personal_id: Optional[int] = None,
     ) -> schemas.LanguageOut:
         """
         Creates a language in the database.
@@ -56,15 +202,28 @@ class LanguageService:
         Args:
             db (AsyncSession): A database session.
             language (schemas.LanguageIn): The language to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
             schemas.LanguageOut: The created language.
 
         Raises:
-            HTTPException: If the language already exists (409) or if there is an internal server error (500).
+            HTTPException: If the profile does not exist (404), if the language already exists (409) or if there is an internal server error (500).
         """
+        if personal_id is not None:
+            await PersonalService.ensure_exists(db=db, id=personal_id)
         try:
-            created_language = await crud.LanguageCrud.create(db=db, language=language)
+            created_language = await crud.languages.create(
+                db=db, language=language, personal_id=personal_id
+            )
+            database.on_commit(
+                db, lambda: cache.language_cache.invalidate_created(personal_id)
+            )
+            RenderingService.schedule_rebuild(
+                db=db,
+                sections=[utils.ResumeSection.LANGUAGES],
+                personal_id=personal_id,
+            )
             return schemas.LanguageOut.model_validate(created_language)
         except IntegrityError:
             raise HTTPException(
@@ -78,13 +237,71 @@ class LanguageService:
             )
 
     @staticmethod
-    async def delete_by_id(db: AsyncSession, id: PositiveInt) -> None:
+    async def bulk_create(
+        db: AsyncSession, languages: List[schemas.LanguageIn]
+    ) -> List[schemas.LanguageBulkResult]:
+        """
+        Creates many languages in the database in one transaction.
+
+        Args:
+            db (AsyncSession): A database session.
+            languages (List[schemas.LanguageIn]): The languages to create.
+
+        Returns:
+            List[schemas.LanguageBulkResult]: The outcome of each language, in request order.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            created_languages = await crud.languages.bulk_create(
+                db=db, languages=languages
+            )
+            if created_languages:
+                database.on_commit(db, cache.language_cache.invalidate_created)
+                RenderingService.schedule_rebuild(
+                    db=db, sections=[utils.ResumeSection.LANGUAGES]
+                )
+            created_by_name = {
+                language.name: language for language in created_languages
+            }
+            results = []
+            for index, language in enumerate(languages):
+                created_language = created_by_name.pop(language.name, None)
+                if created_language is None:
+                    results.append(
+                        schemas.LanguageBulkResult(
+                            index=index,
+                            status=utils.BulkStatus.CONFLICT,
+                            detail="Language already exists.",
+                        )
+                    )
+                    continue
+                results.append(
+                    schemas.LanguageBulkResult(
+                        index=index,
+                        status=utils.BulkStatus.CREATED,
+                        language=schemas.LanguageOut.model_validate(created_language),
+                    )
+                )
+            return results
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create languages: {str(e)}",
+            )
+
+    @staticmethod
+    async def delete_by_id(
+        db: AsyncSession, id: PositiveInt, personal_id: Optional[int] = None
+    ) -> None:
         """
         Deletes a language by its ID from the database.
 
         Args:
             db (AsyncSession): A database session.
             id (PositiveInt): The ID of the language to delete.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
             None
@@ -93,7 +310,15 @@ class LanguageService:
             HTTPException: If the language does not exist (404) or if there is an internal server error (500).
         """
         try:
-            await crud.LanguageCrud.delete_by_id(db=db, id=id)
+            await crud.languages.delete_by_id(db=db, id=id, personal_id=personal_id)
+            database.on_commit(
+                db, lambda: cache.language_cache.invalidate_deleted(id, personal_id)
+            )
+            RenderingService.schedule_rebuild(
+                db=db,
+                sections=[utils.ResumeSection.LANGUAGES],
+                personal_id=personal_id,
+            )
         except HTTPException:
             raise
         except Exception as e:
@@ -104,7 +329,10 @@ class LanguageService:
 
     @staticmethod
     async def update_by_id(
-        db: AsyncSession, id: PositiveInt, language: schemas.LanguageUpdate
+        db: AsyncSession,
+        id: PositiveInt,
+        language: schemas.LanguageUpdate,
+        personal_id: Optional[int] = None,
     ) -> schemas.LanguageOut:
         """
         Updates a language by its ID in the database.
@@ -113,6 +341,7 @@ class LanguageService:
             db (AsyncSession): A database session.
             id (PositiveInt): The ID of the language to update.
             language (schemas.LanguageUpdate): The language to update.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped languages.
 
         Returns:
             schemas.LanguageOut: The updated language.
@@ -121,8 +350,14 @@ class LanguageService:
             HTTPException: If the language does not exist (404) or if there is an internal server error (500).
         """
         try:
-            updated_language = await crud.LanguageCrud.update_by_id(
-                db=db, id=id, language=language
+            updated_language = await crud.languages.update_by_id(
+                db=db, id=id, language=language, personal_id=personal_id
+            )
+            database.on_commit(db, lambda: cache.language_cache.invalidate_updated(id))
+            RenderingService.schedule_rebuild(
+                db=db,
+                sections=[utils.ResumeSection.LANGUAGES],
+                personal_id=personal_id,
             )
             return schemas.LanguageOut.model_validate(updated_language)
         except HTTPException:
@@ -1,7 +1,10 @@
-from .. import schemas, crud
+from .. import schemas, crud, utils
+from typing import List, Optional
+from pydantic import PositiveInt
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from .rendering_service import RenderingService
 
 
 class PersonalService:
@@ -10,7 +13,13 @@ class PersonalService:
         db: AsyncSession, personal: schemas.PersonalIn
     ) -> schemas.PersonalOut:
         try:
-            created_personal = await crud.PersonalCrud.create(db=db, personal=personal)
+            created_personal = await crud.personal.create(db=db, personal=personal)
+            RenderingService.schedule_rebuild(
+                db=db, sections=[utils.ResumeSection.BASICS]
+            )
+            RenderingService.schedule_rebuild(
+                db=db, sections=utils.ResumeSection, personal_id=created_personal.id
+            )
             return schemas.PersonalOut.model_validate(created_personal)
         except IntegrityError:
             raise HTTPException(
@@ -22,3 +31,62 @@ class PersonalService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create personal: {str(e)}",
             )
+
+    @staticmethod
+    async def ensure_exists(db: AsyncSession, id: PositiveInt) -> None:
+        """
+        Checks that a personal record exists before its profile is accessed.
+
+        Args:
+            db (AsyncSession): A database session.
+            id (PositiveInt): The ID of the personal record.
+
+        Raises:
+            HTTPException: If the personal record does not exist (404) or if there is an internal server error (500).
+        """
+        try:
+            exists = await crud.personal.exists(db=db, id=id)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get personal: {str(e)}",
+            )
+        if not exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Personal not found."
+            )
+
+    @staticmethod
+    async def search(
+        db: AsyncSession, q: str, items_per_page: Optional[PositiveInt] = 100
+    ) -> List[schemas.PersonalOut]:
+        """
+        Searches personal records by job title and professional summary.
+
+        Every word of `q` must appear, the last one as a prefix; words are
+        matched on their stems, so "engineering" also finds "engineer".
+
+        Args:
+            db (AsyncSession): A database session.
+            q (str): Free text to look for.
+            items_per_page (Optional[PositiveInt]): Maximum number of records. Defaults to 100.
+
+        Returns:
+            List[schemas.PersonalOut]: The matching records, best match first.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        terms = utils.match_terms(q)
+        if terms is None:
+            return []
+        try:
+            personals = await crud.personal.search(
+                db=db, terms=terms, limit=utils.clamp_items_per_page(items_per_page)
+            )
+            return [schemas.PersonalOut.model_validate(p) for p in personals]
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to search personal: {str(e)}",
+            )
@@ -0,0 +1,167 @@
+from typing import Iterable, Optional
+from .. import schemas, crud, utils, database, renderers
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DOCUMENT_SECTION = "document"
+REBUILD_SECTIONS = "rebuild_sections"
+
+
+class RenderingService:
+    @staticmethod
+    async def rebuild(
+        db: AsyncSession,
+        sections: Iterable[utils.ResumeSection],
+        personal_id: Optional[int] = None,
+    ) -> None:
+        """
+        Re-renders the given sections of one resume in every format.
+
+        Only the data of the requested sections is read; the stored output of
+        the other sections is reused to assemble each document. Sections that
+        were never rendered are rendered as well. Every skill and language
+        is rendered, however many there are. Runs in the caller's
+        transaction, so renderings always match the committed data.
+
+        The resume of a profile holds its personal record, skills and
+        languages. The legacy resume, with no personal_id, holds the first
+        personal record and the skills and languages without a profile.
+
+        Args:
+            db (AsyncSession): A database session.
+            sections (Iterable[utils.ResumeSection]): The sections that changed.
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+        """
+        stored = await crud.RenderingCrud.get_all(db=db, personal_id=personal_id)
+        sections = set(sections) | {
+            section
+            for section in utils.ResumeSection
+            for format in utils.ResumeFormat
+            if (format.value, section.value) not in stored
+        }
+        data = {}
+        if utils.ResumeSection.BASICS in sections:
+            if personal_id is None:
+                personal = await crud.personal.get_first(db=db)
+            else:
+                personal = await crud.personal.get_by_id(db=db, id=personal_id)
+            data[utils.ResumeSection.BASICS] = (
+                schemas.PersonalOut.model_validate(personal) if personal else None
+            )
+        if utils.ResumeSection.SKILLS in sections:
+            skills = await crud.read_all(crud.skills, db=db, personal_id=personal_id)
+            data[utils.ResumeSection.SKILLS] = [
+                schemas.SkillOut.model_validate(skill) for skill in skills
+            ]
+        if utils.ResumeSection.LANGUAGES in sections:
+            languages = await crud.read_all(
+                crud.languages, db=db, personal_id=personal_id
+            )
+            data[utils.ResumeSection.LANGUAGES] = [
+                schemas.LanguageOut.model_validate(language) for language in languages
+            ]
+
+        scope = personal_id or 0
+        rows = []
+        for format, renderer in renderers.RENDERERS.items():
+            render = {
+                utils.ResumeSection.BASICS: renderer.render_basics,
+                utils.ResumeSection.SKILLS: renderer.render_skills,
+                utils.ResumeSection.LANGUAGES: renderer.render_languages,
+            }
+            for section in sections:
+                content = render[section](data[section])
+                stored[(format.value, section.value)] = content
+                rows.append(
+                    {
+                        "scope": scope,
+                        "format": format.value,
+                        "section": section.value,
+                        "content": content,
+                    }
+                )
+            document = renderer.assemble(
+                {
+                    section: stored[(format.value, section.value)]
+                    for section in utils.ResumeSection
+                }
+            )
+            rows.append(
+                {
+                    "scope": scope,
+                    "format": format.value,
+                    "section": DOCUMENT_SECTION,
+                    "content": document,
+                }
+            )
+        await crud.RenderingCrud.upsert(db=db, renderings=rows)
+
+    @staticmethod
+    def schedule_rebuild(
+        db: AsyncSession,
+        sections: Iterable[utils.ResumeSection],
+        personal_id: Optional[int] = None,
+    ) -> None:
+        """
+        Re-renders the given sections of one resume just before the session
+        commits.
+
+        Sections scheduled by several writes of one transaction, e.g. a batch
+        of the write coalescer, are merged and rendered once per resume.
+
+        Args:
+            db (AsyncSession): A session yielded by get_db or used by the write coalescer.
+            sections (Iterable[utils.ResumeSection]): The sections that changed.
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+        """
+        key = (REBUILD_SECTIONS, personal_id)
+        db.info.setdefault(key, set()).update(sections)
+
+        async def rebuild(db: AsyncSession) -> None:
+            await RenderingService.rebuild(
+                db=db, sections=db.info.pop(key, set()), personal_id=personal_id
+            )
+
+        database.before_commit(db, key, rebuild)
+
+    @staticmethod
+    async def get(
+        db: AsyncSession,
+        format: utils.ResumeFormat,
+        personal_id: Optional[int] = None,
+    ) -> str:
+        """
+        Retrieves a precomputed rendering of a resume.
+
+        Serving is a single read of the stored document; it never writes.
+        Renderings are built by the writes that change the resume, and at
+        startup for resumes that have none, see WarmupService.build_renderings.
+
+        Args:
+            db (AsyncSession): A database session.
+            format (utils.ResumeFormat): The format of the rendering.
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+
+        Returns:
+            str: The rendered resume.
+
+        Raises:
+            HTTPException: If the resume was not rendered (404) or if there is an internal server error (500).
+        """
+        try:
+            document: Optional[str] = await crud.RenderingCrud.get_content(
+                db=db,
+                format=format.value,
+                section=DOCUMENT_SECTION,
+                personal_id=personal_id,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to render resume: {str(e)}",
+            )
+        if document is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Resume not rendered."
+            )
+        return document
@@ -0,0 +1,168 @@
+from typing import Dict, Optional, Tuple
+from .. import schemas, crud, models, cache, database
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+RESUME_TABLES = (
+    models.Personal.__tablename__,
+    models.Skill.__tablename__,
+    models.Language.__tablename__,
+)
+
+
+async def _read_versions(
+    db: AsyncSession, personal_id: Optional[int]
+) -> Dict[str, int]:
+    if personal_id is None:
+        return {
+            models.Personal.__tablename__: await crud.row_counts.get_table_version(
+                db=db, name=models.Personal.__tablename__
+            ),
+            models.Skill.__tablename__: await crud.row_counts.get_version(
+                db=db, name=models.Skill.__tablename__
+            ),
+            models.Language.__tablename__: await crud.row_counts.get_version(
+                db=db, name=models.Language.__tablename__
+            ),
+        }
+    return {
+        name: await crud.row_counts.get_version(
+            db=db, name=name, personal_id=personal_id
+        )
+        for name in RESUME_TABLES
+    }
+
+
+class ResumeService:
+    @staticmethod
+    async def get_versions(
+        personal_id: Optional[int] = None,
+        session_factory: async_sessionmaker = database.ReadSession,
+    ) -> Dict[str, int]:
+        """
+        Retrieves the version stamps of the data a resume is built from.
+
+        A profile's resume is stamped with the versions of its personal
+        record, skills and languages, so writes to other profiles leave it
+        alone. The legacy resume is stamped with the version of the whole
+        personal table, as the first personal record can change with any
+        write to it, and with the versions of the unscoped skills and
+        languages.
+
+        The session is closed before returning, so its connection is back in
+        the pool before get_body() checks out the one it reads with.
+
+        Args:
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+            session_factory (async_sessionmaker): Factory of the read session.
+
+        Returns:
+            Dict[str, int]: The version of each table.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            async with session_factory() as db:
+                return await _read_versions(db=db, personal_id=personal_id)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get resume version: {str(e)}",
+            )
+
+    @staticmethod
+    async def get(
+        db: AsyncSession, personal_id: Optional[int] = None
+    ) -> schemas.ResumeOut:
+        """
+        Retrieves the personal record, skills and languages of a resume.
+
+        The resume of a profile holds its personal record, skills and
+        languages. The legacy resume, with no personal_id, holds the first
+        personal record and the skills and languages without a profile.
+
+        Every skill and language is read, through a server-side cursor, so
+        the resume is never cut at a page size. The three reads go through
+        the one session given; read them inside database.read_snapshot for
+        a resume that reflects a single state of the data.
+
+        Args:
+            db (AsyncSession): A database session.
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+
+        Returns:
+            schemas.ResumeOut: The resume.
+
+        Raises:
+            HTTPException: If there is no personal record (404) or if there is an internal server error (500).
+        """
+        try:
+            if personal_id is None:
+                personal = await crud.personal.get_first(db=db)
+            else:
+                personal = await crud.personal.get_by_id(db=db, id=personal_id)
+            if personal is not None:
+                skills = await crud.read_all(
+                    crud.skills, db=db, personal_id=personal_id
+                )
+                languages = await crud.read_all(
+                    crud.languages, db=db, personal_id=personal_id
+                )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get resume: {str(e)}",
+            )
+        if personal is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Personal not found."
+            )
+        return schemas.ResumeOut(
+            personal=schemas.PersonalOut.model_validate(personal),
+            skills=[schemas.SkillOut.model_validate(s) for s in skills],
+            languages=[schemas.LanguageOut.model_validate(lang) for lang in languages],
+        )
+
+    @staticmethod
+    async def get_body(
+        personal_id: Optional[int] = None,
+        session_factory: async_sessionmaker = database.ReadSession,
+    ) -> Tuple[Dict[str, int], cache.CachedBody]:
+        """
+        Retrieves a resume serialized as JSON, from the resume cache if possible.
+
+        The versions and the rows are read in one read transaction, so the
+        body returned is exactly the data those versions stamp, even if a
+        write commits while it is read. The cache is keyed by the resume and
+        its versions, so each resume is read and serialized, and each
+        compressed variant built, once per version of its data.
+
+        Args:
+            personal_id (Optional[int]): ID of the profile; None for the legacy resume.
+            session_factory (async_sessionmaker): Factory of the read session.
+
+        Returns:
+            Tuple[Dict[str, int], cache.CachedBody]: The versions of the
+            resume data and the JSON of schemas.ResumeOut.
+
+        Raises:
+            HTTPException: If there is no personal record (404) or if there is an internal server error (500).
+        """
+        async with database.read_snapshot(session_factory) as db:
+            try:
+                versions = await _read_versions(db=db, personal_id=personal_id)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to get resume version: {str(e)}",
+                )
+            key = ("GET /resume/", personal_id, tuple(sorted(versions.items())))
+            cached_body = cache.resume_cache.get(key)
+            if cached_body is not None:
+                return versions, cached_body
+            generation = cache.resume_cache.generation
+            resume = await ResumeService.get(db=db, personal_id=personal_id)
+        cached_body = cache.CachedBody(body=resume.model_dump_json().encode())
+        cache.resume_cache.set(key, cached_body, generation)
+        return versions, cached_body
@@ -1,29 +1,112 @@
-from .. import schemas, crud
-from typing import List, Optional
-from pydantic import PositiveInt
+from .. import schemas, crud, models, utils, cache, database
+from typing import AsyncIterator, List, Optional
+from pydantic import PositiveInt, TypeAdapter
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from .rendering_service import RenderingService
+from .personal_service import PersonalService
+
+skills_adapter = TypeAdapter(List[schemas.SkillRow])
 
 
 class SkillService:
     @staticmethod
-    async def create(db: AsyncSession, skill: schemas.SkillIn) -> schemas.SkillOut:
+    async def get_by_name(db: AsyncSession, name: str) -> schemas.SkillOut:
+        """
+        Retrieves a skill by name, ignoring case and whitespace.
+
+        Args:
+            db (AsyncSession): A database session.
+            name (str): The name of the skill.
+
+        Returns:
+            schemas.SkillOut: The skill.
+
+        Raises:
+            HTTPException: If the skill does not exist (404) or if there is an internal server error (500).
+        """
+        try:
+            skill = await crud.skills.get_by_name(db=db, name=name)
+            return schemas.SkillOut.model_validate(skill)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get skill: {str(e)}",
+            )
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        q: str,
+        mode: utils.SearchMode = utils.SearchMode.SUBSTRING,
+        items_per_page: Optional[PositiveInt] = 100,
+    ) -> bytes:
+        """
+        Searches skills by name, serialized as a JSON list.
+
+        Args:
+            db (AsyncSession): A database session.
+            q (str): Text to look for.
+            mode (utils.SearchMode): Match names starting with `q`, or containing it.
+            items_per_page (Optional[PositiveInt]): Maximum number of skills. Defaults to 100.
+
+        Returns:
+            bytes: JSON list of the matching skills, possibly empty.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            skills = await crud.skills.search(
+                db=db,
+                q=q,
+                mode=mode,
+                limit=utils.clamp_items_per_page(items_per_page),
+            )
+            return skills_adapter.dump_json(skills)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to search skills: {str(e)}",
+            )
+
+    @staticmethod
+    async def create(
+        db: AsyncSession,
+        skill: schemas.SkillIn,
+        personal_id: Optional[int] = None,
+    ) -> schemas.SkillOut:
         """
         Creates a skill in the database.
 
         Args:
             db (AsyncSession): A database session.
             skill (schemas.SkillIn): The skill to create.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
 
         Returns:
             schemas.SkillOut: The created skill.
 
         Raises:
-            HTTPException: If the skill already exists (409) or if there is an internal server error (500).
+            HTTPException: If the profile does not exist (404), if the skill already exists (409) or if there is an internal server error (500).
         """
+        if personal_id is not None:
+            await PersonalService.ensure_exists(db=db, id=personal_id)
         try:
-            created_skill = await crud.SkillCrud.create(db=db, skill=skill)
+            created_skill = await crud.skills.create(
+                db=db, skill=skill, personal_id=personal_id
+            )
+            database.on_commit(
+                db, lambda: cache.skill_cache.invalidate_created(personal_id)
+            )
+            RenderingService.schedule_rebuild(
+                db=db,
+                sections=[utils.ResumeSection.SKILLS],
+                personal_id=personal_id,
+            )
             return schemas.SkillOut.model_validate(created_skill)
         except IntegrityError:
             raise HTTPException(
@@ -36,35 +119,144 @@ class SkillService:
                 detail=f"Failed to create skill: {str(e)}",
             )
 
+    @staticmethod
+    async def bulk_create(
+        db: AsyncSession, skills: List[schemas.SkillIn]
+    ) -> List[schemas.SkillBulkResult]:
+        """
+        Creates many skills in the database in one transaction.
+
+        Args:
+            db (AsyncSession): A database session.
+            skills (List[schemas.SkillIn]): The skills to create.
+
+        Returns:
+            List[schemas.SkillBulkResult]: The outcome of each skill, in request order.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            created_skills = await crud.skills.bulk_create(db=db, skills=skills)
+            if created_skills:
+                database.on_commit(db, cache.skill_cache.invalidate_created)
+                RenderingService.schedule_rebuild(
+                    db=db, sections=[utils.ResumeSection.SKILLS]
+                )
+            created_by_name = {skill.name: skill for skill in created_skills}
+            results = []
+            for index, skill in enumerate(skills):
+                created_skill = created_by_name.pop(skill.name, None)
+                if created_skill is None:
+                    results.append(
+                        schemas.SkillBulkResult(
+                            index=index,
+                            status=utils.BulkStatus.CONFLICT,
+                            detail="Skill already exists.",
+                        )
+                    )
+                    continue
+                results.append(
+                    schemas.SkillBulkResult(
+                        index=index,
+                        status=utils.BulkStatus.CREATED,
+                        skill=schemas.SkillOut.model_validate(created_skill),
+                    )
+                )
+            return results
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create skills: {str(e)}",
+            )
+
+    @staticmethod
+    async def get_version(db: AsyncSession, personal_id: Optional[int] = None) -> int:
+        """
+        Retrieves the version stamp of the skills of one profile.
+
+        Args:
+            db (AsyncSession): A database session.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
+
+        Returns:
+            int: The version, bumped by every write to the skills of the profile.
+
+        Raises:
+            HTTPException: If there is an internal server error (500).
+        """
+        try:
+            return await crud.row_counts.get_version(
+                db=db, name=models.Skill.__tablename__, personal_id=personal_id
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get skills version: {str(e)}",
+            )
+
     @staticmethod
     async def get_all(
         db: AsyncSession,
         page: Optional[PositiveInt] = 1,
         items_per_page: Optional[PositiveInt] = 100,
-    ) -> List[schemas.SkillOut]:
+        after_id: Optional[int] = None,
+        version: Optional[int] = None,
+        personal_id: Optional[int] = None,
+    ) -> cache.CachedPage:
         """
-        Retrieves all skills from the database.
+        Retrieves all skills from the database, serialized as a JSON list.
+
+        Pages are served from the in-process skill cache when possible; on a
+        miss the page is read, serialized once and stored for later requests.
 
         Args:
             db (AsyncSession): A database session.
             page (Optional[PositiveInt]): Page number. Defaults to 1.
             items_per_page (Optional[PositiveInt]): Items per page. Defaults to 100.
+            after_id (Optional[int]): Return skills with an ID greater than this one.
+            version (Optional[int]): Version of the profile's skills read before the page.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
 
         Returns:
-            List[schemas.SkillOut]: List of skills.
+            cache.CachedPage: The JSON body of the page, its next cursor and the total.
 
         Raises:
             HTTPException: If skills not found (404) or if there is an internal server error (500).
         """
+        items_per_page = utils.clamp_items_per_page(items_per_page)
+        page = None if after_id is not None else (page or 1)
+        key = ("GET /skills/", personal_id, version, page, items_per_page, after_id)
+        cached_page = cache.skill_cache.get(key)
+        if cached_page is not None:
+            return cached_page
+        generation = cache.skill_cache.generation
         try:
-            skills = await crud.SkillCrud.get_all(
-                db=db, page=page, items_per_page=items_per_page
+            skills = await crud.skills.get_all(
+                db=db,
+                page=page,
+                items_per_page=items_per_page,
+                after_id=after_id,
+                personal_id=personal_id,
             )
             if not skills:
+                if personal_id is not None:
+                    await PersonalService.ensure_exists(db=db, id=personal_id)
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Skills not found."
                 )
-            return [schemas.SkillOut.model_validate(s) for s in skills]
+            cached_page = cache.CachedPage(
+                body=skills_adapter.dump_json(skills),
+                first_id=skills[0]["id"],
+                last_id=skills[-1]["id"],
+                scope=personal_id,
+                next_cursor=utils.next_cursor(skills, items_per_page),
+                total=await crud.row_counts.get_count(
+                    db=db, name=models.Skill.__tablename__, personal_id=personal_id
+                ),
+            )
+            cache.skill_cache.set(key, cached_page, generation)
+            return cached_page
         except HTTPException:
             raise
         except Exception as e:
@@ -73,9 +265,34 @@ class SkillService:
                 detail=f"Failed to get skills: {str(e)}",
             )
 
+    @staticmethod
+    async def export(db: AsyncSession) -> AsyncIterator[bytes]:
+        """
+        Exports all skills as newline-delimited JSON.
+
+        Rows are read through a server-side cursor and encoded one chunk at a
+        time, so memory use does not grow with the size of the table.
+
+        Args:
+            db (AsyncSession): A database session.
+
+        Yields:
+            bytes: One or more NDJSON lines, each holding a SkillOut.
+        """
+        result = await crud.skills.stream_all(db=db)
+        async for skills in result.partitions():
+            yield b"".join(
+                schemas.SkillOut.model_validate(skill).model_dump_json().encode()
+                + b"\n"
+                for skill in skills
+            )
+
     @staticmethod
     async def update_by_id(
-        db: AsyncSession, id: int, skill: schemas.SkillUpdate
+        db: AsyncSession,
+        id: int,
+        skill: schemas.SkillUpdate,
+        personal_id: Optional[int] = None,
     ) -> schemas.SkillOut:
         """
         Updates a skill by its ID in the database.
@@ -84,6 +301,7 @@ class SkillService:
             db (AsyncSession): A database session.
             id (int): The ID of the skill to update.
             skill (schemas.SkillUpdate): The skill to update.
+            personal_id (Optional[int]): ID of the profile; None for the unscoped skills.
 
         Returns:
             schemas.SkillOut: The updated skill.
@@ -92,14 +310,22 @@ class SkillService:
             HTTPException: If the skill does not exist (404), if there is an internal server error (500) or if the skill name already exists (409).
         """
         try:
-            updated_skill = await crud.SkillCrud.update_by_id(db=db, id=id, skill=skill)
+            updated_skill = await crud.skills.update_by_id(
+                db=db, id=id, skill=skill, personal_id=personal_id
+            )
+            database.on_commit(db, lambda: cache.skill_cache.invalidate_updated(id))
+            RenderingService.schedule_rebuild(
+                db=db,
+                sections=[utils.ResumeSection.SKILLS],
+                personal_id=personal_id,
+            )
             return schemas.SkillOut.model_validate(updated_skill)
         except HTTPException:
             raise
         except IntegrityError:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail="Language with this name already exists.",
+                detail="Skill with this name already exists.",
             )
         except Exception as e:
             raise HTTPException(
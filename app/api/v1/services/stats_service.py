@@ -0,0 +1,30 @@
+from .. import schemas, cache, database, admission
+
+
+class StatsService:
+    @staticmethod
+    async def get() -> schemas.StatsOut:
+        """
+        Collects the runtime counters of the API.
+
+        Returns:
+            schemas.StatsOut: The runtime counters.
+        """
+        return schemas.StatsOut(
+            caches={
+                "skills": schemas.CacheStatsOut(**cache.skill_cache.stats()),
+                "languages": schemas.CacheStatsOut(**cache.language_cache.stats()),
+                "resume": schemas.CacheStatsOut(**cache.resume_cache.stats()),
+            },
+            transactions=schemas.TransactionStatsOut(
+                **database.engine_transaction_stats.as_dict()
+            ),
+            pools={
+                name: schemas.PoolStatsOut(**usage)
+                for name, usage in database.pool_stats().items()
+            },
+            admission={
+                name: schemas.AdmissionStatsOut(**limiter.stats())
+                for name, limiter in admission.LIMITERS.items()
+            },
+        )
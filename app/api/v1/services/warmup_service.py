@@ -0,0 +1,104 @@
+from typing import Dict, List, Optional
+from .. import crud, models, utils, database
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from .rendering_service import DOCUMENT_SECTION, RenderingService
+
+
+class WarmupService:
+    @staticmethod
+    async def load_memory_store(
+        session_factory: async_sessionmaker = database.ReadSession,
+    ) -> Dict[str, int]:
+        """
+        Loads the rows of the database into the in-memory backend, if it is used.
+
+        The in-memory repositories then serve a read-only snapshot of the
+        database as of startup; the app rejects writes in that mode.
+
+        Args:
+            session_factory (async_sessionmaker): Factory of the read session.
+
+        Returns:
+            Dict[str, int]: The number of rows loaded, per table; empty with
+            the SQL backend.
+        """
+        if crud.memory_store is None:
+            return {}
+        async with session_factory() as db:
+            return await crud.memory_store.load(db=db)
+
+    @staticmethod
+    async def build_renderings(
+        session_factory: async_sessionmaker = database.ReadSession,
+    ) -> int:
+        """
+        Renders the resumes that have no stored rendering yet.
+
+        Writes keep renderings current, but databases migrated from before
+        they were scoped per profile have none for existing profiles. They
+        are rendered here, in one write through the write coalescer, so
+        serving a rendering never writes.
+
+        Args:
+            session_factory (async_sessionmaker): Factory of the read session.
+
+        Returns:
+            int: The number of resumes rendered.
+        """
+        async with session_factory() as db:
+            legacy = await crud.RenderingCrud.get_content(
+                db=db,
+                format=utils.ResumeFormat.JSON.value,
+                section=DOCUMENT_SECTION,
+            )
+            profiles = await crud.RenderingCrud.get_unrendered_profiles(
+                db=db, section=DOCUMENT_SECTION
+            )
+        scopes: List[Optional[int]] = ([None] if legacy is None else []) + profiles
+        if not scopes:
+            return 0
+
+        async def write(db: AsyncSession) -> None:
+            for personal_id in scopes:
+                await RenderingService.rebuild(
+                    db=db, sections=[], personal_id=personal_id
+                )
+
+        await database.write_coalescer.submit(write)
+        return len(scopes)
+
+    @staticmethod
+    async def warm_statements(
+        session_factory: async_sessionmaker = database.ReadSession,
+    ) -> None:
+        """
+        Runs the hot read queries once so their compiled forms are cached.
+
+        SQLAlchemy compiles a statement the first time its shape is executed
+        and reuses the compiled form afterwards; running the list, version,
+        count and rendering reads at startup moves that cost out of the first
+        requests. Limits and IDs are bound parameters, so one execution warms
+        every page. Writes are not warmed, as that would change the data.
+
+        Args:
+            session_factory (async_sessionmaker): Factory of the read session.
+        """
+        async with session_factory() as db:
+            await crud.row_counts.get_table_version(
+                db=db, name=models.Personal.__tablename__
+            )
+            for table_crud, model in (
+                (crud.skills, models.Skill),
+                (crud.languages, models.Language),
+            ):
+                await crud.row_counts.get_count(db=db, name=model.__tablename__)
+                await crud.row_counts.get_version(db=db, name=model.__tablename__)
+                await table_crud.get_all(db=db, items_per_page=1)
+                await table_crud.get_all(db=db, items_per_page=1, after_id=0)
+            await crud.personal.get_first(db=db)
+            await crud.personal.get_by_id(db=db, id=1)
+            await crud.RenderingCrud.get_content(
+                db=db,
+                format=utils.ResumeFormat.JSON.value,
+                section=DOCUMENT_SECTION,
+            )
@@ -1,3 +1,50 @@
-from .enums import Proficiency
+from .enums import (
+    Proficiency,
+    BulkStatus,
+    ResumeFormat,
+    ResumeSection,
+    SearchMode,
+    RepositoryBackend,
+    ChangeOperation,
+)
+from .limits import MAX_BULK_ITEMS
+from .names import normalize_name
+from .etag import make_etag, etag_matches
+from .search import (
+    MIN_TRIGRAM_LENGTH,
+    MAX_SEARCH_QUERY_LENGTH,
+    quote_phrase,
+    match_terms,
+)
+from .pagination import (
+    DEFAULT_ITEMS_PER_PAGE,
+    MAX_ITEMS_PER_PAGE,
+    encode_cursor,
+    decode_cursor,
+    clamp_items_per_page,
+    next_cursor,
+)
 
-__all__ = ["Proficiency"]
+__all__ = [
+    "Proficiency",
+    "BulkStatus",
+    "ResumeFormat",
+    "ResumeSection",
+    "SearchMode",
+    "RepositoryBackend",
+    "ChangeOperation",
+    "MAX_BULK_ITEMS",
+    "normalize_name",
+    "make_etag",
+    "etag_matches",
+    "MIN_TRIGRAM_LENGTH",
+    "MAX_SEARCH_QUERY_LENGTH",
+    "quote_phrase",
+    "match_terms",
+    "DEFAULT_ITEMS_PER_PAGE",
+    "MAX_ITEMS_PER_PAGE",
+    "encode_cursor",
+    "decode_cursor",
+    "clamp_items_per_page",
+    "next_cursor",
+]
@@ -1,3 +1,17 @@
 from .proficiency_enum import Proficiency
+from .bulk_status_enum import BulkStatus
+from .resume_format_enum import ResumeFormat
+from .resume_section_enum import ResumeSection
+from .search_mode_enum import SearchMode
+from .repository_backend_enum import RepositoryBackend
+from .change_operation_enum import ChangeOperation
 
-__all__ = ["Proficiency"]
+__all__ = [
+    "Proficiency",
+    "BulkStatus",
+    "ResumeFormat",
+    "ResumeSection",
+    "SearchMode",
+    "RepositoryBackend",
+    "ChangeOperation",
+]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class BulkStatus(str, Enum):
+    CREATED = "created"
+    CONFLICT = "conflict"
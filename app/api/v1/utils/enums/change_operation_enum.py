@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ChangeOperation(str, Enum):
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
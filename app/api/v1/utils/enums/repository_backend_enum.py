@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class RepositoryBackend(str, Enum):
+    """
+    Where the repositories read from; MEMORY is a read-only snapshot.
+    """
+
+    SQL = "sql"
+    MEMORY = "memory"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ResumeFormat(str, Enum):
+    JSON = "json"
+    MARKDOWN = "markdown"
+    HTML = "html"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ResumeSection(str, Enum):
+    BASICS = "basics"
+    SKILLS = "skills"
+    LANGUAGES = "languages"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SearchMode(str, Enum):
+    PREFIX = "prefix"
+    SUBSTRING = "substring"
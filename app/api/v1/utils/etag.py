@@ -0,0 +1,40 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a strong ETag from the parts that identify a representation.
+
+    Args:
+        *parts: Values such as the table version and the query parameters.
+
+    Returns:
+        str: A quoted entity tag.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an ETag.
+
+    Uses the weak comparison of If-None-Match, so a W/ prefix is ignored.
+    Each compressed variant has its own tag; pass the tag of the variant
+    that would be sent.
+
+    Args:
+        if_none_match (Optional[str]): The raw If-None-Match header.
+        etag (str): The current ETag of the representation.
+
+    Returns:
+        bool: Whether the client already holds the current representation.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
@@ -0,0 +1 @@
+MAX_BULK_ITEMS = 1000
@@ -0,0 +1,14 @@
+def normalize_name(name: str) -> str:
+    """
+    Builds the key under which a name is unique and looked up.
+
+    Names that differ only in case or whitespace, such as "Python",
+    "python" and " PYTHON ", share one key.
+
+    Args:
+        name (str): The name as entered.
+
+    Returns:
+        str: The casefolded name with runs of whitespace collapsed to one space.
+    """
+    return " ".join(name.split()).casefold()
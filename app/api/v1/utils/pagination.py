@@ -0,0 +1,81 @@
+import base64
+import binascii
+from typing import Mapping, Optional, Sequence
+from fastapi import HTTPException, status
+
+DEFAULT_ITEMS_PER_PAGE = 100
+MAX_ITEMS_PER_PAGE = 500
+
+_CURSOR_PREFIX = "id:"
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encodes the ID of the last item of a page into an opaque cursor.
+
+    Args:
+        last_id (int): The ID of the last item of the page.
+
+    Returns:
+        str: The opaque cursor.
+    """
+    raw = f"{_CURSOR_PREFIX}{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decodes an opaque cursor back into the ID to seek after.
+
+    Args:
+        cursor (str): The opaque cursor.
+
+    Returns:
+        int: The ID after which the next page starts.
+
+    Raises:
+        HTTPException: If the cursor is malformed (400).
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(cursor + padding).decode()
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError(raw)
+        after_id = int(raw[len(_CURSOR_PREFIX) :])
+        if after_id < 0:
+            raise ValueError(raw)
+        return after_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        )
+
+
+def clamp_items_per_page(items_per_page: Optional[int]) -> int:
+    """
+    Bounds the page size to the server-enforced maximum.
+
+    Args:
+        items_per_page (Optional[int]): Requested items per page.
+
+    Returns:
+        int: Items per page between 1 and MAX_ITEMS_PER_PAGE.
+    """
+    items_per_page = items_per_page or DEFAULT_ITEMS_PER_PAGE
+    return max(1, min(items_per_page, MAX_ITEMS_PER_PAGE))
+
+
+def next_cursor(items: Sequence[Mapping], items_per_page: int) -> Optional[str]:
+    """
+    Builds the cursor of the page following the given one.
+
+    Args:
+        items (Sequence[Mapping]): Rows of the current page, ordered by ID.
+        items_per_page (int): Items per page of the current page.
+
+    Returns:
+        Optional[str]: The next cursor, or None if this is the last page.
+    """
+    if len(items) < clamp_items_per_page(items_per_page):
+        return None
+    return encode_cursor(items[-1]["id"])
@@ -0,0 +1,41 @@
+import re
+from typing import Optional
+
+MIN_TRIGRAM_LENGTH = 3
+MAX_SEARCH_QUERY_LENGTH = 100
+
+_WORD = re.compile(r"\w+")
+
+
+def quote_phrase(text: str) -> str:
+    """
+    Quotes text as a single FTS5 phrase, so it is matched literally.
+
+    Args:
+        text (str): The text to quote.
+
+    Returns:
+        str: The quoted phrase.
+    """
+    return '"' + text.replace('"', '""') + '"'
+
+
+def match_terms(text: str) -> Optional[str]:
+    """
+    Builds an FTS5 query matching documents that contain every word of `text`.
+
+    The last word is matched as a prefix, so results follow the user as they
+    type.
+
+    Args:
+        text (str): Free text entered by the user.
+
+    Returns:
+        Optional[str]: The FTS5 query, or None if `text` has no words.
+    """
+    words = _WORD.findall(text)
+    if not words:
+        return None
+    terms = [quote_phrase(word) for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
@@ -1,16 +1,56 @@
+import logging
+from time import perf_counter
 from pydantic import AnyHttpUrl
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from .api.v1 import schemas, database, api_v1_router
+from .api.v1 import (
+    schemas,
+    database,
+    config,
+    crud,
+    utils,
+    metrics,
+    services,
+    compression,
+    idempotency,
+    admission,
+    api_v1_router,
+)
+
+logger = logging.getLogger("uvicorn.error")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    Creates all tables in the database on application startup and
-    yields control back to the caller after the tables have been created.
+    Applies pending schema migrations on application startup, loads the
+    in-memory repositories when they are used, renders the resumes that
+    have no stored rendering, optionally pre-warms the connection pool and
+    the compiled statement cache, and logs the startup time against the
+    configured budget before yielding control back to the caller.
     """
-    await database.create_tables()
+    started = perf_counter()
+    applied = await database.migrate()
+    migrated = perf_counter()
+    await services.WarmupService.load_memory_store()
+    await services.WarmupService.build_renderings()
+    if config.settings.database_prewarm:
+        await database.prewarm_pool(config.settings.database_pool_size)
+        await services.WarmupService.warm_statements()
+    finished = perf_counter()
+    elapsed_ms = (finished - started) * 1000
+    budget_ms = config.settings.startup_budget_ms
+    log = logger.warning if elapsed_ms > budget_ms else logger.info
+    log(
+        "Startup took %.1f ms of a %d ms budget "
+        "(migrations %.1f ms, %d applied; loading and warm-up %.1f ms).",
+        elapsed_ms,
+        budget_ms,
+        (migrated - started) * 1000,
+        len(applied),
+        (finished - migrated) * 1000,
+    )
     yield
 
 
@@ -25,6 +65,84 @@ app = FastAPI(
 app.include_router(router=api_v1_router, prefix="/api/v1")
 
 
+if config.settings.database_trace_transactions:
+
+    @app.middleware("http")
+    async def trace_transactions(request: Request, call_next):
+        """
+        Reports the database transactions of each request in response headers.
+
+        X-DB-Transactions counts transactions begun and X-DB-Write-Commits the
+        commits that wrote rows, i.e. appends to the write-ahead log.
+        """
+        transaction_stats = database.TransactionStats()
+        token = database.request_transaction_stats.set(transaction_stats)
+        try:
+            response = await call_next(request)
+        finally:
+            database.request_transaction_stats.reset(token)
+        response.headers["X-DB-Transactions"] = str(transaction_stats.transactions)
+        response.headers["X-DB-Write-Commits"] = str(transaction_stats.write_commits)
+        return response
+
+
+if config.settings.idempotency_enabled:
+    app.add_middleware(idempotency.IdempotencyMiddleware)
+
+if config.settings.compression_enabled:
+    app.add_middleware(compression.CompressionMiddleware)
+
+if config.settings.admission_enabled:
+    app.add_middleware(
+        admission.AdmissionMiddleware,
+        read=admission.read_limiter,
+        write=admission.write_limiter,
+        retry_after_seconds=config.settings.admission_retry_after_seconds,
+        exempt_paths=("/metrics", "/api/v1/stats", "/api/v1/changes/stream"),
+    )
+
+if crud.repository_backend == utils.RepositoryBackend.MEMORY:
+    READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    @app.middleware("http")
+    async def reject_writes(request: Request, call_next):
+        """
+        Serves the in-memory backend as a read-only snapshot.
+
+        Writes would only reach the in-memory rows, while the renderings,
+        change log, counters and idempotency keys live in the database, so
+        they are rejected with 405 before any other middleware runs.
+        """
+        if request.method in READ_METHODS:
+            return await call_next(request)
+        return JSONResponse(
+            status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+            content={"detail": "The in-memory backend is read-only."},
+            headers={"Allow": ", ".join(READ_METHODS)},
+        )
+
+
+if config.settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get(
+        path="/metrics",
+        response_class=Response,
+        summary="Get metrics.",
+        description="Get request, SQL and pool metrics in the Prometheus text format.",
+    )
+    async def get_metrics() -> Response:
+        """
+        Renders the metrics for a Prometheus scrape.
+
+        Returns:
+            Response: The metrics in the Prometheus text exposition format.
+        """
+        return Response(
+            content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE
+        )
+
+
 @app.get(
     path="/",
     response_model=schemas.RootOut,
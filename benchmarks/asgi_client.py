@@ -0,0 +1,85 @@
+import json
+import asyncio
+from typing import Any, Optional, Tuple
+from urllib.parse import urlencode
+
+
+class AsgiClient:
+    """
+    Minimal in-process HTTP client that calls an ASGI app directly.
+
+    Requests never touch a socket, so the measured latency is that of the
+    application and its database, without network or server overhead.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan: Optional[asyncio.Task] = None
+        self._lifespan_queue: "asyncio.Queue[dict]" = asyncio.Queue()
+        self._lifespan_events: "asyncio.Queue[dict]" = asyncio.Queue()
+
+    async def startup(self) -> None:
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan = asyncio.create_task(
+            self.app(scope, self._lifespan_queue.get, self._lifespan_events.put)
+        )
+        await self._lifespan_queue.put({"type": "lifespan.startup"})
+        event = await self._lifespan_events.get()
+        if event["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"Application failed to start: {event}")
+
+    async def shutdown(self) -> None:
+        if self._lifespan is None:
+            return
+        await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+        await self._lifespan_events.get()
+        await self._lifespan
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json_body: Any = None,
+        headers: Tuple[Tuple[str, str], ...] = (),
+    ) -> Tuple[int, bytes]:
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        raw_headers = [(b"host", b"bench")]
+        if json_body is not None:
+            raw_headers.append((b"content-type", b"application/json"))
+        raw_headers.extend((k.lower().encode(), v.encode()) for k, v in headers)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(params or {}).encode(),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+            "state": {},
+        }
+        request_sent = False
+        status = 0
+        chunks = []
+
+        async def receive() -> dict:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await asyncio.Event().wait()
+
+        async def send(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, b"".join(chunks)
@@ -0,0 +1,304 @@
+"""
+HTTP benchmark of every API route, run in-process against a temporary SQLite file.
+
+Each scenario sends a fixed number of requests at the given concurrency and
+reports throughput and p50/p95/p99 latency. Results are written as JSON and
+compared with a stored baseline; a p95 latency or throughput regression
+beyond the tolerance makes the command exit with status 1. A run with
+errors is never saved as the baseline.
+
+Usage:
+    python -m benchmarks.endpoints [--requests 500] [--concurrency 16]
+        [--output benchmarks/results.json] [--baseline benchmarks/baseline.json]
+        [--tolerance 0.25] [--save-baseline] [--only list_skills ...]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import tempfile
+import itertools
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+SEED_ROWS = 500
+SEED_PERSONAL = {
+    "full_name": "Seed Person",
+    "email": "seed@example.com",
+    "phone": "+00 (00) 00000-0000",
+    "job_title": "Software Engineer",
+    "github_link": "https://github.com/seed",
+    "linkedin_link": "https://linkedin.com/in/seed",
+    "professional_summary": "Seeded by the benchmark suite.",
+}
+
+Call = Callable[[int], Awaitable[Tuple[int, bytes]]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    expected_status: int
+    call: Call
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """
+    Returns the nearest-rank percentile of already sorted samples.
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, round(percent / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def build_scenarios(client, run_id: str) -> List[Scenario]:
+    """
+    Builds one scenario per route. `i` is unique per request within a run,
+    so create requests never collide on unique columns.
+    """
+    api = "/api/v1"
+
+    def personal(i: int) -> dict:
+        return {
+            "full_name": f"Bench {run_id} {i}",
+            "email": f"bench{run_id}{i}@example.com",
+            "phone": f"+{run_id}{i}",
+            "job_title": "Engineer",
+            "github_link": f"https://github.com/b{run_id}{i}",
+            "linkedin_link": f"https://linkedin.com/in/b{run_id}{i}",
+            "professional_summary": "Benchmarks the resume API.",
+        }
+
+    return [
+        Scenario(
+            "list_skills",
+            200,
+            lambda i: client.request("GET", f"{api}/skills/", {"page": i % 5 + 1}),
+        ),
+        Scenario(
+            "list_languages",
+            200,
+            lambda i: client.request("GET", f"{api}/languages/", {"page": i % 5 + 1}),
+        ),
+        Scenario(
+            "list_skills_gzip",
+            200,
+            lambda i: client.request(
+                "GET",
+                f"{api}/skills/",
+                {"page": i % 5 + 1},
+                headers=(("Accept-Encoding", "gzip"),),
+            ),
+        ),
+        Scenario("get_resume", 200, lambda i: client.request("GET", f"{api}/resume/")),
+        Scenario(
+            "get_resume_gzip",
+            200,
+            lambda i: client.request(
+                "GET", f"{api}/resume/", headers=(("Accept-Encoding", "gzip"),)
+            ),
+        ),
+        Scenario(
+            "create_skill",
+            201,
+            lambda i: client.request(
+                "POST", f"{api}/skills/", json_body={"name": f"skill {run_id} {i}"}
+            ),
+        ),
+        Scenario(
+            "patch_skill",
+            200,
+            lambda i: client.request(
+                "PATCH",
+                f"{api}/skills/{i % SEED_ROWS + 1}",
+                json_body={"name": f"patched {run_id} {i}"},
+            ),
+        ),
+        Scenario(
+            "create_language",
+            201,
+            lambda i: client.request(
+                "POST",
+                f"{api}/languages/",
+                json_body={"name": f"language {run_id} {i}", "proficiency": "Basic"},
+            ),
+        ),
+        Scenario(
+            "delete_language",
+            204,
+            lambda i: client.request("DELETE", f"{api}/languages/{i + 1}"),
+        ),
+        Scenario(
+            "create_personal",
+            201,
+            lambda i: client.request("POST", f"{api}/personal/", json_body=personal(i)),
+        ),
+    ]
+
+
+async def run_scenario(scenario: Scenario, requests: int, concurrency: int) -> dict:
+    counter = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in iter(lambda: next(counter), None):
+            if i >= requests:
+                return
+            started = time.perf_counter()
+            status, body = await scenario.call(i)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status != scenario.expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+async def seed(client) -> None:
+    """
+    Creates the personal record and the rows that list, patch and delete use.
+    """
+    status, body = await client.request(
+        "POST", "/api/v1/personal/", json_body=SEED_PERSONAL
+    )
+    if status != 201:
+        raise RuntimeError(f"Seeding personal failed: {status} {body!r}")
+    for resource, item in (
+        ("skills", lambda i: {"name": f"seed skill {i}"}),
+        ("languages", lambda i: {"name": f"seed language {i}", "proficiency": "Basic"}),
+    ):
+        status, body = await client.request(
+            "POST",
+            f"/api/v1/{resource}/bulk",
+            json_body=[item(i) for i in range(SEED_ROWS)],
+        )
+        if status != 200:
+            raise RuntimeError(f"Seeding {resource} failed: {status} {body!r}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    Lists the scenarios that regressed against the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if result["p95_ms"] > reference["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']:.2f} ms > "
+                f"baseline {reference['p95_ms']:.2f} ms"
+            )
+        if result["throughput_rps"] < reference["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['throughput_rps']:.0f} req/s < "
+                f"baseline {reference['throughput_rps']:.0f} req/s"
+            )
+    return regressions
+
+
+async def benchmark(
+    requests: int, concurrency: int, only: Optional[List[str]]
+) -> Dict[str, dict]:
+    from app.main import app
+    from .asgi_client import AsgiClient
+
+    client = AsgiClient(app)
+    await client.startup()
+    try:
+        await seed(client)
+        run_id = str(int(time.time()))
+        results = {}
+        for scenario in build_scenarios(client, run_id):
+            if only and scenario.name not in only:
+                continue
+            results[scenario.name] = await run_scenario(scenario, requests, concurrency)
+            result = results[scenario.name]
+            print(
+                f"{scenario.name:<16} {result['throughput_rps']:>9.1f} "
+                f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                f"{result['p99_ms']:>9.2f} {result['errors']:>7}"
+            )
+        return results
+    finally:
+        await client.shutdown()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", type=Path, default=BENCHMARKS_DIR / "results.json")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--only", nargs="+")
+    args = parser.parse_args()
+
+    if args.requests > SEED_ROWS:
+        parser.error(f"--requests cannot exceed the {SEED_ROWS} seeded rows")
+
+    workdir = tempfile.TemporaryDirectory(prefix="resume-api-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir.name}/bench.db"
+
+    print(
+        f"{'scenario':<16} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+    )
+    results = asyncio.run(benchmark(args.requests, args.concurrency, args.only))
+    workdir.cleanup()
+
+    report = {
+        "meta": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": int(time.time()),
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+    failed = any(result["errors"] for result in results.values())
+    if args.save_baseline:
+        if failed:
+            print("Not saving a baseline from a run with errors")
+            return 1
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        failed = failed or bool(regressions)
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to store one")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Micro-benchmark of the list serialization paths.
+
+Compares the previous path of the list endpoints, which validated every ORM
+row into SkillOut, let FastAPI validate the list again against the response
+model and then JSON-encoded it, with the fast path that dumps plain row dicts
+straight to JSON bytes through a cached TypeAdapter.
+
+Usage:
+    python -m benchmarks.serialization [--sizes 100 1000 10000] [--repeat 5]
+"""
+
+import json
+import timeit
+import argparse
+from typing import List
+from datetime import datetime, timedelta
+from pydantic import TypeAdapter
+from app.api.v1 import models, schemas
+from app.api.v1.services.skill_service import skills_adapter
+
+response_adapter = TypeAdapter(List[schemas.SkillOut])
+
+
+def make_rows(size: int) -> List[dict]:
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "name": f"Skill {id}",
+            "id": id,
+            "created_at": start + timedelta(seconds=id),
+            "updated_at": start + timedelta(seconds=id),
+        }
+        for id in range(1, size + 1)
+    ]
+
+
+def previous_path(orm_rows: List[models.Skill]) -> bytes:
+    skills = [schemas.SkillOut.model_validate(row) for row in orm_rows]
+    validated = response_adapter.validate_python(skills)
+    content = response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def fast_path(rows: List[dict]) -> bytes:
+    return skills_adapter.dump_json(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'previous ms':>12} {'fast ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        orm_rows = [models.Skill(**row) for row in rows]
+        assert json.loads(previous_path(orm_rows)) == json.loads(fast_path(rows))
+        number = max(1, 10000 // size)
+        previous = min(
+            timeit.repeat(
+                lambda: previous_path(orm_rows), number=number, repeat=args.repeat
+            )
+        )
+        fast = min(
+            timeit.repeat(lambda: fast_path(rows), number=number, repeat=args.repeat)
+        )
+        previous_ms = previous / number * 1000
+        fast_ms = fast / number * 1000
+        print(
+            f"{size:>8} {previous_ms:>12.3f} {fast_ms:>10.3f} "
+            f"{previous_ms / fast_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
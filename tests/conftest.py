@@ -0,0 +1,75 @@
+"""
+Shared fixtures: the app runs in-process against a temporary SQLite file.
+
+The settings are read when the app is imported, so the environment is set
+before the first import of `app`.
+"""
+
+import os
+import tempfile
+import itertools
+
+_workdir = tempfile.TemporaryDirectory(prefix="resume-api-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_workdir.name}/test.db"
+os.environ["REPOSITORY_BACKEND"] = "sql"
+os.environ["DATABASE_TRACE_TRANSACTIONS"] = "1"
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+_unique = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def app():
+    """
+    The application, with its lifespan (migrations, warm-up) run once.
+    """
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        yield app
+
+
+@pytest.fixture
+async def client(app):
+    """
+    An async HTTP client calling the app in-process.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def unique() -> str:
+    """
+    A suffix that keeps names created by different tests apart.
+    """
+    return f"t{os.getpid()}x{next(_unique)}"
+
+
+@pytest.fixture
+async def profile(client, unique) -> int:
+    """
+    The ID of a new personal record, so a test can work on its own scope.
+    """
+    response = await client.post(
+        "/api/v1/personal/",
+        json={
+            "full_name": f"Test Person {unique}",
+            "email": f"{unique}@example.com",
+            "phone": f"+{unique}",
+            "job_title": "Engineer",
+            "github_link": f"https://github.com/{unique}",
+            "linkedin_link": f"https://linkedin.com/in/{unique}",
+            "professional_summary": "Created by the test suite.",
+        },
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
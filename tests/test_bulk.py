@@ -0,0 +1,40 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("resource", ["skills", "languages"])
+async def test_conflicts_are_reported_without_aborting_the_batch(
+    client, unique, resource
+):
+    def body(name):
+        if resource == "languages":
+            return {"name": name, "proficiency": "Basic"}
+        return {"name": name}
+
+    url = f"/api/v1/{resource}/"
+    response = await client.post(url, json=body(f"Existing {unique}"))
+    assert response.status_code == 201, response.text
+    response = await client.get(url, params={"items_per_page": 1})
+    total = int(response.headers["X-Total-Count"])
+
+    names = [f"EXISTING {unique}", f"New {unique}", f" new {unique}", f"Other {unique}"]
+    response = await client.post(f"{url}bulk", json=[body(name) for name in names])
+    assert response.status_code == 200, response.text
+    results = response.json()
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["status"] for result in results] == [
+        "conflict",
+        "created",
+        "conflict",
+        "created",
+    ]
+    singular = resource[:-1]
+    assert results[0]["detail"] == f"{singular.capitalize()} already exists."
+    assert results[1][singular]["name"] == f"New {unique}"
+    assert results[3][singular]["name"] == f"Other {unique}"
+
+    response = await client.get(url, params={"items_per_page": 1})
+    assert int(response.headers["X-Total-Count"]) == total + 2
+    response = await client.get(f"{url}by-name/new {unique}")
+    assert response.json()["id"] == results[1][singular]["id"]
@@ -0,0 +1,114 @@
+import json
+import asyncio
+import contextlib
+import pytest
+from app.api.v1 import crud, database
+
+pytestmark = pytest.mark.anyio
+
+
+class EventStream:
+    """
+    Calls the change stream endpoint directly through ASGI, since the httpx
+    test transport only returns once the response has ended.
+    """
+
+    def __init__(self, app, last_event_id: int):
+        self.app = app
+        self.last_event_id = last_event_id
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.buffer = b""
+
+    async def __aenter__(self):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/changes/stream",
+            "raw_path": b"/api/v1/changes/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"test"),
+                (b"last-event-id", str(self.last_event_id).encode()),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("test", 80),
+        }
+        self.task = asyncio.create_task(self.app(scope, self.receive, self.send))
+        start = await asyncio.wait_for(self.messages.get(), 5)
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in start[
+            "headers"
+        ]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.disconnected.set()
+        self.task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.task
+
+    async def receive(self):
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        await self.messages.put(message)
+
+    async def next_event(self) -> dict:
+        """
+        Returns the next event with an id, skipping retry and comment lines.
+        """
+        while True:
+            if b"\n\n" in self.buffer:
+                block, self.buffer = self.buffer.split(b"\n\n", 1)
+                fields = dict(
+                    line.split(": ", 1) for line in block.decode().splitlines()
+                )
+                if "id" in fields:
+                    return fields
+                continue
+            message = await asyncio.wait_for(self.messages.get(), 5)
+            self.buffer += message.get("body", b"")
+
+
+async def test_last_event_id_replays_missed_changes_then_follows(app, client, profile):
+    async with database.ReadSession() as db:
+        last_id = await crud.ChangeLogCrud.get_last_id(db=db)
+
+    url = f"/api/v1/personal/{profile}/skills/"
+    created = []
+    for name in ("Erlang", "Elixir"):
+        response = await client.post(url, json={"name": name})
+        assert response.status_code == 201, response.text
+        created.append(response.json()["id"])
+    response = await client.patch(f"{url}{created[0]}", json={"name": "Erlang/OTP"})
+    assert response.status_code == 200, response.text
+
+    async with EventStream(app, last_event_id=last_id) as stream:
+        events = [await stream.next_event() for _ in range(3)]
+        assert [int(event["id"]) for event in events] == [
+            last_id + 1,
+            last_id + 2,
+            last_id + 3,
+        ]
+        assert {event["event"] for event in events} == {"change"}
+        changes = [json.loads(event["data"]) for event in events]
+        assert [(c["operation"], c["row_id"]) for c in changes] == [
+            ("insert", created[0]),
+            ("insert", created[1]),
+            ("update", created[0]),
+        ]
+        assert {(c["table"], c["personal_id"]) for c in changes} == {
+            ("skills", profile)
+        }
+
+        response = await client.post(url, json={"name": "Gleam"})
+        assert response.status_code == 201, response.text
+        event = await stream.next_event()
+        assert int(event["id"]) == last_id + 4
+        assert json.loads(event["data"])["row_id"] == response.json()["id"]
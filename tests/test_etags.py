@@ -0,0 +1,58 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+async def test_if_none_match_is_answered_until_the_list_changes(
+    client, profile, unique
+):
+    url = f"/api/v1/personal/{profile}/skills/"
+    response = await client.post(url, json={"name": "Rust"})
+    assert response.status_code == 201, response.text
+
+    response = await client.get(url, headers=IDENTITY)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = await client.get(url, headers={**IDENTITY, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = await client.post("/api/v1/skills/", json={"name": f"Zig {unique}"})
+    assert response.status_code == 201, response.text
+    response = await client.get(url, headers={**IDENTITY, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = await client.post(url, json={"name": "Nim"})
+    assert response.status_code == 201, response.text
+    response = await client.get(url, headers={**IDENTITY, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [skill["name"] for skill in response.json()] == ["Rust", "Nim"]
+
+
+async def test_each_encoding_is_validated_by_its_own_tag(client, profile):
+    url = f"/api/v1/personal/{profile}/skills/"
+    for number in range(20):
+        response = await client.post(url, json={"name": f"Skill number {number}"})
+        assert response.status_code == 201, response.text
+
+    response = await client.get(url, headers=IDENTITY)
+    etag = response.headers["ETag"]
+    response = await client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    gzip_etag = response.headers["ETag"]
+    assert gzip_etag != etag
+
+    response = await client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_etag}
+    )
+    assert response.status_code == 304
+    response = await client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == gzip_etag
@@ -0,0 +1,59 @@
+import re
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+SKILLS = "/api/v1/skills/"
+
+
+async def _requests_total(client, route: str, status: int) -> float:
+    metrics = (await client.get("/metrics")).text
+    match = re.search(
+        rf'^http_requests_total{{method="POST",route="{re.escape(route)}",'
+        rf'status="{status}"}} (\S+)$',
+        metrics,
+        re.MULTILINE,
+    )
+    return float(match.group(1)) if match else 0.0
+
+
+async def test_retry_replays_the_first_response(client, unique):
+    headers = {"Idempotency-Key": f"replay {unique}"}
+    body = {"name": f"Replayed {unique}"}
+    first = await client.post(SKILLS, json=body, headers=headers)
+    assert first.status_code == 201
+    before = await _requests_total(client, SKILLS, 201)
+
+    retry = await client.post(SKILLS, json=body, headers=headers)
+    assert retry.status_code == 201
+    assert retry.content == first.content
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert await _requests_total(client, SKILLS, 201) == before + 1
+
+
+async def test_concurrent_duplicates_create_one_row(client, unique):
+    headers = {"Idempotency-Key": f"concurrent {unique}"}
+    body = {"name": f"Concurrent {unique}"}
+    responses = await asyncio.gather(
+        *(client.post(SKILLS, json=body, headers=headers) for _ in range(5))
+    )
+    assert [r.status_code for r in responses] == [201] * 5
+    assert len({r.content for r in responses}) == 1
+    assert sum("Idempotent-Replayed" in r.headers for r in responses) == 4
+
+
+async def test_key_reused_with_another_body_is_rejected(client, unique):
+    headers = {"Idempotency-Key": f"mismatch {unique}"}
+    first = await client.post(SKILLS, json={"name": f"First {unique}"}, headers=headers)
+    assert first.status_code == 201
+    before = await _requests_total(client, SKILLS, 422)
+
+    reused = await client.post(
+        SKILLS, json={"name": f"Second {unique}"}, headers=headers
+    )
+    assert reused.status_code == 422
+    assert await _requests_total(client, SKILLS, 422) == before + 1
+    search = await client.get("/api/v1/skills/search", params={"q": f"Second {unique}"})
+    assert search.status_code == 200
+    assert [s["name"] for s in search.json()] == []
@@ -0,0 +1,44 @@
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+# The backend is chosen when the app is imported, so memory mode runs in
+# its own interpreter.
+SCRIPT = """
+import json, asyncio, httpx
+from app.main import app
+
+async def main():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            read = await c.get("/api/v1/resume/markdown")
+            write = await c.post("/api/v1/skills/", json={"name": "Rejected"})
+            print(json.dumps({
+                "read": read.status_code,
+                "write": write.status_code,
+                "allow": write.headers.get("allow"),
+            }))
+
+asyncio.run(main())
+"""
+
+
+def test_memory_backend_is_a_read_only_snapshot(tmp_path: Path):
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path}/memory.db",
+        "REPOSITORY_BACKEND": "memory",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        env=env,
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    statuses = json.loads(result.stdout.strip().splitlines()[-1])
+    assert statuses == {"read": 200, "write": 405, "allow": "GET, HEAD, OPTIONS"}
@@ -0,0 +1,75 @@
+import sqlalchemy
+
+from app.api.v1.database import base, migrations
+
+# The schema created by the first release, before any migration existed.
+BASELINE_SCHEMA = (
+    """
+    CREATE TABLE skills (
+        id INTEGER NOT NULL PRIMARY KEY,
+        name VARCHAR(50) NOT NULL UNIQUE,
+        created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+        updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP)
+    )
+    """,
+    """
+    CREATE TABLE languages (
+        id INTEGER NOT NULL PRIMARY KEY,
+        name VARCHAR(50) NOT NULL UNIQUE,
+        proficiency VARCHAR(50) NOT NULL,
+        created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+        updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP)
+    )
+    """,
+    """
+    CREATE TABLE personal (
+        id INTEGER NOT NULL PRIMARY KEY,
+        full_name VARCHAR(50) NOT NULL UNIQUE,
+        email VARCHAR(50) NOT NULL UNIQUE,
+        phone VARCHAR(50) NOT NULL UNIQUE,
+        job_title VARCHAR(50) NOT NULL,
+        github_link VARCHAR(50) NOT NULL UNIQUE,
+        linkedin_link VARCHAR(50) NOT NULL UNIQUE,
+        professional_summary VARCHAR(500) NOT NULL,
+        created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+        updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP)
+    )
+    """,
+)
+
+
+def test_baseline_database_is_deduplicated_and_versioned(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path}/baseline.db")
+    with engine.begin() as conn:
+        for statement in BASELINE_SCHEMA:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql(
+            "INSERT INTO skills (id, name) VALUES "
+            "(1, 'Python'), (2, 'SQL'), (3, 'python '), (4, ' PYTHON')"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO languages (id, name, proficiency) VALUES "
+            "(1, 'English', 'Native'), (2, 'english', 'Fluent')"
+        )
+
+    with engine.begin() as conn:
+        applied = migrations.apply_migrations(conn, base.metadata)
+    assert len(applied) == migrations.LATEST_VERSION
+
+    with engine.connect() as conn:
+        skills = conn.exec_driver_sql(
+            "SELECT id, name, name_key FROM skills ORDER BY id"
+        ).all()
+        languages = conn.exec_driver_sql(
+            "SELECT id, name, proficiency, name_key FROM languages ORDER BY id"
+        ).all()
+        versions = conn.exec_driver_sql(
+            "SELECT version FROM schema_version ORDER BY version"
+        ).scalars()
+        assert skills == [(1, "Python", "python"), (2, "SQL", "sql")]
+        assert languages == [(1, "English", "Native", "english")]
+        assert list(versions) == list(range(1, migrations.LATEST_VERSION + 1))
+
+    with engine.begin() as conn:
+        assert migrations.apply_migrations(conn, base.metadata) == []
+    engine.dispose()
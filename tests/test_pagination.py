@@ -0,0 +1,37 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_cursor_walks_every_page_once(client, profile):
+    url = f"/api/v1/personal/{profile}/skills/"
+    created = []
+    for name in ("Ada", "Bash", "C", "Dart", "Elm"):
+        response = await client.post(url, json={"name": name})
+        assert response.status_code == 201, response.text
+        created.append(response.json()["id"])
+
+    pages, cursor = [], None
+    while True:
+        params = {"items_per_page": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        assert response.headers["X-Total-Count"] == "5"
+        pages.append([skill["id"] for skill in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert pages == [created[0:2], created[2:4], created[4:]]
+    response = await client.get(url, params={"items_per_page": 2, "page": 2})
+    assert [skill["id"] for skill in response.json()] == pages[1]
+
+
+async def test_malformed_cursor_is_rejected(client, profile):
+    response = await client.get(
+        f"/api/v1/personal/{profile}/skills/", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor."
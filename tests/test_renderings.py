@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import delete
+from app.api.v1 import database, models, services
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_rendering_is_built_on_write_and_read_without_writing(
+    client, profile, unique
+):
+    url = f"/api/v1/personal/{profile}/resume/markdown"
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert f"Test Person {unique}" in response.text
+    assert response.headers["X-DB-Write-Commits"] == "0"
+
+    created = await client.post(
+        f"/api/v1/personal/{profile}/skills/", json={"name": f"Rendered {unique}"}
+    )
+    assert created.status_code == 201
+    response = await client.get(url)
+    assert f"Rendered {unique}" in response.text
+    assert response.headers["X-DB-Write-Commits"] == "0"
+
+
+async def test_missing_renderings_are_built_at_startup(client, profile, unique):
+    async with database.Session() as db:
+        await db.execute(
+            delete(models.Rendering).where(models.Rendering.scope == profile)
+        )
+        await db.commit()
+    url = f"/api/v1/personal/{profile}/resume/html"
+    assert (await client.get(url)).status_code == 404
+
+    assert await services.WarmupService.build_renderings() == 1
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert f"Test Person {unique}" in response.text
@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy import text
+from app.api.v1 import database
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_versions_are_kept_by_row_counts_only(app):
+    async with database.ReadSession() as db:
+        result = await db.execute(
+            text(
+                "SELECT name FROM sqlite_master WHERE name = 'table_versions' "
+                "OR (type = 'trigger' AND name LIKE '%\\_version' ESCAPE '\\')"
+            )
+        )
+        assert result.scalars().all() == []
+
+
+async def test_legacy_resume_etag_follows_unscoped_writes_only(client, profile, unique):
+    url = "/api/v1/resume/"
+    etag = (await client.get(url)).headers["ETag"]
+
+    await client.post(
+        f"/api/v1/personal/{profile}/skills/", json={"name": f"Scoped {unique}"}
+    )
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.post("/api/v1/skills/", json={"name": f"Unscoped {unique}"})
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert f"Unscoped {unique}" in response.text
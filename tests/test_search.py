@@ -0,0 +1,29 @@
+import pytest
+from app.api.v1 import crud, database, utils
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("repository", [crud.SkillCrud, crud.LanguageCrud])
+async def test_short_query_padded_with_spaces_uses_the_name_keys(
+    client, profile, repository
+):
+    resource = "skills" if repository is crud.SkillCrud else "languages"
+    for name in ("Go", "Gosu", "Pygo"):
+        body = {"name": name}
+        if resource == "languages":
+            body["proficiency"] = "Basic"
+        response = await client.post(
+            f"/api/v1/personal/{profile}/{resource}/", json=body
+        )
+        assert response.status_code == 201, response.text
+
+    async with database.ReadSession() as db:
+        for mode, expected in (
+            (utils.SearchMode.PREFIX, ["Go", "Gosu"]),
+            (utils.SearchMode.SUBSTRING, ["Go", "Gosu", "Pygo"]),
+        ):
+            rows = await repository.search(
+                db=db, q="  gO ", mode=mode, personal_id=profile
+            )
+            assert [row["name"] for row in rows] == expected
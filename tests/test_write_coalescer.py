@@ -0,0 +1,39 @@
+import asyncio
+import pytest
+from app.api.v1 import database
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_writes_each_report_the_shared_transaction(client, unique):
+    batches = database.write_coalescer.batches
+    responses = await asyncio.gather(
+        *(
+            client.post("/api/v1/skills/", json={"name": f"coalesced {unique} {i}"})
+            for i in range(5)
+        )
+    )
+    assert [r.status_code for r in responses] == [201] * 5
+    assert database.write_coalescer.batches - batches < 5
+    for response in responses:
+        assert int(response.headers["X-DB-Transactions"]) >= 1
+        assert int(response.headers["X-DB-Write-Commits"]) >= 1
+
+
+async def test_conflict_rolls_back_only_its_own_write(client, unique):
+    batches = database.write_coalescer.batches
+    names = [f"Duplicate {unique}"] * 4 + [f"Distinct {unique} {i}" for i in range(4)]
+    responses = await asyncio.gather(
+        *(client.post("/api/v1/skills/", json={"name": name}) for name in names)
+    )
+    statuses = [r.status_code for r in responses]
+    assert database.write_coalescer.batches - batches < len(names)
+    assert sorted(statuses[:4]) == [201, 409, 409, 409]
+    assert statuses[4:] == [201] * 4
+
+    for name in names[4:]:
+        response = await client.get(f"/api/v1/skills/by-name/{name}")
+        assert response.status_code == 200
+    created = next(r for r in responses[:4] if r.status_code == 201).json()
+    response = await client.get(f"/api/v1/skills/by-name/{names[0]}")
+    assert response.json()["id"] == created["id"]